@@ -11,14 +11,14 @@ All four fund-related routes from the API specification:
 from typing import List
 from uuid import UUID
 
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Response
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.db.session import get_db
 from app.models.fund import Fund
 from app.repositories.fund_repo import FundRepository
 from app.schemas.common import ErrorResponse, ValidationErrorResponse
-from app.schemas.fund import FundCreate, FundResponse, FundUpdate
+from app.schemas.fund import FUND_LIST_ADAPTER, FundCreate, FundResponse, FundUpdate
 from app.services.fund_service import FundService
 
 router = APIRouter()
@@ -51,8 +51,13 @@ async def list_funds(
     skip: int = Query(0, ge=0, description="Number of records to skip"),
     limit: int = Query(100, ge=1, le=1000, description="Max records to return"),
     service: FundService = Depends(_get_fund_service),
-) -> List[FundResponse]:
-    return await service.get_all_funds(skip=skip, limit=limit)
+) -> Response:
+    # ``response_model`` above still drives the OpenAPI schema; the body is
+    # serialized straight to JSON bytes by the precompiled adapter, which
+    # bypasses FastAPI's per-request response-field validation pass.
+    funds = await service.get_all_funds(skip=skip, limit=limit)
+    payload = FUND_LIST_ADAPTER.validate_python(funds, from_attributes=True)
+    return Response(content=FUND_LIST_ADAPTER.dump_json(payload), media_type="application/json")
 
 
 @router.post(
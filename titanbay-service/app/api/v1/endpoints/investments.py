@@ -4,6 +4,7 @@ Investment API endpoints.
 Investments are scoped under funds:
 - GET   /funds/{fund_id}/investments  — List investments for a fund
 - POST  /funds/{fund_id}/investments  — Create a new investment in a fund
+- POST  /funds/{fund_id}/investments/bulk — Create many investments in a fund
 """
 
 from typing import List
@@ -20,7 +21,7 @@ from app.repositories.fund_repo import FundRepository
 from app.repositories.investment_repo import InvestmentRepository
 from app.repositories.investor_repo import InvestorRepository
 from app.schemas.common import ErrorResponse, ValidationErrorResponse
-from app.schemas.investment import InvestmentCreate, InvestmentResponse
+from app.schemas.investment import InvestmentBulkCreate, InvestmentCreate, InvestmentResponse
 from app.services.investment_service import InvestmentService
 
 router = APIRouter()
@@ -93,3 +94,30 @@ async def create_investment(
     service: InvestmentService = Depends(_get_investment_service),
 ) -> InvestmentResponse:
     return await service.create_investment(fund_id, investment)
+
+
+@router.post(
+    "/funds/{fund_id}/investments/bulk",
+    response_model=List[InvestmentResponse],
+    status_code=201,
+    summary="Create many investments",
+    description=(
+        "Records up to 1000 capital commitments into a fund in one request. "
+        "The fund is validated once, all investors are checked with a single "
+        "query, and the rows are inserted in one statement.  All-or-nothing: "
+        "if any investment is invalid, none are recorded."
+    ),
+    responses={
+        404: {"model": ErrorResponse, "description": "Fund or an investor not found"},
+        422: {
+            "model": ValidationErrorResponse,
+            "description": "Validation error or business rule violation",
+        },
+    },
+)
+async def create_investments_bulk(
+    fund_id: UUID,
+    payload: InvestmentBulkCreate,
+    service: InvestmentService = Depends(_get_investment_service),
+) -> List[InvestmentResponse]:
+    return await service.create_investments_bulk(fund_id, payload.investments)
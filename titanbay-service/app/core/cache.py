@@ -12,9 +12,18 @@ Design decisions:
 - **Write-through invalidation** — Cache is invalidated on any write operation
   (POST, PUT, DELETE) so stale data is never served.
 - **TTL-based expiry** — Entries expire after a configurable number of seconds,
-  bounding the staleness window even if invalidation is missed.
+  bounding the staleness window even if invalidation is missed.  Each entry
+  stores its absolute deadline, so a lookup's expiry check is one compare.
 - **Max-size eviction** — When the cache exceeds ``max_size`` entries, the
-  oldest entry is evicted (FIFO) to prevent unbounded memory growth.
+  oldest entry is evicted (FIFO) to prevent unbounded memory growth.  The
+  store is an ``OrderedDict`` so locating the oldest entry stays O(1) even
+  under heavy eviction churn.
+- **Namespace index** — Keys are grouped by their namespace (everything up
+  to and including the first ``:``, e.g. ``funds:``).  Invalidating a whole
+  namespace deletes exactly the live keys in that group, and a narrower
+  prefix (``investors:list:``) scans only that group, instead of
+  scanning every key in the cache.  Service writes use
+  ``invalidate_namespace``, which detaches the whole group in one step.
 
 Thread safety: Python's GIL + the single-threaded async event loop make
 dict operations atomic here. No additional locking is needed.
@@ -22,25 +31,45 @@ dict operations atomic here. No additional locking is needed.
 
 import logging
 import time
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Set, Tuple
 
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
 
+def _namespace_of(key: str) -> str:
+    """Return the namespace of *key*: its prefix up to and including the first ``:``."""
+    return key[: key.find(":") + 1]
+
+
+# Sentinel stored for "looked up, does not exist" (negative caching).  Callers
+# compare with ``is`` and translate it back into their own not-found error.
+NOT_FOUND: Any = object()
+
+# Every hit-rate string ``get_stats`` can report ("0.0%" … "100.0%"), indexed
+# by tenths of a percent, so a stats snapshot does no float formatting.
+_HIT_RATE_LABELS = tuple(f"{tenths / 10:.1f}%" for tenths in range(1001))
+
+
 class CacheEntry:
-    """A single cached value with creation timestamp."""
+    """A single cached value with its creation time and absolute expiry deadline."""
+
+    __slots__ = ("value", "created_at", "expires_at")
 
-    __slots__ = ("value", "created_at")
+    def __init__(self, value: Any, ttl: float) -> None:
+        self.renew(value, ttl)
 
-    def __init__(self, value: Any):
+    def renew(self, value: Any, ttl: float) -> None:
+        """Replace the value and restart the entry's lifetime in place."""
         self.value = value
         self.created_at = time.monotonic()
+        self.expires_at = self.created_at + ttl
 
-    def is_expired(self, ttl: float) -> bool:
-        """Return True if this entry is older than ``ttl`` seconds."""
-        return (time.monotonic() - self.created_at) > ttl
+    def is_expired(self, now: float) -> bool:
+        """Return True if the deadline has passed at monotonic time *now*."""
+        return now > self.expires_at
 
 
 class TTLCache:
@@ -54,21 +83,34 @@ class TTLCache:
     max_size : int
         Maximum number of entries. When exceeded, the oldest entry is evicted.
     enabled : bool
-        When False, all operations are no-ops (useful for testing).
+        When False, all operations are no-ops (useful for testing).  The
+        constructor then returns a :class:`_DisabledTTLCache`, whose methods
+        are bare no-ops, so neither mode re-checks the flag on each call.
     """
 
+    __slots__ = ("_store", "_namespaces", "_ttl", "_max_size", "_enabled", "_hits", "_misses")
+
+    def __new__(cls, ttl: float = 30.0, max_size: int = 1000, enabled: bool = True) -> "TTLCache":
+        if not enabled and cls is TTLCache:
+            cls = _DisabledTTLCache
+        return super().__new__(cls)
+
     def __init__(
         self,
         ttl: float = 30.0,
         max_size: int = 1000,
         enabled: bool = True,
-    ):
-        self._store: Dict[str, CacheEntry] = {}
-        self._ttl = ttl
-        self._max_size = max_size
-        self._enabled = enabled
-        self._hits = 0
-        self._misses = 0
+    ) -> None:
+        # OrderedDict rather than dict: finding the oldest key follows its
+        # linked list in O(1), whereas ``next(iter(dict))`` must skip the
+        # deleted slots that earlier evictions leave at a plain dict's front.
+        self._store: "OrderedDict[str, CacheEntry]" = OrderedDict()
+        self._namespaces: Dict[str, Set[str]] = {}
+        self._ttl: float = ttl
+        self._max_size: int = max_size
+        self._enabled: bool = enabled
+        self._hits: int = 0
+        self._misses: int = 0
 
     def get(self, key: str) -> Optional[Any]:
         """
@@ -76,42 +118,83 @@ class TTLCache:
 
         Returns ``None`` on miss or expired entry.
         """
-        if not self._enabled:
+        # Same logic as ``_live_entry``, inlined: this is the hottest path,
+        # and the extra method call would cost more than the lookup saved.
+        entry = self._store.get(key)
+        if entry is None:
+            self._misses += 1
             return None
 
+        if entry.is_expired(time.monotonic()):
+            self._discard(key)
+            self._misses += 1
+            logger.debug("Cache EXPIRED: %s", key)
+            return None
+
+        self._hits += 1
+        logger.debug("Cache HIT: %s", key)
+        return entry.value
+
+    def get_with_age(self, key: str) -> Optional[Tuple[Any, float]]:
+        """
+        Retrieve ``(value, age_seconds)`` for *key*, or ``None`` on miss.
+
+        Like :meth:`get`, but also reports how long ago the entry was
+        stored so callers can treat it as *stale* before it expires
+        (stale-while-revalidate).
+        """
+        now = time.monotonic()
+        entry = self._live_entry(key, now)
+        return None if entry is None else (entry.value, now - entry.created_at)
+
+    def _live_entry(self, key: str, now: float) -> Optional[CacheEntry]:
+        """
+        Return the unexpired entry for *key* (one dict lookup), counting the hit or miss.
+
+        An expired entry is discarded and counts as a miss.
+        """
         entry = self._store.get(key)
         if entry is None:
             self._misses += 1
             return None
 
-        if entry.is_expired(self._ttl):
-            del self._store[key]
+        if entry.is_expired(now):
+            self._discard(key)
             self._misses += 1
             logger.debug("Cache EXPIRED: %s", key)
             return None
 
         self._hits += 1
         logger.debug("Cache HIT: %s", key)
-        return entry.value
+        return entry
 
-    def set(self, key: str, value: Any) -> None:
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
         """
         Store a value in the cache.
 
-        If the cache is full, the oldest entry is evicted first.
+        If the cache is full, the oldest entry is evicted first.  ``ttl``
+        overrides the cache-wide TTL for this entry only (e.g. a shorter
+        lifetime for :data:`NOT_FOUND` markers).
         """
-        if not self._enabled:
+        ttl = self._ttl if ttl is None else ttl
+
+        # Overwrite: renew the existing entry in place — no allocation, and
+        # the key keeps its FIFO position and namespace-index membership.
+        entry = self._store.get(key)
+        if entry is not None:
+            entry.renew(value, ttl)
+            logger.debug("Cache SET: %s", key)
             return
 
-        # Evict oldest if at capacity.
-        # Uses Python 3.7+ dict insertion ordering for FIFO semantics:
-        # next(iter(d)) returns the first-inserted key, which is the oldest.
-        if len(self._store) >= self._max_size and key not in self._store:
+        # Evict oldest if at capacity.  The front of the OrderedDict is
+        # always the first-inserted entry.
+        if len(self._store) >= self._max_size:
             oldest_key = next(iter(self._store))
-            del self._store[oldest_key]
+            self._discard(oldest_key)
             logger.debug("Cache EVICTED (max_size): %s", oldest_key)
 
-        self._store[key] = CacheEntry(value)
+        self._store[key] = CacheEntry(value, ttl)
+        self._namespaces.setdefault(_namespace_of(key), set()).add(key)
         logger.debug("Cache SET: %s", key)
 
     def invalidate(self, *prefixes: str) -> int:
@@ -125,14 +208,22 @@ class TTLCache:
         ``cache.invalidate("funds")``, ensuring subsequent reads fetch
         fresh data from the database.
         """
-        if not self._enabled:
-            return 0
-
-        # O(n×m) scan — acceptable because max_size is small (default 1000)
-        # and invalidation only happens on writes, not reads.
-        keys_to_remove = [k for k in self._store if any(k.startswith(p) for p in prefixes)]
+        keys_to_remove: Set[str] = set()
+        for prefix in prefixes:
+            if prefix and _namespace_of(prefix) == prefix:
+                # Whole-namespace invalidation (the service write path):
+                # drop the indexed keys directly — O(keys in namespace).
+                keys_to_remove.update(self._namespaces.get(prefix, ()))
+            elif ":" in prefix:
+                # Narrower prefix (e.g. ``investors:list:``): only keys in its
+                # namespace can match, so scan that bucket, not the whole store.
+                bucket = self._namespaces.get(_namespace_of(prefix), ())
+                keys_to_remove.update(k for k in bucket if k.startswith(prefix))
+            else:
+                # Prefix without a namespace: fall back to an O(n) scan.
+                keys_to_remove.update(k for k in self._store if k.startswith(prefix))
         for k in keys_to_remove:
-            del self._store[k]
+            self._discard(k)
 
         if keys_to_remove:
             logger.debug(
@@ -142,27 +233,102 @@ class TTLCache:
             )
         return len(keys_to_remove)
 
+    def invalidate_namespace(self, namespace: str) -> int:
+        """
+        Remove every entry in *namespace* (e.g. ``"funds:"``); return the count.
+
+        The specialised form of ``invalidate(namespace)`` used on the service
+        write path: the namespace's bucket is detached from the index in one
+        step and its keys deleted from the store, with no prefix matching and
+        no per-key index maintenance.
+        """
+        bucket = self._namespaces.pop(namespace, None)
+        if not bucket:
+            return 0
+        store = self._store
+        for key in bucket:
+            del store[key]
+        logger.debug("Cache INVALIDATED %d entries in namespace %s", len(bucket), namespace)
+        return len(bucket)
+
     def clear(self) -> None:
         """Remove all entries from the cache."""
         count = len(self._store)
         self._store.clear()
+        self._namespaces.clear()
         if count:
             logger.debug("Cache CLEARED (%d entries)", count)
 
-    def get_stats(self) -> dict:
-        """Return cache statistics for monitoring / health-check endpoints."""
-        total = self._hits + self._misses
+    def reset(self) -> None:
+        """
+        Return to the freshly constructed state in O(1).
+
+        Entries are dropped by swapping in fresh containers and the hit/miss
+        counters are zeroed.  Unlike :meth:`clear`, nothing is iterated or
+        logged; the old dicts are released by refcounting.  Intended for
+        test isolation.
+        """
+        self._store = OrderedDict()
+        self._namespaces = {}
+        self._hits = 0
+        self._misses = 0
+
+    def _discard(self, key: str) -> None:
+        """Remove *key* from the store and its namespace index (no-op if absent)."""
+        if self._store.pop(key, None) is None:
+            return
+        namespace = _namespace_of(key)
+        bucket = self._namespaces.get(namespace)
+        if bucket is not None:
+            bucket.discard(key)
+            if not bucket:
+                del self._namespaces[namespace]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Return cache statistics for monitoring / health-check endpoints.
+
+        The counters are plain ints bumped with ``+=`` (no lock: the event
+        loop is single-threaded); they are snapshotted once here so every
+        field of the report describes the same moment.
+        """
+        hits, misses = self._hits, self._misses
+        total = hits + misses
         return {
             "enabled": self._enabled,
             "size": len(self._store),
             "max_size": self._max_size,
             "ttl_seconds": self._ttl,
-            "hits": self._hits,
-            "misses": self._misses,
-            "hit_rate": f"{(self._hits / total * 100):.1f}%" if total > 0 else "N/A",
+            "hits": hits,
+            "misses": misses,
+            # Tenths of a percent, rounded half-up in integer arithmetic
+            "hit_rate": (
+                _HIT_RATE_LABELS[(hits * 2000 + total) // (2 * total)] if total > 0 else "N/A"
+            ),
         }
 
 
+class _DisabledTTLCache(TTLCache):
+    """A :class:`TTLCache` with caching switched off: reads miss, writes are dropped."""
+
+    __slots__ = ()
+
+    def get(self, key: str) -> Optional[Any]:
+        return None
+
+    def get_with_age(self, key: str) -> Optional[Tuple[Any, float]]:
+        return None
+
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        return None
+
+    def invalidate(self, *prefixes: str) -> int:
+        return 0
+
+    def invalidate_namespace(self, namespace: str) -> int:
+        return 0
+
+
 # ── Global cache instance ──
 cache = TTLCache(
     ttl=settings.CACHE_TTL,
@@ -5,6 +5,8 @@ Loads settings from environment variables (or .env file) using pydantic-settings
 All sensitive values (DB credentials) come from environment — never hardcoded.
 """
 
+from functools import lru_cache
+
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -83,9 +85,12 @@ class Settings(BaseSettings):
     # ── Connection pool tuning ──
     # These govern the SQLAlchemy async engine pool.  Values below are
     # reasonable defaults for a containerized deployment behind a load balancer.
-    DB_POOL_SIZE: int = 10
-    DB_MAX_OVERFLOW: int = 20
-    DB_POOL_TIMEOUT: int = 30  # seconds to wait for a connection from the pool
+    # Each in-flight request holds one connection for its whole session, so
+    # the pool is sized for request concurrency, and a short checkout timeout
+    # fails fast under saturation instead of queueing requests for 30s.
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 40
+    DB_POOL_TIMEOUT: int = 5  # seconds to wait for a connection from the pool
     DB_POOL_RECYCLE: int = 1800  # seconds before a connection is recycled (avoids stale conns)
 
     # ── CORS ──
@@ -105,6 +110,8 @@ class Settings(BaseSettings):
     CACHE_ENABLED: bool = True  # Set to false in load tests or when debugging stale data
     CACHE_TTL: float = 30.0  # Seconds before cache entries expire
     CACHE_MAX_SIZE: int = 1000  # Maximum number of cached entries
+    CACHE_NEGATIVE_TTL: float = 10.0  # Seconds a "not found" lookup result is remembered
+    CACHE_STALE_TTL: float = 30.0  # Extra seconds stale lists are served while one request reloads
 
     # ── Misc ──
     DEBUG: bool = False
@@ -126,4 +133,16 @@ class Settings(BaseSettings):
     model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 
-settings = Settings()
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """
+    Return the process-wide :class:`Settings`, validated on first call only.
+
+    Usable as a FastAPI dependency (and overridable via
+    ``app.dependency_overrides``); ``settings`` below is the same instance
+    for module-level callers.
+    """
+    return Settings()
+
+
+settings = get_settings()
@@ -20,6 +20,7 @@ from typing import Any
 from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from fastapi.responses import JSONResponse
+from pydantic_core import to_json
 from starlette.exceptions import HTTPException as StarletteHTTPException
 
 from app.core.resilience import CircuitBreakerError
@@ -71,79 +72,104 @@ class BusinessRuleViolation(AppException):
 # ────────────────────────────────────────────────────────────────────────────
 
 
-def add_exception_handlers(app: FastAPI) -> None:
-    """Register global exception handlers on the FastAPI application instance."""
+class ErrorJSONResponse(JSONResponse):
+    """
+    ``JSONResponse`` rendered by pydantic-core's Rust serializer.
+
+    Error bodies are plain dicts, so they bypass the response-model path
+    that FastAPI already serialises natively; ``to_json`` produces the same
+    compact UTF-8 bytes as ``JSONResponse`` several times faster than
+    ``json.dumps``, without an extra dependency.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
+
+
+async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
+    """Handle domain-specific exceptions raised by the service layer."""
+    return ErrorJSONResponse(
+        status_code=exc.status_code,
+        content={"error": True, "message": exc.message},
+    )
+
+
+async def circuit_breaker_handler(request: Request, exc: CircuitBreakerError) -> JSONResponse:
+    """
+    Handle circuit breaker open state → 503 Service Unavailable.
+
+    Includes a Retry-After header so well-behaved clients know when to
+    retry, preventing thundering-herd effects during recovery.
+    """
+    logger.warning(
+        "Circuit breaker '%s' rejected %s %s — retry after %.1fs",
+        exc.name,
+        request.method,
+        request.url.path,
+        exc.retry_after,
+    )
+    return ErrorJSONResponse(
+        status_code=503,
+        content={
+            "error": True,
+            "message": f"Service temporarily unavailable — {exc.name} circuit is open",
+            "retry_after_seconds": round(exc.retry_after, 1),
+        },
+        headers={"Retry-After": str(int(exc.retry_after) + 1)},
+    )
+
+
+async def http_exception_handler(request: Request, exc: StarletteHTTPException) -> JSONResponse:
+    """Handle standard HTTP exceptions (e.g. 404 from path-not-found)."""
+    return ErrorJSONResponse(
+        status_code=exc.status_code,
+        content={"error": True, "message": exc.detail},
+    )
+
+
+async def validation_exception_handler(
+    request: Request, exc: RequestValidationError
+) -> JSONResponse:
+    """
+    Handle Pydantic / FastAPI request-validation errors.
+
+    Returns a 422 with a concise list of validation issues so the caller
+    knows exactly which fields failed and why.
+    """
+    errors = []
+    for err in exc.errors():
+        loc = " -> ".join(str(part) for part in err["loc"])
+        errors.append({"field": loc, "message": err["msg"]})
+    return ErrorJSONResponse(
+        status_code=422,
+        content={"error": True, "message": "Validation failed", "details": errors},
+    )
+
+
+async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
+    """Catch-all for unexpected exceptions — logs the traceback and returns a generic 500."""
+    logger.exception("Unhandled exception on %s %s", request.method, request.url.path)
+    return ErrorJSONResponse(
+        status_code=500,
+        content={
+            "error": True,
+            "message": "Internal Server Error. Please contact support.",
+        },
+    )
+
+
+# Handler per exception class, registered directly with
+# ``app.add_exception_handler`` — no decorator wrapping per handler.
+_HANDLERS = (
+    (AppException, app_exception_handler),
+    (CircuitBreakerError, circuit_breaker_handler),
+    (StarletteHTTPException, http_exception_handler),
+    (RequestValidationError, validation_exception_handler),
+    (Exception, global_exception_handler),
+)
 
-    @app.exception_handler(AppException)
-    async def app_exception_handler(request: Request, exc: AppException) -> JSONResponse:
-        """Handle domain-specific exceptions raised by the service layer."""
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={"error": True, "message": exc.message},
-        )
 
-    @app.exception_handler(CircuitBreakerError)
-    async def circuit_breaker_handler(request: Request, exc: CircuitBreakerError) -> JSONResponse:
-        """
-        Handle circuit breaker open state → 503 Service Unavailable.
-
-        Includes a Retry-After header so well-behaved clients know when to
-        retry, preventing thundering-herd effects during recovery.
-        """
-        logger.warning(
-            "Circuit breaker '%s' rejected %s %s — retry after %.1fs",
-            exc.name,
-            request.method,
-            request.url.path,
-            exc.retry_after,
-        )
-        return JSONResponse(
-            status_code=503,
-            content={
-                "error": True,
-                "message": f"Service temporarily unavailable — {exc.name} circuit is open",
-                "retry_after_seconds": round(exc.retry_after, 1),
-            },
-            headers={"Retry-After": str(int(exc.retry_after) + 1)},
-        )
-
-    @app.exception_handler(StarletteHTTPException)
-    async def http_exception_handler(
-        request: Request, exc: StarletteHTTPException
-    ) -> JSONResponse:
-        """Handle standard HTTP exceptions (e.g. 404 from path-not-found)."""
-        return JSONResponse(
-            status_code=exc.status_code,
-            content={"error": True, "message": exc.detail},
-        )
-
-    @app.exception_handler(RequestValidationError)
-    async def validation_exception_handler(
-        request: Request, exc: RequestValidationError
-    ) -> JSONResponse:
-        """
-        Handle Pydantic / FastAPI request-validation errors.
-
-        Returns a 422 with a concise list of validation issues so the caller
-        knows exactly which fields failed and why.
-        """
-        errors = []
-        for err in exc.errors():
-            loc = " -> ".join(str(part) for part in err["loc"])
-            errors.append({"field": loc, "message": err["msg"]})
-        return JSONResponse(
-            status_code=422,
-            content={"error": True, "message": "Validation failed", "details": errors},
-        )
-
-    @app.exception_handler(Exception)
-    async def global_exception_handler(request: Request, exc: Exception) -> JSONResponse:
-        """Catch-all for unexpected exceptions — logs the traceback and returns a generic 500."""
-        logger.exception("Unhandled exception on %s %s", request.method, request.url.path)
-        return JSONResponse(
-            status_code=500,
-            content={
-                "error": True,
-                "message": "Internal Server Error. Please contact support.",
-            },
-        )
+def add_exception_handlers(app: FastAPI) -> None:
+    """Register global exception handlers on the FastAPI application instance."""
+    for exc_class, handler in _HANDLERS:
+        app.add_exception_handler(exc_class, handler)
@@ -68,6 +68,9 @@ class CircuitBreaker:
     expected_exceptions : tuple
         Exception types that count as failures. All others pass through
         without affecting the circuit state.
+    clock : callable
+        Monotonic time source in seconds (default :func:`time.monotonic`).
+        Injectable so tests can drive the recovery timeout deterministically.
     """
 
     def __init__(
@@ -76,11 +79,13 @@ class CircuitBreaker:
         failure_threshold: int = 5,
         recovery_timeout: float = 30.0,
         expected_exceptions: Tuple[Type[Exception], ...] = (Exception,),
+        clock: Callable[[], float] = time.monotonic,
     ):
         self.name = name
         self.failure_threshold = failure_threshold
         self.recovery_timeout = recovery_timeout
         self.expected_exceptions = expected_exceptions
+        self._clock = clock
 
         self._state = CircuitState.CLOSED
         self._failure_count = 0
@@ -91,7 +96,7 @@ class CircuitBreaker:
     def state(self) -> CircuitState:
         """Current circuit state, with automatic OPEN → HALF_OPEN transition."""
         if self._state == CircuitState.OPEN:
-            elapsed = time.monotonic() - self._last_failure_time
+            elapsed = self._clock() - self._last_failure_time
             if elapsed >= self.recovery_timeout:
                 # Side-effect: reading state triggers the OPEN → HALF_OPEN
                 # transition once the recovery timeout expires. This is
@@ -120,7 +125,7 @@ class CircuitBreaker:
     def _record_failure(self) -> None:
         """Increment failure count; open circuit if threshold reached."""
         self._failure_count += 1
-        self._last_failure_time = time.monotonic()
+        self._last_failure_time = self._clock()
 
         if self._failure_count >= self.failure_threshold:
             self._state = CircuitState.OPEN
@@ -151,7 +156,7 @@ class CircuitBreaker:
         state = self.state
 
         if state == CircuitState.OPEN:
-            retry_after = self.recovery_timeout - (time.monotonic() - self._last_failure_time)
+            retry_after = self.recovery_timeout - (self._clock() - self._last_failure_time)
             raise CircuitBreakerError(self.name, max(retry_after, 0))
 
         try:
@@ -21,7 +21,8 @@ if settings.USE_SQLITE:
     # In-memory SQLite for zero-dependency testing.
     # StaticPool forces every connection to share the SAME in-memory database;
     # without it, each async connection would get its own empty database,
-    # effectively losing all data between operations.
+    # effectively losing all data between operations.  (NullPool would have
+    # the same problem, so pool sizing settings only apply to PostgreSQL.)
     from sqlalchemy.pool import StaticPool
 
     engine = create_async_engine(
@@ -10,9 +10,11 @@ from decimal import Decimal
 from enum import Enum
 from typing import TYPE_CHECKING, List
 
-from sqlalchemy import CheckConstraint, DateTime
+from sqlalchemy import BigInteger, CheckConstraint, DateTime
 from sqlmodel import Field, Relationship, SQLModel
 
+from app.models.money import cents_to_usd, usd_to_cents
+
 if TYPE_CHECKING:
     from app.models.investment import Investment
 
@@ -31,7 +33,9 @@ class Fund(SQLModel, table=True):
 
     Business rules enforced at the DB level:
     - ``name`` is indexed for fast look-ups and listing.
-    - ``target_size_usd`` uses DECIMAL(20,2) for precise currency arithmetic.
+    - ``target_size_cents`` stores the target size as BIGINT cents — exact,
+      and cheaper to compare/aggregate than NUMERIC.  ``target_size_usd``
+      exposes it as a two-decimal-place ``Decimal`` for the API layer.
     - ``status`` defaults to *Fundraising* on creation.
     """
 
@@ -43,7 +47,7 @@ class Fund(SQLModel, table=True):
     # ``status`` is NOT check-constrained because SQLAlchemy creates a native
     # PostgreSQL ENUM type (``fundstatus``) which already rejects invalid values.
     __table_args__ = (
-        CheckConstraint("target_size_usd > 0", name="ck_funds_target_size_positive"),
+        CheckConstraint("target_size_cents > 0", name="ck_funds_target_size_positive"),
         CheckConstraint("vintage_year >= 1900", name="ck_funds_vintage_year_min"),
         CheckConstraint("length(name) > 0", name="ck_funds_name_not_empty"),
     )
@@ -51,7 +55,7 @@ class Fund(SQLModel, table=True):
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
     name: str = Field(index=True, max_length=255)
     vintage_year: int = Field(index=True)
-    target_size_usd: Decimal = Field(max_digits=20, decimal_places=2)
+    target_size_cents: int = Field(sa_type=BigInteger)  # type: ignore[arg-type]
     status: FundStatus = Field(default=FundStatus.FUNDRAISING)
     created_at: datetime = Field(
         default_factory=lambda: datetime.now(timezone.utc),
@@ -63,5 +67,16 @@ class Fund(SQLModel, table=True):
     # ── Relationships ──
     investments: List["Investment"] = Relationship(back_populates="fund")
 
+    # ── Money accessors ──
+
+    @property
+    def target_size_usd(self) -> Decimal:
+        """Target size in USD, converted from the stored integer cents."""
+        return cents_to_usd(self.target_size_cents)
+
+    @target_size_usd.setter
+    def target_size_usd(self, value: Decimal) -> None:
+        self.target_size_cents = usd_to_cents(value)
+
     def __repr__(self) -> str:
         return f"<Fund id={self.id} name='{self.name}' status={self.status.value}>"
@@ -11,9 +11,11 @@ from datetime import date
 from decimal import Decimal
 from typing import TYPE_CHECKING, Optional
 
-from sqlalchemy import CheckConstraint, Index
+from sqlalchemy import BigInteger, CheckConstraint, Index
 from sqlmodel import Field, Relationship, SQLModel
 
+from app.models.money import cents_to_usd, usd_to_cents
+
 if TYPE_CHECKING:
     from app.models.fund import Fund
     from app.models.investor import Investor
@@ -27,7 +29,9 @@ class Investment(SQLModel, table=True):
     - A **composite index** ``ix_investments_fund_date`` covers the hottest
       query (``GET /funds/{fund_id}/investments``), enabling an index-only
       scan with correct sort order — no filesort required.
-    - ``amount_usd`` uses DECIMAL(20,2) for cent-precise currency values.
+    - ``amount_cents`` stores the amount as BIGINT cents (like
+      ``funds.target_size_cents``); ``amount_usd`` exposes it as a
+      two-decimal-place ``Decimal`` for the API layer.
     - No ``created_at`` column here — the spec models an explicit
       ``investment_date`` supplied by the caller.
     """
@@ -43,7 +47,7 @@ class Investment(SQLModel, table=True):
             "fund_id",
             "investment_date",  # B-tree default ASC; DESC scans are efficient via backward index scan
         ),
-        CheckConstraint("amount_usd > 0", name="ck_investments_amount_positive"),
+        CheckConstraint("amount_cents > 0", name="ck_investments_amount_positive"),
     )
 
     id: uuid.UUID = Field(default_factory=uuid.uuid4, primary_key=True)
@@ -57,13 +61,24 @@ class Investment(SQLModel, table=True):
         index=True,
         ondelete="RESTRICT",  # Prevent deleting a fund that has investments
     )
-    amount_usd: Decimal = Field(max_digits=20, decimal_places=2)
+    amount_cents: int = Field(sa_type=BigInteger)  # type: ignore[arg-type]
     investment_date: date
 
     # ── Relationships ──
     fund: Optional["Fund"] = Relationship(back_populates="investments")
     investor: Optional["Investor"] = Relationship(back_populates="investments")
 
+    # ── Money accessors ──
+
+    @property
+    def amount_usd(self) -> Decimal:
+        """Amount in USD, converted from the stored integer cents."""
+        return cents_to_usd(self.amount_cents)
+
+    @amount_usd.setter
+    def amount_usd(self, value: Decimal) -> None:
+        self.amount_cents = usd_to_cents(value)
+
     def __repr__(self) -> str:
         return (
             f"<Investment id={self.id} fund={self.fund_id} "
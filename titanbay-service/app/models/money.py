@@ -0,0 +1,27 @@
+"""
+Money conversion helpers.
+
+Monetary amounts are persisted as integer **cents** (``BIGINT``) and only
+converted to :class:`~decimal.Decimal` at the API boundary.  Integer columns
+compare, index and aggregate natively, and keep Decimal arithmetic out of
+the ORM hot path while staying exact — no floating point is ever involved.
+"""
+
+from decimal import ROUND_HALF_UP, Decimal
+
+_CENT = Decimal("0.01")
+
+# Largest amount a signed 64-bit ``BIGINT`` cents column can hold
+# (92,233,720,368,547,758.07 USD).  Request schemas use it as an upper bound
+# so oversized input is a 422 instead of an overflow in the database driver.
+MAX_USD = Decimal(2**63 - 1).scaleb(-2)
+
+
+def usd_to_cents(amount: Decimal) -> int:
+    """Convert a USD amount to integer cents, rounding half-up to the nearest cent."""
+    return int(amount.quantize(_CENT, rounding=ROUND_HALF_UP).scaleb(2))
+
+
+def cents_to_usd(cents: int) -> Decimal:
+    """Convert integer cents back to an exact two-decimal-place USD amount."""
+    return Decimal(cents).scaleb(-2)
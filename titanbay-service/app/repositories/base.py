@@ -14,9 +14,9 @@ or extend methods for entity-specific query logic.
 """
 
 import logging
-from typing import Any, Generic, List, Optional, Type, TypeVar
+from typing import Any, Dict, Generic, Iterable, List, Optional, Type, TypeVar
 
-from sqlalchemy import func
+from sqlalchemy import exists, func
 from sqlalchemy.exc import OperationalError
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.future import select
@@ -75,6 +75,42 @@ class BaseRepository(Generic[ModelType]):
 
         return await self._execute_with_circuit_breaker(_get)
 
+    async def exists(self, id: Any) -> bool:
+        """
+        Return ``True`` if an entity with this primary key exists.
+
+        Issues ``SELECT EXISTS(...)`` — a single boolean comes back and no
+        row is hydrated, unlike ``get()``.
+        """
+
+        async def _exists() -> bool:
+            pk_column = self.model.__table__.primary_key.columns[0]
+            stmt = select(exists().where(pk_column == id))
+            result = await self.db.execute(stmt)
+            return bool(result.scalar())
+
+        return await self._execute_with_circuit_breaker(_exists)
+
+    async def get_many(self, ids: Iterable[Any]) -> Dict[Any, ModelType]:
+        """
+        Fetch several entities by primary key in a single ``WHERE id IN (...)`` query.
+
+        Returns a dict keyed by primary key; ids that do not exist are simply
+        absent from the result.  Use this instead of calling :meth:`get` in a
+        loop — one round-trip (and one planner pass) instead of N.
+        """
+        unique_ids = set(ids)
+        if not unique_ids:
+            return {}
+
+        async def _get_many() -> Dict[Any, ModelType]:
+            pk_column = self.model.__table__.primary_key.columns[0]
+            stmt = select(self.model).where(pk_column.in_(unique_ids))
+            result = await self.db.execute(stmt)
+            return {getattr(entity, pk_column.key): entity for entity in result.scalars().all()}
+
+        return await self._execute_with_circuit_breaker(_get_many)
+
     async def get_all(self, skip: int = 0, limit: int = 100) -> List[ModelType]:
         """
         Return a paginated list of entities.
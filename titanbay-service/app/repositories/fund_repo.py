@@ -1,15 +1,44 @@
 """
 Fund repository — data-access layer for the ``funds`` table.
 
-Inherits generic CRUD from :class:`BaseRepository`.  No custom
-query methods required for the current API spec.
+Inherits generic CRUD from :class:`BaseRepository` and adds a combined
+fund + investor look-up used to validate new investments in one query.
 """
 
+from typing import Any, Optional, Tuple
+
+from sqlalchemy import exists
+from sqlalchemy.future import select
+
 from app.models.fund import Fund
+from app.models.investor import Investor
 from app.repositories.base import BaseRepository
 
 
 class FundRepository(BaseRepository[Fund]):
     """Concrete repository for :class:`Fund` entities."""
 
-    pass
+    async def get_fund_and_investor(
+        self, fund_id: Any, investor_id: Any
+    ) -> Tuple[Optional[Fund], bool]:
+        """
+        Fetch a fund and check an investor exists in a single round-trip.
+
+        Executes ``SELECT funds.*, EXISTS(SELECT 1 FROM investors WHERE id = ?)
+        FROM funds WHERE id = ?`` so investment creation validates both
+        references with one query instead of two sequential ones.
+
+        Returns ``(fund, investor_exists)``.  When the fund does not exist the
+        investor is not checked (``False`` is returned) — callers report the
+        missing fund first.
+        """
+
+        async def _get_fund_and_investor() -> Tuple[Optional[Fund], bool]:
+            investor_exists = exists().where(Investor.id == investor_id)
+            stmt = select(self.model, investor_exists).where(self.model.id == fund_id)
+            row = (await self.db.execute(stmt)).first()
+            if row is None:
+                return None, False
+            return row[0], bool(row[1])
+
+        return await self._execute_with_circuit_breaker(_get_fund_and_investor)
@@ -2,17 +2,56 @@
 Investment repository — data-access layer for the ``investments`` table.
 
 Extends generic CRUD with a fund-scoped query used by
-``GET /funds/{fund_id}/investments``.
+``GET /funds/{fund_id}/investments``, a conditional insert that enforces
+the investment preconditions inside the statement itself, and a multi-row
+insert used by the bulk-create endpoint.
 """
 
-from typing import List
+import logging
+from typing import List, Optional
 from uuid import UUID
 
+from sqlalchemy import bindparam, exists, insert
+from sqlalchemy.exc import OperationalError
 from sqlalchemy.future import select
+from sqlalchemy.orm import raiseload
 
+from app.models.fund import Fund, FundStatus
 from app.models.investment import Investment
+from app.models.investor import Investor
 from app.repositories.base import BaseRepository
 
+logger = logging.getLogger(__name__)
+
+# ── Pre-built insert statements ──
+# Built once at import and executed with parameter dicts, so every call
+# reuses the same statement object (and its compiled-SQL cache entry)
+# instead of constructing a new expression tree per insert.
+
+_COLUMNS = list(Investment.__table__.columns)
+
+# INSERT ... SELECT :params WHERE <fund open> AND <investor exists> RETURNING
+_PARAMS = {c.key: bindparam(c.key, type_=c.type) for c in _COLUMNS}
+_CONDITIONAL_INSERT = (
+    insert(Investment)
+    .from_select(
+        _COLUMNS,
+        select(*_PARAMS.values()).where(
+            exists().where(Fund.id == _PARAMS["fund_id"], Fund.status != FundStatus.CLOSED),
+            exists().where(Investor.id == _PARAMS["investor_id"]),
+        ),
+    )
+    .returning(Investment)
+)
+
+# Multi-row INSERT ... RETURNING, rows returned in parameter order
+_BULK_INSERT = insert(Investment).returning(Investment, sort_by_parameter_order=True)
+
+
+def _row(investment: Investment) -> dict:
+    """Column-value parameters for inserting *investment*."""
+    return {c.key: getattr(investment, c.key) for c in _COLUMNS}
+
 
 class InvestmentRepository(BaseRepository[Investment]):
     """Concrete repository for :class:`Investment` entities."""
@@ -28,6 +67,11 @@ class InvestmentRepository(BaseRepository[Investment]):
         by ``investment_date`` descending (most recent first) for a
         deterministic, user-friendly default.
 
+        ``InvestmentResponse`` only carries the foreign-key ids, so the
+        ``fund`` / ``investor`` relationships are never needed here.  They
+        are marked ``raiseload`` rather than eager-loaded: an accidental
+        access raises immediately instead of issuing one lazy query per row.
+
         Parameters
         ----------
         fund_id : UUID
@@ -39,6 +83,7 @@ class InvestmentRepository(BaseRepository[Investment]):
         """
         stmt = (
             select(self.model)
+            .options(raiseload("*"))
             .where(self.model.fund_id == fund_id)
             .order_by(self.model.investment_date.desc())
             .offset(skip)
@@ -46,3 +91,64 @@ class InvestmentRepository(BaseRepository[Investment]):
         )
         result = await self.db.execute(stmt)
         return list(result.scalars().all())
+
+    async def create_if_valid(self, investment: Investment) -> Optional[Investment]:
+        """
+        Insert *investment* only if its fund is open and its investor exists.
+
+        Executes a single conditional ``INSERT ... SELECT ... WHERE ...
+        RETURNING``::
+
+            INSERT INTO investments (...)
+            SELECT :id, :investor_id, :fund_id, :amount_cents, :investment_date
+            WHERE EXISTS (SELECT 1 FROM funds WHERE id = :fund_id AND status <> 'CLOSED')
+              AND EXISTS (SELECT 1 FROM investors WHERE id = :investor_id)
+            RETURNING *
+
+        The preconditions are evaluated by the database in the same
+        statement as the write, so the happy path costs one round-trip.
+        Returns the persisted row, or ``None`` when a precondition failed —
+        the caller runs a diagnostic query to pick the right error.
+        """
+
+        async def _create_if_valid() -> Optional[Investment]:
+            # "orm" keeps the parameters bound to the prebuilt statement; the
+            # default would treat the dict as an ORM bulk insert, which does
+            # not support INSERT ... SELECT.
+            try:
+                result = await self.db.execute(
+                    _CONDITIONAL_INSERT,
+                    _row(investment),
+                    execution_options={"dml_strategy": "orm"},
+                )
+                created = result.scalar_one_or_none()
+                await self.db.commit()
+            except OperationalError:
+                await self.db.rollback()
+                logger.error("OperationalError during create_if_valid for Investment")
+                raise
+            return created
+
+        return await self._execute_with_circuit_breaker(_create_if_valid)
+
+    async def create_many(self, investments: List[Investment]) -> List[Investment]:
+        """
+        Insert several investments with one multi-row ``INSERT ... RETURNING``.
+
+        Returns the persisted rows in the same order as *investments*.
+        Like :meth:`create`, ``OperationalError`` rolls back and re-raises and
+        ``IntegrityError`` is left for the service to translate.
+        """
+
+        async def _create_many() -> List[Investment]:
+            try:
+                result = await self.db.execute(_BULK_INSERT, [_row(inv) for inv in investments])
+                created = list(result.scalars().all())
+                await self.db.commit()
+            except OperationalError:
+                await self.db.rollback()
+                logger.error("OperationalError during create_many for Investment")
+                raise
+            return created
+
+        return await self._execute_with_circuit_breaker(_create_many)
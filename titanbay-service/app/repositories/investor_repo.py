@@ -1,29 +1,76 @@
 """
 Investor repository — data-access layer for the ``investors`` table.
 
-Extends generic CRUD with an email look-up used during duplicate
-detection in the service layer.
+Extends generic CRUD with an atomic insert-unless-email-exists used for
+duplicate detection in the service layer.
 """
 
+import logging
 from typing import Optional
 
-from sqlalchemy.future import select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.exc import OperationalError
 
 from app.models.investor import Investor
 from app.repositories.base import BaseRepository
 
+logger = logging.getLogger(__name__)
+
+# Dialects whose ``insert()`` construct supports ``ON CONFLICT DO NOTHING``.
+_UPSERT_INSERTS = {
+    "postgresql": postgresql.insert,
+    "sqlite": sqlite.insert,
+}
+
 
 class InvestorRepository(BaseRepository[Investor]):
     """Concrete repository for :class:`Investor` entities."""
 
-    async def get_by_email(self, email: str) -> Optional[Investor]:
+    @property
+    def supports_atomic_create(self) -> bool:
         """
-        Look up an investor by email address.
+        ``True`` when :meth:`create_if_not_exists` uses ``ON CONFLICT``.
 
-        Returns ``None`` if no investor with the given email exists.
-        Used to enforce the uniqueness constraint *before* hitting the DB
-        constraint, yielding a friendlier error message.
+        In that mode a duplicate email returns ``None`` and never raises, so
+        an ``IntegrityError`` must come from some other constraint.
         """
-        stmt = select(self.model).where(self.model.email == email)
-        result = await self.db.execute(stmt)
-        return result.scalars().first()
+        return self.db.get_bind().dialect.name in _UPSERT_INSERTS
+
+    async def create_if_not_exists(self, investor: Investor) -> Optional[Investor]:
+        """
+        Insert *investor* unless one with the same email already exists.
+
+        Issues a single ``INSERT ... ON CONFLICT (email) DO NOTHING RETURNING *``
+        so the duplicate check and the insert are one atomic round-trip —
+        no check-then-insert race.  Returns the persisted investor, or
+        ``None`` if the email was already taken.
+
+        On dialects without ``ON CONFLICT`` support this degrades to a plain
+        :meth:`create`, where a duplicate surfaces as ``IntegrityError``.
+        """
+        insert = _UPSERT_INSERTS.get(self.db.get_bind().dialect.name)
+        if insert is None:
+            return await self.create(investor)
+
+        async def _create_if_not_exists() -> Optional[Investor]:
+            values = {
+                column.key: getattr(investor, column.key)
+                for column in self.model.__table__.columns
+            }
+            stmt = (
+                insert(self.model)
+                .values(**values)
+                .on_conflict_do_nothing(index_elements=["email"])
+                .returning(self.model)
+            )
+            try:
+                result = await self.db.execute(stmt)
+                created = result.scalar_one_or_none()
+                await self.db.commit()
+            except OperationalError:
+                await self.db.rollback()
+                logger.error("OperationalError during create_if_not_exists for Investor")
+                raise
+            return created
+
+        return await self._execute_with_circuit_breaker(_create_if_not_exists)
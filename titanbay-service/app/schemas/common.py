@@ -9,7 +9,19 @@ programmatic way to discover the error contract.
 
 from typing import List
 
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
+
+# ── Shared response-model config ──
+# Response schemas are built from ORM rows and then only serialised, never
+# mutated.  ``frozen`` drops the ``__setattr__`` validation path, and the
+# remaining options pin pydantic's defaults explicitly so a future global
+# change cannot silently widen what the read models accept.
+RESPONSE_MODEL_CONFIG = ConfigDict(
+    from_attributes=True,
+    frozen=True,
+    extra="ignore",
+    revalidate_instances="never",
+)
 
 
 class ErrorResponse(BaseModel):
@@ -9,9 +9,11 @@ from datetime import datetime
 from decimal import Decimal
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from pydantic import BaseModel, Field, TypeAdapter, field_serializer, field_validator
 
 from app.models.fund import FundStatus
+from app.models.money import MAX_USD
+from app.schemas.common import RESPONSE_MODEL_CONFIG
 
 # ── Shared validation helpers ──
 
@@ -38,6 +40,7 @@ class FundBase(BaseModel):
     target_size_usd: Decimal = Field(
         ...,
         gt=0,
+        le=MAX_USD,
         description="Target fund size in USD (must be positive)",
         examples=[250_000_000.00],
     )
@@ -58,9 +61,10 @@ class FundBase(BaseModel):
     @classmethod
     def validate_name_not_blank(cls, v: str) -> str:
         """Reject whitespace-only names."""
-        if not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("name must not be blank")
-        return v.strip()
+        return stripped
 
 
 class FundCreate(FundBase):
@@ -105,4 +109,11 @@ class FundResponse(FundBase):
         """
         return float(v)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_MODEL_CONFIG
+
+
+# ── Precompiled adapters ──
+# Built once at import time so the list endpoint reuses the same compiled
+# validator/serializer on every request instead of FastAPI assembling a
+# response field for ``List[FundResponse]`` per call.
+FUND_LIST_ADAPTER = TypeAdapter(list[FundResponse])
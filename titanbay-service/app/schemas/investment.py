@@ -2,11 +2,15 @@
 Pydantic schemas for Investment API request / response serialisation.
 """
 
-from datetime import date
+from datetime import date, timedelta
 from decimal import Decimal
+from typing import List
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, Field, field_serializer, field_validator
+from pydantic import BaseModel, Field, field_serializer, field_validator
+
+from app.models.money import MAX_USD
+from app.schemas.common import RESPONSE_MODEL_CONFIG
 
 
 class InvestmentBase(BaseModel):
@@ -15,6 +19,7 @@ class InvestmentBase(BaseModel):
     amount_usd: Decimal = Field(
         ...,
         gt=0,
+        le=MAX_USD,
         description="Investment amount in USD (must be positive)",
         examples=[50_000_000.00],
     )
@@ -33,8 +38,6 @@ class InvestmentBase(BaseModel):
         A small buffer is allowed because commitments can be forward-dated,
         but wildly future dates are almost certainly data-entry errors.
         """
-        from datetime import timedelta
-
         max_date = date.today() + timedelta(days=365)
         if v > max_date:
             raise ValueError(
@@ -56,6 +59,22 @@ class InvestmentCreate(InvestmentBase):
     )
 
 
+class InvestmentBulkCreate(BaseModel):
+    """
+    Schema for ``POST /funds/{fund_id}/investments/bulk``.
+
+    Wraps the list in an object so the payload can grow extra options
+    later without breaking clients.
+    """
+
+    investments: List[InvestmentCreate] = Field(
+        ...,
+        min_length=1,
+        max_length=1000,
+        description="Investments to record in the fund (1–1000 per request)",
+    )
+
+
 class InvestmentResponse(InvestmentBase):
     """Schema returned by investment endpoints."""
 
@@ -73,4 +92,4 @@ class InvestmentResponse(InvestmentBase):
         """
         return float(v)
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_MODEL_CONFIG
@@ -5,9 +5,10 @@ Pydantic schemas for Investor API request / response serialisation.
 from datetime import datetime
 from uuid import UUID
 
-from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
+from pydantic import BaseModel, EmailStr, Field, field_validator
 
 from app.models.investor import InvestorType
+from app.schemas.common import RESPONSE_MODEL_CONFIG
 
 
 class InvestorBase(BaseModel):
@@ -34,9 +35,10 @@ class InvestorBase(BaseModel):
     @classmethod
     def validate_name_not_blank(cls, v: str) -> str:
         """Reject whitespace-only names."""
-        if not v.strip():
+        stripped = v.strip()
+        if not stripped:
             raise ValueError("name must not be blank")
-        return v.strip()
+        return stripped
 
 
 class InvestorCreate(InvestorBase):
@@ -55,4 +57,4 @@ class InvestorResponse(InvestorBase):
     id: UUID
     created_at: datetime
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = RESPONSE_MODEL_CONFIG
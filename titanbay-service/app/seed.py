@@ -16,13 +16,14 @@ import uuid
 from datetime import date, datetime, timezone
 from decimal import Decimal
 
-from sqlalchemy import select
+from sqlalchemy import exists, select
 from sqlmodel import SQLModel
 
 from app.db.session import AsyncSessionLocal, engine
 from app.models.fund import Fund, FundStatus
 from app.models.investment import Investment
 from app.models.investor import Investor, InvestorType
+from app.models.money import usd_to_cents
 
 logging.basicConfig(level=logging.INFO, format="%(asctime)s | %(levelname)s | %(message)s")
 logger = logging.getLogger(__name__)
@@ -34,7 +35,7 @@ FUNDS = [
         id=uuid.UUID("550e8400-e29b-41d4-a716-446655440000"),
         name="Titanbay Growth Fund I",
         vintage_year=2024,
-        target_size_usd=Decimal("250000000.00"),
+        target_size_cents=usd_to_cents(Decimal("250000000.00")),
         status=FundStatus.FUNDRAISING,
         created_at=datetime(2024, 1, 15, 10, 30, 0, tzinfo=timezone.utc),
     ),
@@ -42,7 +43,7 @@ FUNDS = [
         id=uuid.UUID("660e8400-e29b-41d4-a716-446655440001"),
         name="Titanbay Growth Fund II",
         vintage_year=2025,
-        target_size_usd=Decimal("500000000.00"),
+        target_size_cents=usd_to_cents(Decimal("500000000.00")),
         status=FundStatus.FUNDRAISING,
         created_at=datetime(2024, 9, 22, 14, 20, 0, tzinfo=timezone.utc),
     ),
@@ -50,7 +51,7 @@ FUNDS = [
         id=uuid.UUID("110e8400-e29b-41d4-a716-446655440010"),
         name="Titanbay Buyout Fund III",
         vintage_year=2023,
-        target_size_usd=Decimal("750000000.00"),
+        target_size_cents=usd_to_cents(Decimal("750000000.00")),
         status=FundStatus.INVESTING,
         created_at=datetime(2023, 6, 1, 8, 0, 0, tzinfo=timezone.utc),
     ),
@@ -58,7 +59,7 @@ FUNDS = [
         id=uuid.UUID("220e8400-e29b-41d4-a716-446655440020"),
         name="Titanbay Venture Fund I",
         vintage_year=2022,
-        target_size_usd=Decimal("100000000.00"),
+        target_size_cents=usd_to_cents(Decimal("100000000.00")),
         status=FundStatus.CLOSED,
         created_at=datetime(2022, 3, 10, 12, 0, 0, tzinfo=timezone.utc),
     ),
@@ -100,28 +101,28 @@ INVESTMENTS = [
         id=uuid.UUID("990e8400-e29b-41d4-a716-446655440004"),
         investor_id=uuid.UUID("770e8400-e29b-41d4-a716-446655440002"),
         fund_id=uuid.UUID("550e8400-e29b-41d4-a716-446655440000"),
-        amount_usd=Decimal("50000000.00"),
+        amount_cents=usd_to_cents(Decimal("50000000.00")),
         investment_date=date(2024, 3, 15),
     ),
     Investment(
         id=uuid.UUID("aa0e8400-e29b-41d4-a716-446655440005"),
         investor_id=uuid.UUID("880e8400-e29b-41d4-a716-446655440003"),
         fund_id=uuid.UUID("550e8400-e29b-41d4-a716-446655440000"),
-        amount_usd=Decimal("75000000.00"),
+        amount_cents=usd_to_cents(Decimal("75000000.00")),
         investment_date=date(2024, 9, 22),
     ),
     Investment(
         id=uuid.UUID("bb0e8400-e29b-41d4-a716-446655440006"),
         investor_id=uuid.UUID("330e8400-e29b-41d4-a716-446655440030"),
         fund_id=uuid.UUID("110e8400-e29b-41d4-a716-446655440010"),
-        amount_usd=Decimal("25000000.00"),
+        amount_cents=usd_to_cents(Decimal("25000000.00")),
         investment_date=date(2023, 8, 1),
     ),
     Investment(
         id=uuid.UUID("cc0e8400-e29b-41d4-a716-446655440007"),
         investor_id=uuid.UUID("440e8400-e29b-41d4-a716-446655440040"),
         fund_id=uuid.UUID("660e8400-e29b-41d4-a716-446655440001"),
-        amount_usd=Decimal("5000000.00"),
+        amount_cents=usd_to_cents(Decimal("5000000.00")),
         investment_date=date(2025, 1, 10),
     ),
 ]
@@ -134,9 +135,10 @@ async def seed() -> None:
         await conn.run_sync(SQLModel.metadata.create_all)
 
     async with AsyncSessionLocal() as session:
-        # Check if data already exists (idempotent)
-        result = await session.execute(select(Fund).limit(1))
-        if result.scalars().first() is not None:
+        # Check if data already exists (idempotent).  EXISTS projects a single
+        # boolean — no row is hydrated into a Fund instance just to be discarded.
+        has_data = (await session.execute(select(exists().select_from(Fund)))).scalar()
+        if has_data:
             logger.info("Database already contains data — skipping seed.")
             return
 
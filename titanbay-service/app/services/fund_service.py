@@ -11,7 +11,8 @@ Caching:
     Read operations (``get_all_funds``, ``get_fund``) check the in-memory
     TTL cache first.  Write operations (``create_fund``, ``update_fund``)
     invalidate all ``funds:`` cache keys so subsequent reads always return
-    fresh data.
+    fresh data.  Unknown fund ids are negatively cached (``NOT_FOUND``) for
+    ``CACHE_NEGATIVE_TTL`` seconds so repeated 404s don't reach the database.
 """
 
 import logging
@@ -20,9 +21,11 @@ from uuid import UUID
 
 from sqlalchemy.exc import IntegrityError
 
-from app.core.cache import cache
+from app.core.cache import NOT_FOUND, cache
+from app.core.config import settings
 from app.core.exceptions import BusinessRuleViolation, NotFoundException
 from app.models.fund import Fund, FundStatus
+from app.models.money import usd_to_cents
 from app.repositories.fund_repo import FundRepository
 from app.schemas.fund import FundCreate, FundUpdate
 
@@ -59,12 +62,15 @@ class FundService:
         """
         cache_key = f"{self.CACHE_PREFIX}{fund_id}"
         cached = cache.get(cache_key)
+        if cached is NOT_FOUND:
+            raise NotFoundException("Fund", fund_id)
         if cached is not None:
             logger.debug("Cache hit for %s", cache_key)
             return cached
 
         fund = await self._repo.get(fund_id)
         if not fund:
+            cache.set(cache_key, NOT_FOUND, ttl=settings.CACHE_NEGATIVE_TTL)
             raise NotFoundException("Fund", fund_id)
         cache.set(cache_key, fund)
         return fund
@@ -76,10 +82,14 @@ class FundService:
         Create a new fund from validated input.
 
         Catches ``IntegrityError`` from DB-level CHECK constraint violations
-        (e.g. target_size_usd <= 0 bypassing Pydantic) and surfaces a clean 422.
+        (e.g. target_size_cents <= 0 bypassing Pydantic) and surfaces a clean 422.
         Invalidates fund cache after successful creation.
         """
-        fund = Fund(**fund_in.model_dump())
+        # dict(model) reads the already-validated field values directly; a
+        # model_dump() would run the serializer just to rebuild the same dict.
+        fund_data = dict(fund_in)
+        fund_data["target_size_cents"] = usd_to_cents(fund_data.pop("target_size_usd"))
+        fund = Fund(**fund_data)
         try:
             created = await self._repo.create(fund)
         except IntegrityError as exc:
@@ -88,7 +98,7 @@ class FundService:
             raise BusinessRuleViolation(
                 "Fund data violates a database constraint. Check all fields."
             )
-        cache.invalidate(self.CACHE_PREFIX)
+        cache.invalidate_namespace(self.CACHE_PREFIX)
         logger.info("Created fund %s (%s)", created.id, created.name)
         return created
 
@@ -114,9 +124,9 @@ class FundService:
         _validate_status_transition(fund.status, fund_update.status)
 
         # Apply all fields from the update payload (excluding id, which is immutable)
-        update_data = fund_update.model_dump(exclude={"id"})
-        for key, value in update_data.items():
-            setattr(fund, key, value)
+        for key, value in fund_update:
+            if key != "id":
+                setattr(fund, key, value)
 
         try:
             updated = await self._repo.update(fund)
@@ -126,7 +136,7 @@ class FundService:
             raise BusinessRuleViolation(
                 "Fund update violates a database constraint. Check all fields."
             )
-        cache.invalidate(self.CACHE_PREFIX)
+        cache.invalidate_namespace(self.CACHE_PREFIX)
         logger.info("Updated fund %s", updated.id)
         return updated
 
@@ -145,6 +155,20 @@ _ALLOWED_TRANSITIONS: dict[FundStatus, set[FundStatus]] = {
 }
 
 
+# Error messages for every disallowed (current, requested) pair, formatted
+# once at import time.  Fresh exception instances are still raised per call
+# so tracebacks never leak between requests.
+_TRANSITION_ERRORS: dict[tuple[FundStatus, FundStatus], str] = {
+    (current, requested): (
+        f"Invalid status transition: '{current.value}' → '{requested.value}'. "
+        f"Fund lifecycle is Fundraising → Investing → Closed (one-way)."
+    )
+    for current in FundStatus
+    for requested in FundStatus
+    if requested not in _ALLOWED_TRANSITIONS[current]
+}
+
+
 def _validate_status_transition(current: FundStatus, requested: FundStatus) -> None:
     """
     Enforce one-way fund lifecycle transitions.
@@ -152,8 +176,10 @@ def _validate_status_transition(current: FundStatus, requested: FundStatus) -> N
     Fundraising → Investing → Closed.  Moving backwards (e.g. Closed → Fundraising)
     raises a :class:`BusinessRuleViolation`.
     """
-    if requested not in _ALLOWED_TRANSITIONS.get(current, set()):
-        raise BusinessRuleViolation(
-            f"Invalid status transition: '{current.value}' → '{requested.value}'. "
-            f"Fund lifecycle is Fundraising → Investing → Closed (one-way)."
-        )
+    # Enum members are singletons, so an identity check covers the common
+    # "PUT back the same status" case without any set lookup.
+    if current is requested:
+        return
+    message = _TRANSITION_ERRORS.get((current, requested))
+    if message is not None:
+        raise BusinessRuleViolation(message)
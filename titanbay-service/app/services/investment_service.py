@@ -4,22 +4,27 @@ Investment service — business logic for investment (commitment) operations.
 Key business rule: investments into *Closed* funds must be rejected.
 
 Read operations are cache-backed; writes invalidate ``investments:``.
+Fund look-ups share ``FundService``'s ``funds:{id}`` cache entries, so a
+known-missing or closed fund is rejected without touching the database.
 """
 
 import logging
-from typing import List
+from typing import Any, List, NoReturn, Optional
 from uuid import UUID
 
 from sqlalchemy.exc import IntegrityError
 
-from app.core.cache import cache
+from app.core.cache import NOT_FOUND, cache
+from app.core.config import settings
 from app.core.exceptions import BusinessRuleViolation, NotFoundException
-from app.models.fund import FundStatus
+from app.models.fund import Fund, FundStatus
 from app.models.investment import Investment
+from app.models.money import usd_to_cents
 from app.repositories.fund_repo import FundRepository
 from app.repositories.investment_repo import InvestmentRepository
 from app.repositories.investor_repo import InvestorRepository
 from app.schemas.investment import InvestmentCreate
+from app.services.fund_service import FundService
 
 logger = logging.getLogger(__name__)
 
@@ -52,13 +57,11 @@ class InvestmentService:
         """
         Return investments for a given fund, with pagination (cache-backed).
 
-        The fund is validated first so the caller gets a clear 404 instead
-        of an empty list when the fund does not exist.
+        The caller gets a clear 404 instead of an empty list when the fund
+        does not exist.  A non-empty page proves the fund exists (FK), so the
+        existence check only runs when the page is empty — the common case
+        costs a single query.
         """
-        fund = await self._fund_repo.get(fund_id)
-        if not fund:
-            raise NotFoundException("Fund", fund_id)
-
         cache_key = f"{self.CACHE_PREFIX}{fund_id}:{skip}:{limit}"
         cached = cache.get(cache_key)
         if cached is not None:
@@ -66,6 +69,8 @@ class InvestmentService:
             return cached
 
         investments = await self._invest_repo.get_by_fund(fund_id, skip=skip, limit=limit)
+        if not investments and not await self._fund_repo.exists(fund_id):
+            raise NotFoundException("Fund", fund_id)
         cache.set(cache_key, investments)
         return investments
 
@@ -82,37 +87,28 @@ class InvestmentService:
         3. The referenced **investor** must exist → 404 if not.
            Without this check we would get an opaque FK-violation from Postgres.
 
-        Only after all preconditions pass is the investment persisted.
+        Steps 1–2 are answered from the shared ``funds:{id}`` cache entry when
+        one exists (no query for repeat rejections).  Otherwise all three
+        checks are folded into a single conditional ``INSERT ... SELECT ...
+        WHERE`` (see ``InvestmentRepository.create_if_valid``), so the happy
+        path costs one round-trip.  Only when the insert is refused does a
+        diagnostic query fetch the fund and investor to pick the right error;
+        the fund entry is then cached for subsequent requests.
+
         Invalidates investment cache after successful creation.
         """
-        # 1 ─ Validate fund existence
-        fund = await self._fund_repo.get(fund_id)
-        if not fund:
-            raise NotFoundException("Fund", fund_id)
-
-        # 2 ─ Business rule: closed funds reject new investments
-        if fund.status == FundStatus.CLOSED:
-            raise BusinessRuleViolation(
-                f"Fund '{fund.name}' is closed and no longer accepts investments"
-            )
-
-        # 3 ─ Validate investor existence
-        investor = await self._investor_repo.get(invest_in.investor_id)
-        if not investor:
-            raise NotFoundException("Investor", invest_in.investor_id)
-
-        # 4 ─ Persist
-        # IntegrityError catch handles TOCTOU races: if the fund or investor
-        # was deleted between our existence check and the INSERT, PostgreSQL's
-        # FK constraint fires and we translate it to a meaningful error.
-        investment = Investment(
-            fund_id=fund_id,
-            investor_id=invest_in.investor_id,
-            amount_usd=invest_in.amount_usd,
-            investment_date=invest_in.investment_date,
-        )
+        # 0 ─ Fast path: reject from the shared fund cache.  Fund writes
+        #     invalidate the ``funds:`` namespace, so these entries are fresh.
+        cached_fund = cache.get(_fund_cache_key(fund_id))
+        if cached_fund is not None:
+            _ensure_fund_accepts_investments(fund_id, cached_fund)
+
+        # 1–3 ─ Validate and persist in one statement.
+        # The IntegrityError catch remains as a safety net for constraint
+        # violations the predicate does not cover.
+        investment = _build_investment(fund_id, invest_in)
         try:
-            created = await self._invest_repo.create(investment)
+            created = await self._invest_repo.create_if_valid(investment)
         except IntegrityError as exc:
             await self._invest_repo.db.rollback()
             logger.warning(
@@ -125,7 +121,11 @@ class InvestmentService:
                 "Investment could not be created — a referenced fund or investor "
                 "may have been removed, or a database constraint was violated."
             )
-        cache.invalidate(self.CACHE_PREFIX)
+
+        if created is None:
+            await self._raise_rejection(fund_id, invest_in.investor_id)
+
+        cache.invalidate_namespace(self.CACHE_PREFIX)
         logger.info(
             "Created investment %s: investor %s → fund %s ($%s)",
             created.id,
@@ -134,3 +134,111 @@ class InvestmentService:
             created.amount_usd,
         )
         return created
+
+    async def create_investments_bulk(
+        self, fund_id: UUID, investments_in: List[InvestmentCreate]
+    ) -> List[Investment]:
+        """
+        Record several investments into one fund in a fixed number of queries.
+
+        Applies the same validation as :meth:`create_investment`, but
+        amortised across the batch:
+
+        1. The fund is fetched (or served from cache) **once** → 404 / 422.
+        2. Every referenced investor is resolved with one ``WHERE id IN (...)``
+           query → 404 naming the first missing investor.
+        3. All rows are persisted with one multi-row ``INSERT ... RETURNING``.
+
+        The batch is all-or-nothing: any failure persists nothing.
+        Invalidates investment cache after successful creation.
+
+        Validation is deliberately batched rather than fanned out with
+        ``asyncio.gather``: every repository shares the request's single
+        ``AsyncSession``, which does not support concurrent operations, and
+        the IN query already replaces N investor look-ups with one.
+        """
+        # 1 ─ Validate the fund once for the whole batch.  A cached entry is
+        #     fresh (fund writes invalidate ``funds:``), so an open fund in
+        #     the cache needs no query.
+        fund = cache.get(_fund_cache_key(fund_id))
+        if fund is None:
+            fund = await self._fund_repo.get(fund_id)
+            _cache_fund(fund_id, fund)
+        _ensure_fund_accepts_investments(fund_id, fund)
+
+        # 2 ─ Validate every investor with a single IN query
+        investors = await self._investor_repo.get_many(i.investor_id for i in investments_in)
+        for invest_in in investments_in:
+            if invest_in.investor_id not in investors:
+                raise NotFoundException("Investor", invest_in.investor_id)
+
+        # 3 ─ Persist in one statement
+        investments = [_build_investment(fund_id, invest_in) for invest_in in investments_in]
+        try:
+            created = await self._invest_repo.create_many(investments)
+        except IntegrityError as exc:
+            await self._invest_repo.db.rollback()
+            logger.warning("IntegrityError bulk-creating investments (fund=%s): %s", fund_id, exc)
+            raise BusinessRuleViolation(
+                "Investments could not be created — a referenced fund or investor "
+                "may have been removed, or a database constraint was violated."
+            )
+        cache.invalidate_namespace(self.CACHE_PREFIX)
+        logger.info("Created %d investments in fund %s", len(created), fund_id)
+        return created
+
+    async def _raise_rejection(self, fund_id: UUID, investor_id: UUID) -> NoReturn:
+        """Diagnose why a conditional insert was refused and raise the matching error."""
+        fund, investor_exists = await self._fund_repo.get_fund_and_investor(fund_id, investor_id)
+        _cache_fund(fund_id, fund)
+        _ensure_fund_accepts_investments(fund_id, fund)
+        if not investor_exists:
+            raise NotFoundException("Investor", investor_id)
+        # Both references are valid now: the state changed between the two
+        # statements (e.g. the fund was reopened).  Ask the client to retry.
+        raise BusinessRuleViolation(
+            "Investment could not be created — the fund or investor changed concurrently."
+        )
+
+
+def _fund_cache_key(fund_id: UUID) -> str:
+    """Key of the ``funds:{id}`` entry shared with :class:`FundService`."""
+    return f"{FundService.CACHE_PREFIX}{fund_id}"
+
+
+def _cache_fund(fund_id: UUID, fund: Optional[Fund]) -> None:
+    """Store a freshly loaded fund — or a short-lived ``NOT_FOUND`` marker."""
+    if fund is None:
+        cache.set(_fund_cache_key(fund_id), NOT_FOUND, ttl=settings.CACHE_NEGATIVE_TTL)
+    else:
+        cache.set(_fund_cache_key(fund_id), fund)
+
+
+def _build_investment(fund_id: UUID, invest_in: InvestmentCreate) -> Investment:
+    """Map a validated request payload onto a new :class:`Investment` row."""
+    return Investment(
+        fund_id=fund_id,
+        investor_id=invest_in.investor_id,
+        amount_cents=usd_to_cents(invest_in.amount_usd),
+        investment_date=invest_in.investment_date,
+    )
+
+
+def _ensure_fund_accepts_investments(fund_id: UUID, fund: Any) -> None:
+    """
+    Raise unless *fund* exists and is open for new capital.
+
+    *fund* is a :class:`Fund`, ``None`` (not in the database) or the cache's
+    ``NOT_FOUND`` marker.
+    """
+    # 1 ─ Validate fund existence
+    if fund is None or fund is NOT_FOUND:
+        raise NotFoundException("Fund", fund_id)
+
+    # 2 ─ Business rule: closed funds reject new investments.  ``status`` is
+    #     always a FundStatus member (schemas and the ORM both coerce), so an
+    #     identity check suffices.
+    if fund.status is FundStatus.CLOSED:
+        raise BusinessRuleViolation(
+            f"Fund '{fund.name}' is closed and no longer accepts investments"
+        )
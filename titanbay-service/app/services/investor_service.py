@@ -1,36 +1,50 @@
 """
 Investor service — business logic layer for investor operations.
 
-Handles duplicate-email detection before hitting the DB unique constraint,
-providing a friendlier error message to the API consumer.
+Translates duplicate emails into a friendly 409 Conflict for the API consumer.
 
 Race condition note:
-    The pre-check ``get_by_email()`` followed by ``create()`` is subject to a
-    TOCTOU (time-of-check / time-of-use) race: two concurrent requests with
-    the same email could both pass the check.  The DB unique constraint is the
-    true safety net.  We catch the resulting ``IntegrityError`` and translate
-    it to a 409 Conflict so the client always gets a clean error message
-    regardless of timing.
+    Creation is a single atomic ``INSERT ... ON CONFLICT (email) DO NOTHING``
+    (see ``InvestorRepository.create_if_not_exists``), so there is no
+    check-then-insert TOCTOU window and the happy path costs one round-trip.
+    On backends without ``ON CONFLICT`` the DB unique constraint remains the
+    safety net: the resulting ``IntegrityError`` is still translated to a 409.
 
 Caching:
     Read operations (``get_all_investors``) check the in-memory TTL cache
-    first.  Write operations (``create_investor``) invalidate all
-    ``investors:`` cache keys.
+    first.  Pages are cached as frozen ``InvestorResponse`` models rather
+    than ORM instances: they are smaller, carry no session state, and can
+    be shared between requests without risk of mutation.
+
+    Listing pages are served stale-while-revalidate: once a page is older
+    than ``CACHE_TTL`` the first request reloads it while concurrent
+    requests keep getting the stale page (for up to ``CACHE_STALE_TTL`` more
+    seconds), so an expiry triggers one query instead of a stampede.
+
+    Write operations (``create_investor``) invalidate the ``investors:list:``
+    pages.  Emails known to be taken are remembered under
+    ``investors:byemail:{email}``, so repeated duplicate submissions are
+    rejected without a database round-trip.
 """
 
 import logging
-from typing import List
+from typing import List, Set
 
 from sqlalchemy.exc import IntegrityError
 
 from app.core.cache import cache
-from app.core.exceptions import ConflictException
+from app.core.config import settings
+from app.core.exceptions import BusinessRuleViolation, ConflictException
 from app.models.investor import Investor
 from app.repositories.investor_repo import InvestorRepository
-from app.schemas.investor import InvestorCreate
+from app.schemas.investor import InvestorCreate, InvestorResponse
 
 logger = logging.getLogger(__name__)
 
+# Cache keys currently being reloaded; concurrent readers of a stale entry
+# are served the stale value instead of issuing a duplicate query.
+_refreshing: Set[str] = set()
+
 
 class InvestorService:
     """Encapsulates CRUD + business rules for :class:`Investor`."""
@@ -42,16 +56,31 @@ class InvestorService:
 
     # ── Queries ──
 
-    async def get_all_investors(self, skip: int = 0, limit: int = 100) -> List[Investor]:
-        """Return a paginated list of investors (cache-backed)."""
+    async def get_all_investors(self, skip: int = 0, limit: int = 100) -> List[InvestorResponse]:
+        """
+        Return a paginated list of investors (cache-backed, stale-while-revalidate).
+
+        A fresh entry is returned as-is.  A stale entry (older than
+        ``CACHE_TTL``) is returned as-is too while another request is already
+        reloading it; otherwise this request reloads it.  The reload runs
+        in-line rather than as a background task because the repository is
+        bound to this request's database session.
+        """
         cache_key = f"{self.CACHE_PREFIX}list:{skip}:{limit}"
-        cached = cache.get(cache_key)
+        cached = cache.get_with_age(cache_key)
         if cached is not None:
-            logger.debug("Cache hit for %s", cache_key)
-            return cached
+            investors, age = cached
+            if age <= settings.CACHE_TTL or cache_key in _refreshing:
+                logger.debug("Cache hit for %s", cache_key)
+                return investors
 
-        investors = await self._repo.get_all(skip=skip, limit=limit)
-        cache.set(cache_key, investors)
+        _refreshing.add(cache_key)
+        try:
+            rows = await self._repo.get_all(skip=skip, limit=limit)
+        finally:
+            _refreshing.discard(cache_key)
+        investors = [InvestorResponse.model_validate(row) for row in rows]
+        cache.set(cache_key, investors, ttl=settings.CACHE_TTL + settings.CACHE_STALE_TTL)
         return investors
 
     # ── Commands ──
@@ -61,31 +90,49 @@ class InvestorService:
         Create a new investor.
 
         Raises :class:`ConflictException` if an investor with the same
-        email already exists.  The pre-check avoids an ugly DB constraint
-        violation error reaching the client in the common case.
+        email already exists.  The duplicate check and the insert are one
+        atomic statement, so concurrent requests cannot both succeed.
 
-        A secondary ``IntegrityError`` catch handles the TOCTOU race where
-        two concurrent requests slip past the pre-check simultaneously.
+        The ``IntegrityError`` catch covers backends where the repository
+        falls back to a plain insert and the unique constraint fires instead.
         Invalidates investor cache after successful creation.
         """
-        # Optimistic pre-check (fast path — catches 99.9% of duplicates)
-        existing = await self._repo.get_by_email(str(investor_in.email))
-        if existing:
-            raise ConflictException(f"An investor with email '{investor_in.email}' already exists")
+        email_key = f"{self.CACHE_PREFIX}byemail:{investor_in.email}"
+        if cache.get(email_key) is not None:
+            logger.debug("Cache hit for %s", email_key)
+            raise _duplicate_email(investor_in.email)
 
-        investor = Investor(**investor_in.model_dump())
+        investor = Investor(**dict(investor_in))
         try:
-            created = await self._repo.create(investor)
-        except IntegrityError:
-            # TOCTOU race: another request inserted the same email between
-            # our check and our insert.  Roll back and return a clean 409.
+            created = await self._repo.create_if_not_exists(investor)
+        except IntegrityError as exc:
             await self._repo.db.rollback()
+            if self._repo.supports_atomic_create:
+                # ON CONFLICT absorbs duplicate emails, so this is another
+                # constraint (e.g. a CHECK) — not a reason to remember the email.
+                logger.warning("IntegrityError creating investor: %s", exc)
+                raise BusinessRuleViolation(
+                    "Investor data violates a database constraint. Check all fields."
+                )
+            # Plain-insert fallback: the unique constraint rejected the
+            # duplicate.  Roll back and return a clean 409.
             logger.warning(
-                "IntegrityError caught for duplicate email '%s' (TOCTOU race)",
+                "IntegrityError caught for duplicate email '%s'",
                 investor_in.email,
             )
-            raise ConflictException(f"An investor with email '{investor_in.email}' already exists")
+            created = None
+
+        if created is None:
+            cache.set(email_key, True)
+            raise _duplicate_email(investor_in.email)
 
-        cache.invalidate(self.CACHE_PREFIX)
+        # Only listing pages are stale now; known-email entries stay valid.
+        cache.invalidate(f"{self.CACHE_PREFIX}list:")
+        cache.set(email_key, created.id)
         logger.info("Created investor %s (%s)", created.id, created.name)
         return created
+
+
+def _duplicate_email(email: str) -> ConflictException:
+    """The 409 raised for an email that is already taken (one wording for every path)."""
+    return ConflictException(f"An investor with email '{email}' already exists")
@@ -0,0 +1,66 @@
+-- ──────────────────────────────────────────────────────────────────────────────
+-- migrate_money_to_cents.sql — One-off upgrade for databases created before
+-- money columns moved to integer cents
+--
+-- The app only runs SQLModel.metadata.create_all on startup, which creates
+-- missing tables but never alters existing ones.  A database created by an
+-- older build still has the NUMERIC(20,2) dollar columns, and every query
+-- against them fails with "column ... does not exist".  Run this once
+-- against such a database before starting the new build:
+--
+--   funds.target_size_usd NUMERIC(20,2)  →  funds.target_size_cents BIGINT
+--   investments.amount_usd NUMERIC(20,2) →  investments.amount_cents BIGINT
+--
+-- Each step is guarded on the old column still existing, so running the
+-- script again (or against a freshly created database) is a no-op.  Values
+-- above BIGINT range (≈ $92 quadrillion) make the cast fail and roll the
+-- transaction back.
+--
+-- Usage:
+--   psql -v ON_ERROR_STOP=1 -h 127.0.0.1 -U titanbay_user -d titanbay_db \
+--        -f scripts/migrate_money_to_cents.sql
+--
+--   # Docker:
+--   docker exec -i titanbay-db psql -v ON_ERROR_STOP=1 -U titanbay_user \
+--        -d titanbay_db < scripts/migrate_money_to_cents.sql
+-- ──────────────────────────────────────────────────────────────────────────────
+
+BEGIN;
+
+-- ── funds.target_size_usd → funds.target_size_cents ──
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'funds' AND column_name = 'target_size_usd'
+    ) THEN
+        ALTER TABLE funds ADD COLUMN target_size_cents BIGINT;
+        UPDATE funds SET target_size_cents = ROUND(target_size_usd * 100)::BIGINT;
+        ALTER TABLE funds ALTER COLUMN target_size_cents SET NOT NULL;
+        ALTER TABLE funds DROP CONSTRAINT IF EXISTS ck_funds_target_size_positive;
+        ALTER TABLE funds DROP COLUMN target_size_usd;
+        ALTER TABLE funds ADD CONSTRAINT ck_funds_target_size_positive
+            CHECK (target_size_cents > 0);
+    END IF;
+END
+$$;
+
+-- ── investments.amount_usd → investments.amount_cents ──
+DO $$
+BEGIN
+    IF EXISTS (
+        SELECT 1 FROM information_schema.columns
+        WHERE table_name = 'investments' AND column_name = 'amount_usd'
+    ) THEN
+        ALTER TABLE investments ADD COLUMN amount_cents BIGINT;
+        UPDATE investments SET amount_cents = ROUND(amount_usd * 100)::BIGINT;
+        ALTER TABLE investments ALTER COLUMN amount_cents SET NOT NULL;
+        ALTER TABLE investments DROP CONSTRAINT IF EXISTS ck_investments_amount_positive;
+        ALTER TABLE investments DROP COLUMN amount_usd;
+        ALTER TABLE investments ADD CONSTRAINT ck_investments_amount_positive
+            CHECK (amount_cents > 0);
+    END IF;
+END
+$$;
+
+COMMIT;
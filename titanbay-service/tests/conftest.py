@@ -22,11 +22,14 @@ from decimal import Decimal  # noqa: E402
 from unittest.mock import AsyncMock, MagicMock  # noqa: E402
 
 import pytest  # noqa: E402
+from sqlalchemy.exc import IntegrityError  # noqa: E402
+from sqlalchemy.ext.asyncio import AsyncSession  # noqa: E402
 
 from app.core.cache import TTLCache  # noqa: E402
 from app.models.fund import Fund, FundStatus  # noqa: E402
 from app.models.investment import Investment  # noqa: E402
 from app.models.investor import Investor, InvestorType  # noqa: E402
+from app.models.money import usd_to_cents  # noqa: E402
 
 # ────────────────────────────────────────────────────────────────────────────
 # Factory helpers — create domain objects with sensible defaults
@@ -37,6 +40,16 @@ INVESTOR_ID = uuid.UUID("22222222-2222-2222-2222-222222222222")
 INVESTMENT_ID = uuid.UUID("33333333-3333-3333-3333-333333333333")
 FUND_ID_2 = uuid.UUID("44444444-4444-4444-4444-444444444444")
 INVESTOR_ID_2 = uuid.UUID("55555555-5555-5555-5555-555555555555")
+INVESTMENT_ID_2 = uuid.UUID("66666666-6666-6666-6666-666666666666")
+
+# Default ``created_at`` shared by every factory-built object: deterministic,
+# and no clock read per call.
+FIXED_NOW = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+# Factories construct a fresh instance per call rather than copying a
+# template: ``copy.copy`` of a mapped instance shares its
+# ``_sa_instance_state``, so two "copies" would be one object to the ORM.
+# A call costs ~30µs, negligible next to the tests that use it.
 
 
 def make_fund(
@@ -53,9 +66,9 @@ def make_fund(
         id=id,
         name=name,
         vintage_year=vintage_year,
-        target_size_usd=target_size_usd,
+        target_size_cents=usd_to_cents(target_size_usd),
         status=status,
-        created_at=created_at or datetime.now(timezone.utc),
+        created_at=created_at or FIXED_NOW,
     )
 
 
@@ -73,7 +86,7 @@ def make_investor(
         name=name,
         investor_type=investor_type,
         email=email,
-        created_at=created_at or datetime.now(timezone.utc),
+        created_at=created_at or FIXED_NOW,
     )
 
 
@@ -90,11 +103,41 @@ def make_investment(
         id=id,
         fund_id=fund_id,
         investor_id=investor_id,
-        amount_usd=amount_usd,
+        amount_cents=usd_to_cents(amount_usd),
         investment_date=investment_date,
     )
 
 
+# Shared default instances for tests that only pass an object through (return
+# it from a mock, cache it, compare identity) and never mutate it.  Anything
+# that modifies its fund or investor must build its own with the factory.
+SENTINEL_FUND = make_fund()
+SENTINEL_INVESTOR = make_investor()
+
+
+# Constraint violations for ``side_effect``, built once: a mock re-raises the
+# same instance, and the services only log the error and translate it.
+INTEGRITY_ERROR_INSERT = IntegrityError("INSERT", {}, Exception("constraint"))
+INTEGRITY_ERROR_UPDATE = IntegrityError("UPDATE", {}, Exception("constraint"))
+
+
+def make_repo_mock(spec: type) -> AsyncMock:
+    """
+    Create a repository mock specced on *spec*, with an ``AsyncSession`` as ``db``.
+
+    Service test modules build these once in a module-scoped fixture and
+    call :func:`reset_repo_mock` after each test.
+    """
+    repo = AsyncMock(spec=spec)
+    repo.db = AsyncMock(spec=AsyncSession)
+    return repo
+
+
+def reset_repo_mock(repo: AsyncMock) -> None:
+    """Clear a repository mock's calls, return values and side effects."""
+    repo.reset_mock(return_value=True, side_effect=True)
+
+
 # ────────────────────────────────────────────────────────────────────────────
 # Pytest fixtures
 # ────────────────────────────────────────────────────────────────────────────
@@ -115,27 +158,35 @@ def mock_db():
     return session
 
 
-@pytest.fixture()
-def test_cache():
-    """A fresh TTL cache instance for test isolation."""
+@pytest.fixture(scope="module")
+def _cache_pool():
+    """One TTL cache per module, handed out by ``test_cache`` after a reset."""
     return TTLCache(ttl=30.0, max_size=100, enabled=True)
 
 
+@pytest.fixture()
+def test_cache(_cache_pool):
+    """An empty TTL cache (the module's shared instance, reset) for test isolation."""
+    _cache_pool.reset()
+    return _cache_pool
+
+
 @pytest.fixture()
 def disabled_cache():
     """A disabled TTL cache — all operations are no-ops."""
     return TTLCache(ttl=30.0, max_size=100, enabled=False)
 
 
-@pytest.fixture(autouse=True)
-def _clear_global_cache():
+def pytest_runtest_teardown(item):
     """
-    Clear the global cache before each test to prevent cross-test pollution.
+    Reset the global cache after tests marked ``uses_cache``.
 
-    Uses autouse=True so every test gets a clean cache automatically.
+    Only the service tests read or write the global cache, so the reset is
+    opt-in via the marker rather than an autouse fixture paid by every test.
+    Teardown alone suffices: the cache starts empty and every marked test
+    leaves it empty for the next one.
     """
-    from app.core.cache import cache
+    if item.get_closest_marker("uses_cache") is not None:
+        from app.core.cache import cache
 
-    cache.clear()
-    yield
-    cache.clear()
+        cache.reset()
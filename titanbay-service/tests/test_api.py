@@ -5,6 +5,8 @@ These tests exercise the full FastAPI request → middleware → endpoint → se
 pipeline, with mocked service layers to isolate from the database.
 """
 
+import asyncio
+from typing import Iterator
 from unittest.mock import AsyncMock
 
 import pytest
@@ -21,6 +23,7 @@ from app.models.fund import FundStatus
 
 from .conftest import (
     FUND_ID,
+    INVESTMENT_ID_2,
     INVESTOR_ID,
     make_fund,
     make_investment,
@@ -45,6 +48,31 @@ def _make_test_app() -> FastAPI:
     return app
 
 
+# One service mock shared by every test: building an AsyncMock is costly, and
+# ``reset_mock`` after each test clears calls, return values and side effects.
+_MOCK_SERVICE = AsyncMock()
+
+
+@pytest.fixture(scope="class")
+def app() -> FastAPI:
+    """One test app per class; each test installs its own service override."""
+    return _make_test_app()
+
+
+@pytest.fixture(scope="class")
+def client(app: FastAPI) -> Iterator[AsyncClient]:
+    """
+    A class-scoped client, closed when the class finishes.
+
+    The fixture is synchronous (so it needs no class-scoped event loop);
+    ``ASGITransport`` holds no loop-bound connections, so closing on a fresh
+    loop is safe.
+    """
+    client = AsyncClient(transport=ASGITransport(app=app), base_url="http://test")
+    yield client
+    asyncio.run(client.aclose())
+
+
 # ────────────────────────────────────────────────────────────────────────────
 # Funds endpoint tests
 # ────────────────────────────────────────────────────────────────────────────
@@ -54,9 +82,13 @@ class TestFundsEndpoints:
     """Tests for /api/v1/funds endpoints."""
 
     @pytest.fixture(autouse=True)
-    def _setup(self):
-        self.app = _make_test_app()
-        self.mock_service = AsyncMock()
+    def _setup(self, app, client):
+        self.app = app
+        self.client = client
+        self.mock_service = _MOCK_SERVICE
+        yield
+        app.dependency_overrides.clear()
+        _MOCK_SERVICE.reset_mock(return_value=True, side_effect=True)
 
     def _override_service(self):
         from app.api.v1.endpoints.funds import _get_fund_service
@@ -69,9 +101,7 @@ class TestFundsEndpoints:
         fund = make_fund()
         self.mock_service.get_all_funds.return_value = [fund]
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.get("/api/v1/funds")
+        resp = await self.client.get("/api/v1/funds")
 
         assert resp.status_code == 200
         data = resp.json()
@@ -83,9 +113,7 @@ class TestFundsEndpoints:
         self._override_service()
         self.mock_service.get_all_funds.return_value = []
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.get("/api/v1/funds")
+        resp = await self.client.get("/api/v1/funds")
 
         assert resp.status_code == 200
         assert resp.json() == []
@@ -96,17 +124,15 @@ class TestFundsEndpoints:
         created = make_fund(name="New Fund")
         self.mock_service.create_fund.return_value = created
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.post(
-                "/api/v1/funds",
-                json={
-                    "name": "New Fund",
-                    "vintage_year": 2025,
-                    "target_size_usd": 100000000,
-                    "status": "Fundraising",
-                },
-            )
+        resp = await self.client.post(
+            "/api/v1/funds",
+            json={
+                "name": "New Fund",
+                "vintage_year": 2025,
+                "target_size_usd": 100000000,
+                "status": "Fundraising",
+            },
+        )
 
         assert resp.status_code == 201
         assert resp.json()["name"] == "New Fund"
@@ -115,16 +141,14 @@ class TestFundsEndpoints:
     async def test_create_fund_422_validation(self):
         self._override_service()
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.post(
-                "/api/v1/funds",
-                json={
-                    "name": "",
-                    "vintage_year": 2025,
-                    "target_size_usd": 100000000,
-                },
-            )
+        resp = await self.client.post(
+            "/api/v1/funds",
+            json={
+                "name": "",
+                "vintage_year": 2025,
+                "target_size_usd": 100000000,
+            },
+        )
 
         assert resp.status_code == 422
 
@@ -134,9 +158,7 @@ class TestFundsEndpoints:
         fund = make_fund()
         self.mock_service.get_fund.return_value = fund
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.get(f"/api/v1/funds/{FUND_ID}")
+        resp = await self.client.get(f"/api/v1/funds/{FUND_ID}")
 
         assert resp.status_code == 200
         assert resp.json()["name"] == "Test Fund I"
@@ -146,9 +168,7 @@ class TestFundsEndpoints:
         self._override_service()
         self.mock_service.get_fund.side_effect = NotFoundException("Fund", FUND_ID)
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.get(f"/api/v1/funds/{FUND_ID}")
+        resp = await self.client.get(f"/api/v1/funds/{FUND_ID}")
 
         assert resp.status_code == 404
         assert resp.json()["error"] is True
@@ -159,18 +179,16 @@ class TestFundsEndpoints:
         updated = make_fund(name="Updated", status=FundStatus.INVESTING)
         self.mock_service.update_fund.return_value = updated
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.put(
-                "/api/v1/funds",
-                json={
-                    "id": str(FUND_ID),
-                    "name": "Updated",
-                    "vintage_year": 2025,
-                    "target_size_usd": 200000000,
-                    "status": "Investing",
-                },
-            )
+        resp = await self.client.put(
+            "/api/v1/funds",
+            json={
+                "id": str(FUND_ID),
+                "name": "Updated",
+                "vintage_year": 2025,
+                "target_size_usd": 200000000,
+                "status": "Investing",
+            },
+        )
 
         assert resp.status_code == 200
         assert resp.json()["name"] == "Updated"
@@ -180,18 +198,16 @@ class TestFundsEndpoints:
         self._override_service()
         self.mock_service.update_fund.side_effect = NotFoundException("Fund", FUND_ID)
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.put(
-                "/api/v1/funds",
-                json={
-                    "id": str(FUND_ID),
-                    "name": "Fund",
-                    "vintage_year": 2025,
-                    "target_size_usd": 1000,
-                    "status": "Fundraising",
-                },
-            )
+        resp = await self.client.put(
+            "/api/v1/funds",
+            json={
+                "id": str(FUND_ID),
+                "name": "Fund",
+                "vintage_year": 2025,
+                "target_size_usd": 1000,
+                "status": "Fundraising",
+            },
+        )
 
         assert resp.status_code == 404
 
@@ -202,18 +218,16 @@ class TestFundsEndpoints:
             "Invalid status transition"
         )
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.put(
-                "/api/v1/funds",
-                json={
-                    "id": str(FUND_ID),
-                    "name": "Fund",
-                    "vintage_year": 2025,
-                    "target_size_usd": 1000,
-                    "status": "Fundraising",
-                },
-            )
+        resp = await self.client.put(
+            "/api/v1/funds",
+            json={
+                "id": str(FUND_ID),
+                "name": "Fund",
+                "vintage_year": 2025,
+                "target_size_usd": 1000,
+                "status": "Fundraising",
+            },
+        )
 
         assert resp.status_code == 422
 
@@ -227,9 +241,13 @@ class TestInvestorsEndpoints:
     """Tests for /api/v1/investors endpoints."""
 
     @pytest.fixture(autouse=True)
-    def _setup(self):
-        self.app = _make_test_app()
-        self.mock_service = AsyncMock()
+    def _setup(self, app, client):
+        self.app = app
+        self.client = client
+        self.mock_service = _MOCK_SERVICE
+        yield
+        app.dependency_overrides.clear()
+        _MOCK_SERVICE.reset_mock(return_value=True, side_effect=True)
 
     def _override_service(self):
         from app.api.v1.endpoints.investors import _get_investor_service
@@ -241,9 +259,7 @@ class TestInvestorsEndpoints:
         self._override_service()
         self.mock_service.get_all_investors.return_value = [make_investor()]
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.get("/api/v1/investors")
+        resp = await self.client.get("/api/v1/investors")
 
         assert resp.status_code == 200
         assert len(resp.json()) == 1
@@ -254,16 +270,14 @@ class TestInvestorsEndpoints:
         created = make_investor(name="CalPERS", email="pe@calpers.gov")
         self.mock_service.create_investor.return_value = created
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.post(
-                "/api/v1/investors",
-                json={
-                    "name": "CalPERS",
-                    "investor_type": "Institution",
-                    "email": "pe@calpers.gov",
-                },
-            )
+        resp = await self.client.post(
+            "/api/v1/investors",
+            json={
+                "name": "CalPERS",
+                "investor_type": "Institution",
+                "email": "pe@calpers.gov",
+            },
+        )
 
         assert resp.status_code == 201
         assert resp.json()["name"] == "CalPERS"
@@ -275,16 +289,14 @@ class TestInvestorsEndpoints:
             "An investor with email 'dup@test.com' already exists"
         )
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.post(
-                "/api/v1/investors",
-                json={
-                    "name": "Dup",
-                    "investor_type": "Individual",
-                    "email": "dup@test.com",
-                },
-            )
+        resp = await self.client.post(
+            "/api/v1/investors",
+            json={
+                "name": "Dup",
+                "investor_type": "Individual",
+                "email": "dup@test.com",
+            },
+        )
 
         assert resp.status_code == 409
         assert resp.json()["error"] is True
@@ -293,16 +305,14 @@ class TestInvestorsEndpoints:
     async def test_create_investor_invalid_email_422(self):
         self._override_service()
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.post(
-                "/api/v1/investors",
-                json={
-                    "name": "Test",
-                    "investor_type": "Individual",
-                    "email": "not-email",
-                },
-            )
+        resp = await self.client.post(
+            "/api/v1/investors",
+            json={
+                "name": "Test",
+                "investor_type": "Individual",
+                "email": "not-email",
+            },
+        )
 
         assert resp.status_code == 422
 
@@ -316,9 +326,13 @@ class TestInvestmentsEndpoints:
     """Tests for /api/v1/funds/{fund_id}/investments endpoints."""
 
     @pytest.fixture(autouse=True)
-    def _setup(self):
-        self.app = _make_test_app()
-        self.mock_service = AsyncMock()
+    def _setup(self, app, client):
+        self.app = app
+        self.client = client
+        self.mock_service = _MOCK_SERVICE
+        yield
+        app.dependency_overrides.clear()
+        _MOCK_SERVICE.reset_mock(return_value=True, side_effect=True)
 
     def _override_service(self):
         from app.api.v1.endpoints.investments import _get_investment_service
@@ -330,9 +344,7 @@ class TestInvestmentsEndpoints:
         self._override_service()
         self.mock_service.get_investments_by_fund.return_value = [make_investment()]
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.get(f"/api/v1/funds/{FUND_ID}/investments")
+        resp = await self.client.get(f"/api/v1/funds/{FUND_ID}/investments")
 
         assert resp.status_code == 200
         assert len(resp.json()) == 1
@@ -342,9 +354,7 @@ class TestInvestmentsEndpoints:
         self._override_service()
         self.mock_service.get_investments_by_fund.side_effect = NotFoundException("Fund", FUND_ID)
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.get(f"/api/v1/funds/{FUND_ID}/investments")
+        resp = await self.client.get(f"/api/v1/funds/{FUND_ID}/investments")
 
         assert resp.status_code == 404
 
@@ -354,16 +364,14 @@ class TestInvestmentsEndpoints:
         created = make_investment()
         self.mock_service.create_investment.return_value = created
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.post(
-                f"/api/v1/funds/{FUND_ID}/investments",
-                json={
-                    "investor_id": str(INVESTOR_ID),
-                    "amount_usd": 50000000,
-                    "investment_date": "2025-06-15",
-                },
-            )
+        resp = await self.client.post(
+            f"/api/v1/funds/{FUND_ID}/investments",
+            json={
+                "investor_id": str(INVESTOR_ID),
+                "amount_usd": 50000000,
+                "investment_date": "2025-06-15",
+            },
+        )
 
         assert resp.status_code == 201
 
@@ -372,16 +380,14 @@ class TestInvestmentsEndpoints:
         self._override_service()
         self.mock_service.create_investment.side_effect = NotFoundException("Fund", FUND_ID)
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.post(
-                f"/api/v1/funds/{FUND_ID}/investments",
-                json={
-                    "investor_id": str(INVESTOR_ID),
-                    "amount_usd": 50000000,
-                    "investment_date": "2025-06-15",
-                },
-            )
+        resp = await self.client.post(
+            f"/api/v1/funds/{FUND_ID}/investments",
+            json={
+                "investor_id": str(INVESTOR_ID),
+                "amount_usd": 50000000,
+                "investment_date": "2025-06-15",
+            },
+        )
 
         assert resp.status_code == 404
 
@@ -390,16 +396,49 @@ class TestInvestmentsEndpoints:
         self._override_service()
         self.mock_service.create_investment.side_effect = BusinessRuleViolation("Fund is closed")
 
-        transport = ASGITransport(app=self.app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.post(
-                f"/api/v1/funds/{FUND_ID}/investments",
-                json={
-                    "investor_id": str(INVESTOR_ID),
-                    "amount_usd": 50000000,
-                    "investment_date": "2025-06-15",
-                },
-            )
+        resp = await self.client.post(
+            f"/api/v1/funds/{FUND_ID}/investments",
+            json={
+                "investor_id": str(INVESTOR_ID),
+                "amount_usd": 50000000,
+                "investment_date": "2025-06-15",
+            },
+        )
 
         assert resp.status_code == 422
         assert resp.json()["error"] is True
+
+    @pytest.mark.asyncio
+    async def test_create_investments_bulk_201(self):
+        self._override_service()
+        self.mock_service.create_investments_bulk.return_value = [
+            make_investment(),
+            make_investment(id=INVESTMENT_ID_2),
+        ]
+        item = {
+            "investor_id": str(INVESTOR_ID),
+            "amount_usd": 50000000,
+            "investment_date": "2025-06-15",
+        }
+
+        resp = await self.client.post(
+            f"/api/v1/funds/{FUND_ID}/investments/bulk",
+            json={"investments": [item, item]},
+        )
+
+        assert resp.status_code == 201
+        assert len(resp.json()) == 2
+        fund_id, items = self.mock_service.create_investments_bulk.await_args.args
+        assert fund_id == FUND_ID
+        assert len(items) == 2
+
+    @pytest.mark.asyncio
+    async def test_create_investments_bulk_empty_422(self):
+        self._override_service()
+
+        resp = await self.client.post(
+            f"/api/v1/funds/{FUND_ID}/investments/bulk", json={"investments": []}
+        )
+
+        assert resp.status_code == 422
+        self.mock_service.create_investments_bulk.assert_not_awaited()
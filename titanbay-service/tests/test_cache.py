@@ -13,7 +13,14 @@ Tests cover:
 
 import time
 
-from app.core.cache import CacheEntry, TTLCache
+from app.core.cache import NOT_FOUND, CacheEntry, TTLCache
+
+
+def _backdate(entry: CacheEntry, seconds: float) -> None:
+    """Simulate *seconds* passing for *entry* (both timestamps move together)."""
+    entry.created_at -= seconds
+    entry.expires_at -= seconds
+
 
 # ────────────────────────────────────────────────────────────────────────────
 # CacheEntry tests
@@ -24,24 +31,25 @@ class TestCacheEntry:
     """Tests for the CacheEntry data class."""
 
     def test_entry_stores_value(self):
-        entry = CacheEntry("hello")
+        entry = CacheEntry("hello", ttl=10.0)
         assert entry.value == "hello"
 
     def test_entry_not_expired_immediately(self):
-        entry = CacheEntry("hello")
-        assert not entry.is_expired(ttl=10.0)
+        entry = CacheEntry("hello", ttl=10.0)
+        assert not entry.is_expired(time.monotonic())
 
     def test_entry_expires_after_ttl(self):
-        entry = CacheEntry("hello")
-        # Simulate passage of time by backdating created_at
-        entry.created_at = time.monotonic() - 15.0
-        assert entry.is_expired(ttl=10.0)
+        entry = CacheEntry("hello", ttl=10.0)
+        assert entry.is_expired(entry.created_at + 15.0)
 
     def test_entry_not_expired_at_boundary(self):
-        entry = CacheEntry("hello")
+        entry = CacheEntry("hello", ttl=10.0)
         # Just under TTL — should NOT be expired
-        entry.created_at = time.monotonic() - 9.9
-        assert not entry.is_expired(ttl=10.0)
+        assert not entry.is_expired(entry.created_at + 9.9)
+
+    def test_expires_at_is_absolute_deadline(self):
+        entry = CacheEntry("hello", ttl=10.0)
+        assert entry.expires_at == entry.created_at + 10.0
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -64,6 +72,16 @@ class TestTTLCacheBasic:
         test_cache.set("k", "new")
         assert test_cache.get("k") == "new"
 
+    def test_overwrite_renews_entry_in_place(self, test_cache: TTLCache):
+        test_cache.set("k", "old")
+        entry = test_cache._store["k"]
+        _backdate(entry, 5.0)
+        test_cache.set("k", "new", ttl=60.0)
+        assert test_cache._store["k"] is entry
+        assert entry.value == "new"
+        assert entry.expires_at == entry.created_at + 60.0
+        assert test_cache.get_with_age("k")[1] < 1.0
+
     def test_stores_various_types(self, test_cache: TTLCache):
         """Cache should store any type: lists, dicts, integers, etc."""
         test_cache.set("list", [1, 2, 3])
@@ -73,6 +91,14 @@ class TestTTLCacheBasic:
         assert test_cache.get("dict") == {"a": 1}
         assert test_cache.get("int") == 42
 
+    def test_get_with_age_reports_entry_age(self, test_cache: TTLCache):
+        test_cache.set("k", "v")
+        _backdate(test_cache._store["k"], 5.0)
+        value, age = test_cache.get_with_age("k")
+        assert value == "v"
+        assert 5.0 <= age < 6.0
+        assert test_cache.get_with_age("missing") is None
+
     def test_none_value_is_distinguishable_from_miss(self, test_cache: TTLCache):
         """
         Storing None should NOT be confused with a cache miss.
@@ -91,16 +117,25 @@ class TestTTLCacheExpiration:
         cache = TTLCache(ttl=0.01, max_size=100, enabled=True)
         cache.set("k", "v")
         # Manually expire the entry
-        cache._store["k"].created_at = time.monotonic() - 1.0
+        _backdate(cache._store["k"], 1.0)
         assert cache.get("k") is None
 
     def test_expired_entry_is_removed_from_store(self):
         cache = TTLCache(ttl=0.01, max_size=100, enabled=True)
         cache.set("k", "v")
-        cache._store["k"].created_at = time.monotonic() - 1.0
+        _backdate(cache._store["k"], 1.0)
         cache.get("k")  # triggers removal
         assert "k" not in cache._store
 
+    def test_per_entry_ttl_overrides_default(self):
+        cache = TTLCache(ttl=60.0, max_size=100, enabled=True)
+        cache.set("short", NOT_FOUND, ttl=5.0)
+        cache.set("long", "v")
+        _backdate(cache._store["short"], 10.0)
+        _backdate(cache._store["long"], 10.0)
+        assert cache.get("short") is None
+        assert cache.get("long") == "v"
+
 
 class TestTTLCacheEviction:
     """Tests for FIFO eviction when max_size is exceeded."""
@@ -136,6 +171,17 @@ class TestTTLCacheEviction:
         assert cache.get("second") == 2
         assert cache.get("third") == 3
 
+    def test_eviction_after_invalidate_skips_removed_keys(self):
+        cache = TTLCache(ttl=30.0, max_size=2, enabled=True)
+        cache.set("funds:a", 1)
+        cache.set("investors:b", 2)
+        cache.invalidate("funds:")
+        cache.set("funds:c", 3)  # room left: nothing evicted
+        cache.set("funds:d", 4)  # evicts "investors:b", the oldest live key
+        assert cache.get("investors:b") is None
+        assert cache.get("funds:c") == 3
+        assert cache.get("funds:d") == 4
+
 
 class TestTTLCacheInvalidation:
     """Tests for prefix-based invalidation."""
@@ -163,6 +209,48 @@ class TestTTLCacheInvalidation:
         assert removed == 2
         assert test_cache.get("other:c") == 3
 
+    def test_invalidate_sub_namespace_prefix(self, test_cache: TTLCache):
+        test_cache.set("funds:list:0:100", [])
+        test_cache.set("funds:abc-123", "fund")
+        removed = test_cache.invalidate("funds:list:")
+        assert removed == 1
+        assert test_cache.get("funds:abc-123") == "fund"
+
+    def test_invalidate_sub_namespace_prefix_ignores_other_namespaces(self, test_cache: TTLCache):
+        test_cache.set("funds:list:0:100", [])
+        test_cache.set("investors:list:0:100", [])
+        assert test_cache.invalidate("investors:list:") == 1
+        assert test_cache.get("funds:list:0:100") == []
+
+    def test_invalidate_prefix_without_namespace(self, test_cache: TTLCache):
+        test_cache.set("funds:a", 1)
+        test_cache.set("fundless", 2)
+        test_cache.set("investors:b", 3)
+        assert test_cache.invalidate("fund") == 2
+        assert test_cache.get("investors:b") == 3
+
+    def test_invalidate_overlapping_prefixes_counts_once(self, test_cache: TTLCache):
+        test_cache.set("funds:list:0:100", [])
+        assert test_cache.invalidate("funds:", "funds:list:") == 1
+
+    def test_invalidate_namespace(self, test_cache: TTLCache):
+        test_cache.set("funds:list:0:100", [])
+        test_cache.set("funds:abc-123", "fund")
+        test_cache.set("investors:list:0:100", [])
+        assert test_cache.invalidate_namespace("funds:") == 2
+        assert test_cache.get("funds:abc-123") is None
+        assert test_cache.get("investors:list:0:100") == []
+        assert test_cache._namespaces == {"investors:": {"investors:list:0:100"}}
+        assert test_cache.invalidate_namespace("funds:") == 0
+
+    def test_namespace_index_tracks_evictions(self):
+        small = TTLCache(ttl=60, max_size=1)
+        small.set("funds:a", 1)
+        small.set("investors:b", 2)  # evicts funds:a
+        assert small._namespaces == {"investors:": {"investors:b"}}
+        assert small.invalidate("investors:") == 1
+        assert small._namespaces == {}
+
     def test_clear_removes_all_entries(self, test_cache: TTLCache):
         test_cache.set("a", 1)
         test_cache.set("b", 2)
@@ -170,12 +258,27 @@ class TestTTLCacheInvalidation:
         assert test_cache.get("a") is None
         assert test_cache.get("b") is None
 
+    def test_reset_drops_entries_and_index(self, test_cache: TTLCache):
+        test_cache.set("funds:a", 1)
+        test_cache.reset()
+        assert test_cache.get("funds:a") is None
+        assert test_cache._namespaces == {}
+        assert test_cache.invalidate("funds:") == 0
+
+    def test_reset_zeroes_stats(self, test_cache: TTLCache):
+        test_cache.set("k", "v")
+        test_cache.get("k")
+        test_cache.get("missing")
+        test_cache.reset()
+        stats = test_cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["hit_rate"]) == (0, 0, "N/A")
+
 
 class TestTTLCacheDisabled:
     """Tests for disabled cache mode."""
 
     def test_get_returns_none(self, disabled_cache: TTLCache):
-        disabled_cache._store["k"] = CacheEntry("v")  # force internal state
+        disabled_cache._store["k"] = CacheEntry("v", ttl=30.0)  # force internal state
         assert disabled_cache.get("k") is None
 
     def test_set_is_noop(self, disabled_cache: TTLCache):
@@ -185,6 +288,18 @@ class TestTTLCacheDisabled:
     def test_invalidate_returns_zero(self, disabled_cache: TTLCache):
         assert disabled_cache.invalidate("any_prefix") == 0
 
+    def test_invalidate_namespace_returns_zero(self, disabled_cache: TTLCache):
+        assert disabled_cache.invalidate_namespace("funds:") == 0
+
+    def test_get_with_age_returns_none(self, disabled_cache: TTLCache):
+        disabled_cache._store["k"] = CacheEntry("v", ttl=30.0)  # force internal state
+        assert disabled_cache.get_with_age("k") is None
+
+    def test_is_a_ttl_cache_reporting_disabled(self, disabled_cache: TTLCache):
+        assert isinstance(disabled_cache, TTLCache)
+        assert type(disabled_cache) is not TTLCache
+        assert disabled_cache.get_stats()["enabled"] is False
+
 
 class TestTTLCacheStats:
     """Tests for cache statistics reporting."""
@@ -213,3 +328,14 @@ class TestTTLCacheStats:
         test_cache.get("k")
         stats = test_cache.get_stats()
         assert stats["hit_rate"] == "100.0%"
+
+    def test_hit_rate_rounds_to_tenths(self, test_cache: TTLCache):
+        test_cache.set("k", "v")
+        test_cache.get("k")
+        test_cache.get("missing")
+        test_cache.get("missing")
+        assert test_cache.get_stats()["hit_rate"] == "33.3%"
+        test_cache.get("k")
+        test_cache.get("k")
+        test_cache.get("k")
+        assert test_cache.get_stats()["hit_rate"] == "66.7%"
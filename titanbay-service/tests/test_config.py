@@ -2,7 +2,7 @@
 Unit tests for the application configuration (Settings).
 
 Tests cover:
-- Default values
+- Default values, shared get_settings() instance
 - DATABASE_URL property for SQLite mode
 - PostgreSQL credential validation
 """
@@ -40,6 +40,11 @@ class TestSettingsDefaults:
         assert settings.CB_FAILURE_THRESHOLD > 0
         assert settings.CB_RECOVERY_TIMEOUT > 0
 
+    def test_get_settings_returns_shared_instance(self):
+        from app.core.config import get_settings, settings
+
+        assert get_settings() is settings
+
 
 class TestDatabaseURL:
     """Tests for the DATABASE_URL property."""
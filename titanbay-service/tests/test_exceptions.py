@@ -4,15 +4,18 @@ Unit tests for domain exceptions and exception handler registration.
 Tests cover:
 - AppException, NotFoundException, ConflictException, BusinessRuleViolation
 - Default attributes (status_code, message)
+- ErrorJSONResponse: byte-identical to JSONResponse
 - add_exception_handlers registration
 """
 
 import pytest
+from fastapi.responses import JSONResponse
 
 from app.core.exceptions import (
     AppException,
     BusinessRuleViolation,
     ConflictException,
+    ErrorJSONResponse,
     NotFoundException,
 )
 
@@ -76,6 +79,14 @@ class TestBusinessRuleViolation:
         assert exc.message == "Invalid transition"
 
 
+class TestErrorJSONResponse:
+    """Tests for the pydantic-core-rendered error response."""
+
+    def test_renders_same_bytes_as_json_response(self):
+        content = {"error": True, "message": "Fund 'Ünïcode — I' is closed", "details": [1.5]}
+        assert ErrorJSONResponse(content).body == JSONResponse(content).body
+
+
 class TestAddExceptionHandlers:
     """Tests that add_exception_handlers registers handlers on the FastAPI app."""
 
@@ -85,13 +96,11 @@ class TestAddExceptionHandlers:
         from app.core.exceptions import add_exception_handlers
 
         mock_app = MagicMock()
-        # exception_handler is used as a decorator, so we need it to return
-        # a callable that accepts the handler function
-        mock_app.exception_handler = MagicMock(return_value=lambda fn: fn)
         add_exception_handlers(mock_app)
-        # Should have been called 5 times (AppException, CircuitBreakerError,
-        # StarletteHTTPException, RequestValidationError, Exception)
-        assert mock_app.exception_handler.call_count == 5
+        # One direct registration each for AppException, CircuitBreakerError,
+        # StarletteHTTPException, RequestValidationError and Exception
+        assert mock_app.add_exception_handler.call_count == 5
+        mock_app.exception_handler.assert_not_called()
 
 
 class TestExceptionHandlersIntegration:
@@ -10,31 +10,56 @@ All repository calls are mocked.  Tests cover:
 """
 
 from decimal import Decimal
-from unittest.mock import AsyncMock
-from uuid import uuid4
 
 import pytest
-from sqlalchemy.exc import IntegrityError
 
 from app.core.cache import cache
 from app.core.exceptions import BusinessRuleViolation, NotFoundException
 from app.models.fund import FundStatus
+from app.repositories.fund_repo import FundRepository
 from app.schemas.fund import FundCreate, FundUpdate
 from app.services.fund_service import FundService, _validate_status_transition
 
-from .conftest import FUND_ID, make_fund
+from .conftest import (
+    FUND_ID,
+    FUND_ID_2,
+    INTEGRITY_ERROR_INSERT,
+    INTEGRITY_ERROR_UPDATE,
+    SENTINEL_FUND,
+    make_fund,
+    make_repo_mock,
+    reset_repo_mock,
+)
+
+pytestmark = pytest.mark.uses_cache
+
+# Canonical inputs, validated once at import.  The service only reads them, so
+# tests share the instances; variants come from ``model_copy(update=...)``.
+_FUND_CREATE = FundCreate(name="Fund", vintage_year=2025, target_size_usd=Decimal("1000"))
+_FUND_UPDATE = FundUpdate(
+    id=FUND_ID,
+    name="Fund",
+    vintage_year=2025,
+    target_size_usd=Decimal("1000"),
+    status=FundStatus.FUNDRAISING,
+)
 
 # ────────────────────────────────────────────────────────────────────────────
 # Fixtures
 # ────────────────────────────────────────────────────────────────────────────
 
 
+@pytest.fixture(scope="module")
+def _fund_repo_mock():
+    """One mocked FundRepository per module — ``fund_repo`` resets it after each test."""
+    return make_repo_mock(FundRepository)
+
+
 @pytest.fixture()
-def fund_repo():
-    """Mocked FundRepository."""
-    repo = AsyncMock()
-    repo.db = AsyncMock()
-    return repo
+def fund_repo(_fund_repo_mock):
+    """Mocked FundRepository, with calls, return values and side effects cleared afterwards."""
+    yield _fund_repo_mock
+    reset_repo_mock(_fund_repo_mock)
 
 
 @pytest.fixture()
@@ -53,7 +78,7 @@ class TestGetAllFunds:
 
     @pytest.mark.asyncio
     async def test_returns_funds_on_cache_miss(self, fund_service, fund_repo):
-        funds = [make_fund(), make_fund(id=uuid4(), name="Fund 2")]
+        funds = [SENTINEL_FUND, make_fund(id=FUND_ID_2, name="Fund 2")]
         fund_repo.get_all.return_value = funds
 
         result = await fund_service.get_all_funds()
@@ -63,7 +88,7 @@ class TestGetAllFunds:
 
     @pytest.mark.asyncio
     async def test_returns_cached_on_hit(self, fund_service, fund_repo):
-        cached_funds = [make_fund()]
+        cached_funds = [SENTINEL_FUND]
         cache.set("funds:list:0:100", cached_funds)
 
         result = await fund_service.get_all_funds()
@@ -90,7 +115,7 @@ class TestGetFund:
 
     @pytest.mark.asyncio
     async def test_returns_fund_when_found(self, fund_service, fund_repo):
-        expected = make_fund()
+        expected = SENTINEL_FUND
         fund_repo.get.return_value = expected
 
         result = await fund_service.get_fund(FUND_ID)
@@ -107,9 +132,31 @@ class TestGetFund:
         assert exc_info.value.status_code == 404
         assert "Fund" in exc_info.value.message
 
+    @pytest.mark.asyncio
+    async def test_not_found_is_negatively_cached(self, fund_service, fund_repo):
+        fund_repo.get.return_value = None
+
+        for _ in range(3):
+            with pytest.raises(NotFoundException):
+                await fund_service.get_fund(FUND_ID)
+
+        fund_repo.get.assert_awaited_once_with(FUND_ID)
+
+    @pytest.mark.asyncio
+    async def test_create_clears_negative_entry(self, fund_service, fund_repo):
+        fund_repo.get.return_value = None
+        with pytest.raises(NotFoundException):
+            await fund_service.get_fund(FUND_ID)
+
+        fund_repo.create.return_value = SENTINEL_FUND
+        await fund_service.create_fund(_FUND_CREATE)
+        fund_repo.get.return_value = SENTINEL_FUND
+
+        assert (await fund_service.get_fund(FUND_ID)).id == FUND_ID
+
     @pytest.mark.asyncio
     async def test_returns_cached_fund(self, fund_service, fund_repo):
-        cached_fund = make_fund()
+        cached_fund = SENTINEL_FUND
         cache.set(f"funds:{FUND_ID}", cached_fund)
 
         result = await fund_service.get_fund(FUND_ID)
@@ -128,16 +175,10 @@ class TestCreateFund:
 
     @pytest.mark.asyncio
     async def test_creates_fund_successfully(self, fund_service, fund_repo):
-        fund_in = FundCreate(
-            name="New Fund",
-            vintage_year=2025,
-            target_size_usd=Decimal("100000000"),
-            status=FundStatus.FUNDRAISING,
-        )
-        expected = make_fund(name="New Fund")
+        expected = make_fund(name="Fund")
         fund_repo.create.return_value = expected
 
-        result = await fund_service.create_fund(fund_in)
+        result = await fund_service.create_fund(_FUND_CREATE)
 
         assert result == expected
         fund_repo.create.assert_awaited_once()
@@ -145,32 +186,21 @@ class TestCreateFund:
     @pytest.mark.asyncio
     async def test_invalidates_cache_on_create(self, fund_service, fund_repo):
         # Pre-populate cache
-        cache.set("funds:list:0:100", [make_fund()])
+        cache.set("funds:list:0:100", [SENTINEL_FUND])
 
-        fund_in = FundCreate(
-            name="Fund",
-            vintage_year=2025,
-            target_size_usd=Decimal("1000"),
-        )
-        fund_repo.create.return_value = make_fund()
+        fund_repo.create.return_value = SENTINEL_FUND
 
-        await fund_service.create_fund(fund_in)
+        await fund_service.create_fund(_FUND_CREATE)
 
         # Cache should be invalidated
         assert cache.get("funds:list:0:100") is None
 
     @pytest.mark.asyncio
     async def test_integrity_error_raises_business_rule(self, fund_service, fund_repo):
-        fund_repo.create.side_effect = IntegrityError("INSERT", {}, Exception("constraint"))
-
-        fund_in = FundCreate(
-            name="Fund",
-            vintage_year=2025,
-            target_size_usd=Decimal("1000"),
-        )
+        fund_repo.create.side_effect = INTEGRITY_ERROR_INSERT
 
         with pytest.raises(BusinessRuleViolation) as exc_info:
-            await fund_service.create_fund(fund_in)
+            await fund_service.create_fund(_FUND_CREATE)
         assert exc_info.value.status_code == 422
         fund_repo.db.rollback.assert_awaited_once()
 
@@ -180,6 +210,11 @@ class TestCreateFund:
 # ────────────────────────────────────────────────────────────────────────────
 
 
+def _fund_update(**overrides) -> FundUpdate:
+    """A copy of ``_FUND_UPDATE`` with *overrides* applied (not re-validated)."""
+    return _FUND_UPDATE.model_copy(update=overrides)
+
+
 class TestUpdateFund:
     """Tests for FundService.update_fund."""
 
@@ -192,84 +227,56 @@ class TestUpdateFund:
         )
         fund_repo.update.return_value = updated
 
-        fund_update = FundUpdate(
-            id=FUND_ID,
-            name="Updated",
-            vintage_year=2025,
-            target_size_usd=Decimal("200000000"),
-            status=FundStatus.INVESTING,
+        fund_update = _fund_update(
+            name="Updated", target_size_usd=Decimal("200000000"), status=FundStatus.INVESTING
         )
 
         result = await fund_service.update_fund(fund_update)
         assert result == updated
 
     @pytest.mark.asyncio
-    async def test_not_found_raises_exception(self, fund_service, fund_repo):
-        fund_repo.get.return_value = None
-
-        fund_update = FundUpdate(
-            id=FUND_ID,
-            name="Fund",
-            vintage_year=2025,
-            target_size_usd=Decimal("1000"),
-            status=FundStatus.FUNDRAISING,
-        )
-
-        with pytest.raises(NotFoundException):
-            await fund_service.update_fund(fund_update)
-
-    @pytest.mark.asyncio
-    async def test_invalid_status_transition_raises(self, fund_service, fund_repo):
-        existing = make_fund(status=FundStatus.CLOSED)
-        fund_repo.get.return_value = existing
-
-        fund_update = FundUpdate(
-            id=FUND_ID,
-            name="Fund",
-            vintage_year=2025,
-            target_size_usd=Decimal("1000"),
-            status=FundStatus.FUNDRAISING,  # Closed → Fundraising is invalid
-        )
+    @pytest.mark.parametrize(
+        "existing, requested, update_error, expected, fragment",
+        [
+            (None, FundStatus.FUNDRAISING, None, NotFoundException, "not found"),
+            (
+                FundStatus.CLOSED,
+                FundStatus.FUNDRAISING,
+                None,
+                BusinessRuleViolation,
+                "Invalid status transition",
+            ),
+            (
+                FundStatus.FUNDRAISING,
+                FundStatus.FUNDRAISING,
+                INTEGRITY_ERROR_UPDATE,
+                BusinessRuleViolation,
+                "database constraint",
+            ),
+        ],
+        ids=["not-found", "closed-to-fundraising", "integrity-error"],
+    )
+    async def test_update_rejected(
+        self, fund_service, fund_repo, existing, requested, update_error, expected, fragment
+    ):
+        fund_repo.get.return_value = None if existing is None else make_fund(status=existing)
+        fund_repo.update.side_effect = update_error
 
-        with pytest.raises(BusinessRuleViolation, match="Invalid status transition"):
-            await fund_service.update_fund(fund_update)
-
-    @pytest.mark.asyncio
-    async def test_integrity_error_on_update(self, fund_service, fund_repo):
-        existing = make_fund(status=FundStatus.FUNDRAISING)
-        fund_repo.get.return_value = existing
-        fund_repo.update.side_effect = IntegrityError("UPDATE", {}, Exception("constraint"))
-
-        fund_update = FundUpdate(
-            id=FUND_ID,
-            name="Fund",
-            vintage_year=2025,
-            target_size_usd=Decimal("1000"),
-            status=FundStatus.FUNDRAISING,
-        )
-
-        with pytest.raises(BusinessRuleViolation):
-            await fund_service.update_fund(fund_update)
-        fund_repo.db.rollback.assert_awaited_once()
+        with pytest.raises(expected, match=fragment):
+            await fund_service.update_fund(_fund_update(status=requested))
+        # Only a failed write has a transaction to roll back
+        assert fund_repo.db.rollback.await_count == (update_error is not None)
 
     @pytest.mark.asyncio
     async def test_invalidates_cache_on_update(self, fund_service, fund_repo):
-        cache.set("funds:list:0:100", [make_fund()])
-        cache.set(f"funds:{FUND_ID}", make_fund())
+        cache.set("funds:list:0:100", [SENTINEL_FUND])
+        cache.set(f"funds:{FUND_ID}", SENTINEL_FUND)
 
         existing = make_fund(status=FundStatus.FUNDRAISING)
         fund_repo.get.return_value = existing
         fund_repo.update.return_value = existing
 
-        fund_update = FundUpdate(
-            id=FUND_ID,
-            name="Fund",
-            vintage_year=2025,
-            target_size_usd=Decimal("1000"),
-            status=FundStatus.INVESTING,
-        )
-
-        await fund_service.update_fund(fund_update)
+        await fund_service.update_fund(_fund_update(status=FundStatus.INVESTING))
 
         assert cache.get("funds:list:0:100") is None
         assert cache.get(f"funds:{FUND_ID}") is None
@@ -283,33 +290,38 @@ class TestUpdateFund:
 class TestValidateStatusTransition:
     """Tests for the module-level status transition validator."""
 
-    # ── Valid transitions ──
-
-    @pytest.mark.parametrize(
-        "current,requested",
-        [
-            (FundStatus.FUNDRAISING, FundStatus.FUNDRAISING),  # no-op
-            (FundStatus.FUNDRAISING, FundStatus.INVESTING),
-            (FundStatus.FUNDRAISING, FundStatus.CLOSED),
-            (FundStatus.INVESTING, FundStatus.INVESTING),  # no-op
-            (FundStatus.INVESTING, FundStatus.CLOSED),
-            (FundStatus.CLOSED, FundStatus.CLOSED),  # no-op
-        ],
+    _F, _I, _C = FundStatus.FUNDRAISING, FundStatus.INVESTING, FundStatus.CLOSED
+
+    VALID = frozenset(
+        {
+            (_F, _F),  # no-op
+            (_F, _I),
+            (_F, _C),
+            (_I, _I),  # no-op
+            (_I, _C),
+            (_C, _C),  # no-op
+        }
     )
-    def test_valid_transition(self, current, requested):
-        # Should NOT raise
-        _validate_status_transition(current, requested)
-
-    # ── Invalid transitions ──
-
-    @pytest.mark.parametrize(
-        "current,requested",
-        [
-            (FundStatus.INVESTING, FundStatus.FUNDRAISING),  # backwards
-            (FundStatus.CLOSED, FundStatus.FUNDRAISING),  # backwards from terminal
-            (FundStatus.CLOSED, FundStatus.INVESTING),  # backwards from terminal
-        ],
+    INVALID = frozenset(
+        {
+            (_I, _F),  # backwards
+            (_C, _F),  # backwards from terminal
+            (_C, _I),  # backwards from terminal
+        }
     )
-    def test_invalid_transition(self, current, requested):
-        with pytest.raises(BusinessRuleViolation, match="Invalid status transition"):
-            _validate_status_transition(current, requested)
+
+    def test_status_transitions(self):
+        # The two sets partition the full current × requested matrix
+        assert self.VALID | self.INVALID == {(a, b) for a in FundStatus for b in FundStatus}
+
+        # One test node for the whole matrix; every failure names its pair
+        # (a wrongly rejected pair through the validator's own message).
+        for current, requested in self.VALID:
+            _validate_status_transition(current, requested)  # should NOT raise
+        for current, requested in self.INVALID:
+            try:
+                _validate_status_transition(current, requested)
+            except BusinessRuleViolation as exc:
+                assert "Invalid status transition" in exc.message
+            else:
+                pytest.fail(f"{current.value} → {requested.value} was accepted")
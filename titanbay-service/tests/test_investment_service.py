@@ -2,47 +2,79 @@
 Unit tests for InvestmentService — business logic layer.
 
 All repository calls are mocked.  Tests cover:
-- get_investments_by_fund: found fund, not found fund, cached
-- create_investment: success, fund not found, fund closed,
-  investor not found, IntegrityError (TOCTOU race)
+- get_investments_by_fund: found fund, empty page existence check, not found fund, cached
+- create_investment: single conditional insert, diagnosed rejections (fund not
+  found, fund closed, investor not found, concurrent change), IntegrityError,
+  shared fund cache
+- create_investments_bulk: batched validation and insert, all-or-nothing
 """
 
 from datetime import date
 from decimal import Decimal
-from unittest.mock import AsyncMock
-from uuid import uuid4
 
 import pytest
-from sqlalchemy.exc import IntegrityError
 
 from app.core.cache import cache
 from app.core.exceptions import BusinessRuleViolation, NotFoundException
 from app.models.fund import FundStatus
+from app.repositories.fund_repo import FundRepository
+from app.repositories.investment_repo import InvestmentRepository
+from app.repositories.investor_repo import InvestorRepository
 from app.schemas.investment import InvestmentCreate
 from app.services.investment_service import InvestmentService
 
-from .conftest import FUND_ID, INVESTOR_ID, make_fund, make_investment, make_investor
+from .conftest import (
+    FUND_ID,
+    INTEGRITY_ERROR_INSERT,
+    INVESTMENT_ID_2,
+    INVESTOR_ID,
+    INVESTOR_ID_2,
+    SENTINEL_FUND,
+    make_fund,
+    make_investment,
+    make_repo_mock,
+    reset_repo_mock,
+)
+
+pytestmark = pytest.mark.uses_cache
+
+# Canonical input, validated once at import.  The service only reads it, so
+# tests share the instance; bulk batches are ``model_copy`` variants.
+_INVESTMENT_CREATE = InvestmentCreate(
+    investor_id=INVESTOR_ID,
+    amount_usd=Decimal("50000000"),
+    investment_date=date(2025, 6, 15),
+)
 
 # ────────────────────────────────────────────────────────────────────────────
 # Fixtures
 # ────────────────────────────────────────────────────────────────────────────
 
 
+@pytest.fixture(scope="module")
+def _repo_mocks():
+    """One mock per repository for the module; the fixtures below reset them after each test."""
+    return tuple(
+        make_repo_mock(spec) for spec in (InvestmentRepository, FundRepository, InvestorRepository)
+    )
+
+
 @pytest.fixture()
-def invest_repo():
-    repo = AsyncMock()
-    repo.db = AsyncMock()
-    return repo
+def invest_repo(_repo_mocks):
+    yield _repo_mocks[0]
+    reset_repo_mock(_repo_mocks[0])
 
 
 @pytest.fixture()
-def fund_repo():
-    return AsyncMock()
+def fund_repo(_repo_mocks):
+    yield _repo_mocks[1]
+    reset_repo_mock(_repo_mocks[1])
 
 
 @pytest.fixture()
-def investor_repo():
-    return AsyncMock()
+def investor_repo(_repo_mocks):
+    yield _repo_mocks[2]
+    reset_repo_mock(_repo_mocks[2])
 
 
 @pytest.fixture()
@@ -60,18 +92,27 @@ class TestGetInvestmentsByFund:
 
     @pytest.mark.asyncio
     async def test_returns_investments_when_fund_exists(self, service, fund_repo, invest_repo):
-        fund_repo.get.return_value = make_fund()
-        investments = [make_investment(), make_investment(id=uuid4())]
+        investments = [make_investment(), make_investment(id=INVESTMENT_ID_2)]
         invest_repo.get_by_fund.return_value = investments
 
         result = await service.get_investments_by_fund(FUND_ID)
 
         assert len(result) == 2
-        fund_repo.get.assert_awaited_once_with(FUND_ID)
+        # A non-empty page proves the fund exists — no extra query
+        fund_repo.exists.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_empty_page_checks_fund_exists(self, service, fund_repo, invest_repo):
+        invest_repo.get_by_fund.return_value = []
+        fund_repo.exists.return_value = True
+
+        assert await service.get_investments_by_fund(FUND_ID) == []
+        fund_repo.exists.assert_awaited_once_with(FUND_ID)
 
     @pytest.mark.asyncio
-    async def test_raises_not_found_when_fund_missing(self, service, fund_repo):
-        fund_repo.get.return_value = None
+    async def test_raises_not_found_when_fund_missing(self, service, fund_repo, invest_repo):
+        invest_repo.get_by_fund.return_value = []
+        fund_repo.exists.return_value = False
 
         with pytest.raises(NotFoundException) as exc_info:
             await service.get_investments_by_fund(FUND_ID)
@@ -80,19 +121,18 @@ class TestGetInvestmentsByFund:
 
     @pytest.mark.asyncio
     async def test_returns_cached_investments(self, service, fund_repo, invest_repo):
-        fund_repo.get.return_value = make_fund()
         cached = [make_investment()]
         cache.set(f"investments:{FUND_ID}:0:100", cached)
 
         result = await service.get_investments_by_fund(FUND_ID)
 
         invest_repo.get_by_fund.assert_not_awaited()
+        fund_repo.exists.assert_not_awaited()
         assert result == cached
 
     @pytest.mark.asyncio
     async def test_passes_pagination(self, service, fund_repo, invest_repo):
-        fund_repo.get.return_value = make_fund()
-        invest_repo.get_by_fund.return_value = []
+        invest_repo.get_by_fund.return_value = [make_investment()]
 
         await service.get_investments_by_fund(FUND_ID, skip=5, limit=10)
 
@@ -107,89 +147,172 @@ class TestGetInvestmentsByFund:
 class TestCreateInvestment:
     """Tests for InvestmentService.create_investment."""
 
-    def _make_input(self) -> InvestmentCreate:
-        return InvestmentCreate(
-            investor_id=INVESTOR_ID,
-            amount_usd=Decimal("50000000"),
-            investment_date=date(2025, 6, 15),
-        )
-
     @pytest.mark.asyncio
-    async def test_creates_investment_successfully(
-        self, service, fund_repo, investor_repo, invest_repo
-    ):
-        fund_repo.get.return_value = make_fund(status=FundStatus.FUNDRAISING)
-        investor_repo.get.return_value = make_investor()
+    async def test_creates_investment_in_one_statement(self, service, fund_repo, invest_repo):
         expected = make_investment()
-        invest_repo.create.return_value = expected
+        invest_repo.create_if_valid.return_value = expected
 
-        result = await service.create_investment(FUND_ID, self._make_input())
+        result = await service.create_investment(FUND_ID, _INVESTMENT_CREATE)
 
         assert result == expected
-        invest_repo.create.assert_awaited_once()
+        invest_repo.create_if_valid.assert_awaited_once()
+        built = invest_repo.create_if_valid.await_args.args[0]
+        assert (built.fund_id, built.investor_id) == (FUND_ID, INVESTOR_ID)
+        fund_repo.get_fund_and_investor.assert_not_awaited()
+        invest_repo.create.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_fund_not_found_raises_404(self, service, fund_repo):
-        fund_repo.get.return_value = None
+    @pytest.mark.parametrize(
+        "fund, investor_exists, expected, fragment",
+        [
+            (None, False, NotFoundException, "Fund"),
+            (make_fund(status=FundStatus.CLOSED), True, BusinessRuleViolation, "closed"),
+            (SENTINEL_FUND, False, NotFoundException, "Investor"),
+            # The fund reopened between the insert and the diagnostic query
+            (SENTINEL_FUND, True, BusinessRuleViolation, "concurrently"),
+        ],
+        ids=["fund-missing", "fund-closed", "investor-missing", "concurrent-change"],
+    )
+    async def test_refused_insert_is_diagnosed(
+        self, service, fund_repo, invest_repo, fund, investor_exists, expected, fragment
+    ):
+        invest_repo.create_if_valid.return_value = None
+        fund_repo.get_fund_and_investor.return_value = (fund, investor_exists)
 
-        with pytest.raises(NotFoundException) as exc_info:
-            await service.create_investment(FUND_ID, self._make_input())
-        assert exc_info.value.status_code == 404
-        assert "Fund" in exc_info.value.message
+        with pytest.raises(expected, match=fragment):
+            await service.create_investment(FUND_ID, _INVESTMENT_CREATE)
+        fund_repo.get_fund_and_investor.assert_awaited_once_with(FUND_ID, INVESTOR_ID)
 
     @pytest.mark.asyncio
-    async def test_closed_fund_raises_business_rule(self, service, fund_repo):
-        fund_repo.get.return_value = make_fund(status=FundStatus.CLOSED)
+    async def test_integrity_error_raises_business_rule(self, service, invest_repo):
+        invest_repo.create_if_valid.side_effect = INTEGRITY_ERROR_INSERT
 
         with pytest.raises(BusinessRuleViolation) as exc_info:
-            await service.create_investment(FUND_ID, self._make_input())
-        assert "closed" in exc_info.value.message.lower()
+            await service.create_investment(FUND_ID, _INVESTMENT_CREATE)
+        assert exc_info.value.status_code == 422
+        invest_repo.db.rollback.assert_awaited_once()
 
     @pytest.mark.asyncio
-    async def test_investor_not_found_raises_404(self, service, fund_repo, investor_repo):
-        fund_repo.get.return_value = make_fund(status=FundStatus.FUNDRAISING)
-        investor_repo.get.return_value = None
+    async def test_invalidates_cache_on_create(self, service, invest_repo):
+        cache.set(f"investments:{FUND_ID}:0:100", [make_investment()])
+        invest_repo.create_if_valid.return_value = make_investment()
 
-        with pytest.raises(NotFoundException) as exc_info:
-            await service.create_investment(FUND_ID, self._make_input())
-        assert exc_info.value.status_code == 404
-        assert "Investor" in exc_info.value.message
+        await service.create_investment(FUND_ID, _INVESTMENT_CREATE)
+
+        assert cache.get(f"investments:{FUND_ID}:0:100") is None
+
+    @pytest.mark.asyncio
+    async def test_cached_closed_fund_rejected_without_query(self, service, invest_repo):
+        cache.set(f"funds:{FUND_ID}", make_fund(status=FundStatus.CLOSED))
+
+        with pytest.raises(BusinessRuleViolation):
+            await service.create_investment(FUND_ID, _INVESTMENT_CREATE)
+        invest_repo.create_if_valid.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_integrity_error_raises_business_rule(
+    async def test_cached_missing_fund_rejected_without_query(
+        self, service, fund_repo, invest_repo
+    ):
+        invest_repo.create_if_valid.return_value = None
+        fund_repo.get_fund_and_investor.return_value = (None, False)
+        for _ in range(2):
+            with pytest.raises(NotFoundException):
+                await service.create_investment(FUND_ID, _INVESTMENT_CREATE)
+
+        # First call hit the DB and cached the miss; the second did not
+        invest_repo.create_if_valid.assert_awaited_once()
+        fund_repo.get_fund_and_investor.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_rejection_populates_shared_fund_cache(self, service, fund_repo, invest_repo):
+        fund = make_fund(status=FundStatus.CLOSED)
+        invest_repo.create_if_valid.return_value = None
+        fund_repo.get_fund_and_investor.return_value = (fund, True)
+
+        with pytest.raises(BusinessRuleViolation):
+            await service.create_investment(FUND_ID, _INVESTMENT_CREATE)
+
+        assert cache.get(f"funds:{FUND_ID}") is fund
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# create_investments_bulk
+# ────────────────────────────────────────────────────────────────────────────
+
+
+class TestCreateInvestmentsBulk:
+    """Tests for InvestmentService.create_investments_bulk."""
+
+    def _make_inputs(self, *investor_ids) -> list[InvestmentCreate]:
+        return [
+            _INVESTMENT_CREATE.model_copy(update={"investor_id": investor_id})
+            for investor_id in investor_ids
+        ]
+
+    @pytest.mark.asyncio
+    async def test_creates_batch_with_fixed_query_count(
         self, service, fund_repo, investor_repo, invest_repo
     ):
-        fund_repo.get.return_value = make_fund(status=FundStatus.FUNDRAISING)
-        investor_repo.get.return_value = make_investor()
-        invest_repo.create.side_effect = IntegrityError("INSERT", {}, Exception("fk_violation"))
+        fund_repo.get.return_value = SENTINEL_FUND
+        investor_repo.get_many.return_value = {INVESTOR_ID: object(), INVESTOR_ID_2: object()}
+        # The repository returns the rows it inserted, one per input
+        invest_repo.create_many.side_effect = lambda rows: rows
 
-        with pytest.raises(BusinessRuleViolation) as exc_info:
-            await service.create_investment(FUND_ID, self._make_input())
-        assert exc_info.value.status_code == 422
-        invest_repo.db.rollback.assert_awaited_once()
+        result = await service.create_investments_bulk(
+            FUND_ID, self._make_inputs(INVESTOR_ID, INVESTOR_ID_2, INVESTOR_ID)
+        )
+
+        fund_repo.get.assert_awaited_once_with(FUND_ID)
+        investor_repo.get_many.assert_awaited_once()
+        investor_repo.get.assert_not_awaited()
+        (rows,) = invest_repo.create_many.await_args.args
+        assert result is rows
+        assert [r.investor_id for r in rows] == [INVESTOR_ID, INVESTOR_ID_2, INVESTOR_ID]
+        assert all(r.fund_id == FUND_ID for r in rows)
 
     @pytest.mark.asyncio
-    async def test_investing_fund_accepts_investment(
+    async def test_cached_open_fund_skips_fund_query(
         self, service, fund_repo, investor_repo, invest_repo
     ):
-        """Funds in INVESTING status should still accept investments."""
-        fund_repo.get.return_value = make_fund(status=FundStatus.INVESTING)
-        investor_repo.get.return_value = make_investor()
-        invest_repo.create.return_value = make_investment()
+        cache.set(f"funds:{FUND_ID}", SENTINEL_FUND)
+        investor_repo.get_many.return_value = {INVESTOR_ID: object()}
+        invest_repo.create_many.return_value = [make_investment()]
+
+        await service.create_investments_bulk(FUND_ID, self._make_inputs(INVESTOR_ID))
+
+        fund_repo.get.assert_not_awaited()
+        invest_repo.create_many.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_closed_fund_rejects_batch(self, service, fund_repo, invest_repo):
+        fund_repo.get.return_value = make_fund(status=FundStatus.CLOSED)
 
-        result = await service.create_investment(FUND_ID, self._make_input())
-        assert result is not None
+        with pytest.raises(BusinessRuleViolation):
+            await service.create_investments_bulk(FUND_ID, self._make_inputs(INVESTOR_ID))
+        invest_repo.create_many.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_invalidates_cache_on_create(
+    async def test_missing_investor_rejects_batch(
         self, service, fund_repo, investor_repo, invest_repo
     ):
-        cache.set(f"investments:{FUND_ID}:0:100", [make_investment()])
+        fund_repo.get.return_value = SENTINEL_FUND
+        investor_repo.get_many.return_value = {INVESTOR_ID: object()}
 
-        fund_repo.get.return_value = make_fund(status=FundStatus.FUNDRAISING)
-        investor_repo.get.return_value = make_investor()
-        invest_repo.create.return_value = make_investment()
+        with pytest.raises(NotFoundException) as exc_info:
+            await service.create_investments_bulk(
+                FUND_ID, self._make_inputs(INVESTOR_ID, INVESTOR_ID_2)
+            )
+        assert str(INVESTOR_ID_2) in exc_info.value.message
+        invest_repo.create_many.assert_not_awaited()
 
-        await service.create_investment(FUND_ID, self._make_input())
+    @pytest.mark.asyncio
+    async def test_integrity_error_rolls_back(
+        self, service, fund_repo, investor_repo, invest_repo
+    ):
+        fund_repo.get.return_value = SENTINEL_FUND
+        investor_repo.get_many.return_value = {INVESTOR_ID: object()}
+        invest_repo.create_many.side_effect = INTEGRITY_ERROR_INSERT
 
-        assert cache.get(f"investments:{FUND_ID}:0:100") is None
+        with pytest.raises(BusinessRuleViolation):
+            await service.create_investments_bulk(FUND_ID, self._make_inputs(INVESTOR_ID))
+        invest_repo.db.rollback.assert_awaited_once()
@@ -2,35 +2,74 @@
 Unit tests for InvestorService — business logic layer.
 
 All repository calls are mocked.  Tests cover:
-- get_all_investors: cache miss, cache hit, pagination
-- create_investor: success, duplicate email pre-check, TOCTOU race
+- get_all_investors: cache miss (pages cached as response models), cache hit,
+  pagination, stale-while-revalidate
+- create_investor: success, atomic duplicate-email conflict, IntegrityError fallback,
+  non-email constraint violation, known-email fast path
 """
 
-from unittest.mock import AsyncMock
-from uuid import uuid4
+import asyncio
 
 import pytest
-from sqlalchemy.exc import IntegrityError
 
 from app.core.cache import cache
-from app.core.exceptions import ConflictException
+from app.core.config import settings
+from app.core.exceptions import BusinessRuleViolation, ConflictException
 from app.models.investor import InvestorType
-from app.schemas.investor import InvestorCreate
+from app.repositories.investor_repo import InvestorRepository
+from app.schemas.investor import InvestorCreate, InvestorResponse
 from app.services.investor_service import InvestorService
 
-from .conftest import make_investor
+from .conftest import (
+    INTEGRITY_ERROR_INSERT,
+    INVESTOR_ID_2,
+    SENTINEL_INVESTOR,
+    make_investor,
+    make_repo_mock,
+    reset_repo_mock,
+)
+
+pytestmark = pytest.mark.uses_cache
+
+# Canonical input, validated once at import; the service only reads it, and
+# tests that need another email take a ``model_copy`` (no re-validation).
+_INVESTOR_CREATE = InvestorCreate(
+    name="New", investor_type=InvestorType.INDIVIDUAL, email="new@test.com"
+)
+
+# Lifetime the service gives listing entries: fresh for CACHE_TTL, then stale
+_SWR_HARD_TTL = settings.CACHE_TTL + settings.CACHE_STALE_TTL
+
+
+def _make_stale(key):
+    """Age the cached entry at *key* past ``CACHE_TTL`` (still within its hard TTL)."""
+    entry = cache._store[key]
+    entry.created_at -= settings.CACHE_TTL + 1
+    entry.expires_at -= settings.CACHE_TTL + 1
+
+
+def _responses(investors):
+    """The response models ``get_all_investors`` builds from *investors*."""
+    return [InvestorResponse.model_validate(i) for i in investors]
+
 
 # ────────────────────────────────────────────────────────────────────────────
 # Fixtures
 # ────────────────────────────────────────────────────────────────────────────
 
 
+@pytest.fixture(scope="module")
+def _investor_repo_mock():
+    """One mocked InvestorRepository per module — ``investor_repo`` resets it after each test."""
+    return make_repo_mock(InvestorRepository)
+
+
 @pytest.fixture()
-def investor_repo():
-    """Mocked InvestorRepository."""
-    repo = AsyncMock()
-    repo.db = AsyncMock()
-    return repo
+def investor_repo(_investor_repo_mock):
+    """Mocked InvestorRepository, with calls, return values and side effects cleared afterwards."""
+    _investor_repo_mock.supports_atomic_create = True
+    yield _investor_repo_mock
+    reset_repo_mock(_investor_repo_mock)
 
 
 @pytest.fixture()
@@ -49,17 +88,19 @@ class TestGetAllInvestors:
 
     @pytest.mark.asyncio
     async def test_returns_investors_on_cache_miss(self, investor_service, investor_repo):
-        investors = [make_investor(), make_investor(id=uuid4(), email="b@test.com")]
+        investors = [SENTINEL_INVESTOR, make_investor(id=INVESTOR_ID_2, email="b@test.com")]
         investor_repo.get_all.return_value = investors
 
         result = await investor_service.get_all_investors()
 
         investor_repo.get_all.assert_awaited_once_with(skip=0, limit=100)
-        assert len(result) == 2
+        assert result == _responses(investors)
+        assert all(isinstance(r, InvestorResponse) for r in result)
+        assert cache.get("investors:list:0:100") is result
 
     @pytest.mark.asyncio
     async def test_returns_cached_on_hit(self, investor_service, investor_repo):
-        cached = [make_investor()]
+        cached = [SENTINEL_INVESTOR]
         cache.set("investors:list:0:100", cached)
 
         result = await investor_service.get_all_investors()
@@ -73,6 +114,37 @@ class TestGetAllInvestors:
         await investor_service.get_all_investors(skip=5, limit=10)
         investor_repo.get_all.assert_awaited_once_with(skip=5, limit=10)
 
+    @pytest.mark.asyncio
+    async def test_stale_entry_is_reloaded(self, investor_service, investor_repo):
+        fresh = [make_investor(name="Fresh")]
+        investor_repo.get_all.return_value = fresh
+        cache.set("investors:list:0:100", [SENTINEL_INVESTOR], ttl=_SWR_HARD_TTL)
+        _make_stale("investors:list:0:100")
+
+        assert await investor_service.get_all_investors() == _responses(fresh)
+        assert cache.get("investors:list:0:100") == _responses(fresh)
+
+    @pytest.mark.asyncio
+    async def test_concurrent_stale_reads_reload_once(self, investor_service, investor_repo):
+        stale, fresh = [SENTINEL_INVESTOR], [make_investor(name="Fresh")]
+        cache.set("investors:list:0:100", stale, ttl=_SWR_HARD_TTL)
+        _make_stale("investors:list:0:100")
+        release = asyncio.Event()
+
+        async def slow_get_all(**_):
+            await release.wait()
+            return fresh
+
+        investor_repo.get_all.side_effect = slow_get_all
+        reloading = asyncio.create_task(investor_service.get_all_investors())
+        await asyncio.sleep(0)
+
+        # While the first request reloads, others get the stale page at once
+        assert await investor_service.get_all_investors() == stale
+        release.set()
+        assert await reloading == _responses(fresh)
+        investor_repo.get_all.assert_awaited_once()
+
 
 # ────────────────────────────────────────────────────────────────────────────
 # create_investor
@@ -84,55 +156,41 @@ class TestCreateInvestor:
 
     @pytest.mark.asyncio
     async def test_creates_investor_successfully(self, investor_service, investor_repo):
-        investor_repo.get_by_email.return_value = None
         expected = make_investor(name="CalPERS", email="pe@calpers.gov")
-        investor_repo.create.return_value = expected
+        investor_repo.create_if_not_exists.return_value = expected
 
-        investor_in = InvestorCreate(
-            name="CalPERS",
-            investor_type=InvestorType.INSTITUTION,
-            email="pe@calpers.gov",
-        )
+        investor_in = _INVESTOR_CREATE.model_copy(update={"email": "pe@calpers.gov"})
 
         result = await investor_service.create_investor(investor_in)
 
         assert result == expected
-        investor_repo.get_by_email.assert_awaited_once_with("pe@calpers.gov")
-        investor_repo.create.assert_awaited_once()
+        investor_repo.create_if_not_exists.assert_awaited_once()
+        assert investor_repo.create_if_not_exists.await_args.args[0].email == "pe@calpers.gov"
 
     @pytest.mark.asyncio
     async def test_duplicate_email_raises_conflict(self, investor_service, investor_repo):
-        investor_repo.get_by_email.return_value = make_investor()
+        # ON CONFLICT DO NOTHING returned no row
+        investor_repo.create_if_not_exists.return_value = None
 
-        investor_in = InvestorCreate(
-            name="Duplicate",
-            investor_type=InvestorType.INDIVIDUAL,
-            email="test@example.com",
-        )
+        investor_in = _INVESTOR_CREATE.model_copy(update={"email": "test@example.com"})
 
         with pytest.raises(ConflictException) as exc_info:
             await investor_service.create_investor(investor_in)
         assert exc_info.value.status_code == 409
         assert "already exists" in exc_info.value.message
-        investor_repo.create.assert_not_awaited()
+        investor_repo.db.rollback.assert_not_awaited()
 
     @pytest.mark.asyncio
-    async def test_toctou_race_catches_integrity_error(self, investor_service, investor_repo):
+    async def test_integrity_error_fallback_raises_conflict(self, investor_service, investor_repo):
         """
-        Even if get_by_email returns None (pre-check passes), a concurrent
-        insert could cause IntegrityError. The service should catch it and
-        raise ConflictException.
+        On backends without ON CONFLICT the repository falls back to a plain
+        insert, and the unique constraint raises IntegrityError instead.
+        The service should catch it and raise ConflictException.
         """
-        investor_repo.get_by_email.return_value = None
-        investor_repo.create.side_effect = IntegrityError(
-            "INSERT", {}, Exception("unique_violation")
-        )
+        investor_repo.supports_atomic_create = False
+        investor_repo.create_if_not_exists.side_effect = INTEGRITY_ERROR_INSERT
 
-        investor_in = InvestorCreate(
-            name="Race Condition",
-            investor_type=InvestorType.INSTITUTION,
-            email="race@test.com",
-        )
+        investor_in = _INVESTOR_CREATE.model_copy(update={"email": "race@test.com"})
 
         with pytest.raises(ConflictException) as exc_info:
             await investor_service.create_investor(investor_in)
@@ -141,17 +199,59 @@ class TestCreateInvestor:
 
     @pytest.mark.asyncio
     async def test_invalidates_cache_on_create(self, investor_service, investor_repo):
-        cache.set("investors:list:0:100", [make_investor()])
+        cache.set("investors:list:0:100", [SENTINEL_INVESTOR])
 
-        investor_repo.get_by_email.return_value = None
-        investor_repo.create.return_value = make_investor()
+        investor_repo.create_if_not_exists.return_value = SENTINEL_INVESTOR
 
-        investor_in = InvestorCreate(
-            name="New",
-            investor_type=InvestorType.INDIVIDUAL,
-            email="new@test.com",
-        )
+        investor_in = _INVESTOR_CREATE
 
         await investor_service.create_investor(investor_in)
 
         assert cache.get("investors:list:0:100") is None
+
+    @pytest.mark.asyncio
+    async def test_known_duplicate_email_skips_database(self, investor_service, investor_repo):
+        investor_repo.create_if_not_exists.return_value = None
+        investor_in = _INVESTOR_CREATE.model_copy(update={"email": "retry@test.com"})
+
+        for _ in range(3):
+            with pytest.raises(ConflictException):
+                await investor_service.create_investor(investor_in)
+
+        investor_repo.create_if_not_exists.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_created_email_is_remembered(self, investor_service, investor_repo):
+        created = make_investor(email="fresh@test.com")
+        investor_repo.create_if_not_exists.return_value = created
+        investor_in = _INVESTOR_CREATE.model_copy(update={"email": "fresh@test.com"})
+
+        await investor_service.create_investor(investor_in)
+
+        assert cache.get("investors:byemail:fresh@test.com") == created.id
+        with pytest.raises(ConflictException):
+            await investor_service.create_investor(investor_in)
+        investor_repo.create_if_not_exists.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_other_constraint_violation_is_not_a_conflict(
+        self, investor_service, investor_repo
+    ):
+        """With ON CONFLICT, an IntegrityError cannot be a duplicate email."""
+        investor_repo.create_if_not_exists.side_effect = INTEGRITY_ERROR_INSERT
+        investor_in = _INVESTOR_CREATE.model_copy(update={"email": "check@test.com"})
+
+        with pytest.raises(BusinessRuleViolation):
+            await investor_service.create_investor(investor_in)
+        investor_repo.db.rollback.assert_awaited_once()
+        assert cache.get("investors:byemail:check@test.com") is None
+
+    @pytest.mark.asyncio
+    async def test_create_keeps_known_email_entries(self, investor_service, investor_repo):
+        cache.set("investors:byemail:old@test.com", True)
+        investor_repo.create_if_not_exists.return_value = make_investor(email="new@test.com")
+        investor_in = _INVESTOR_CREATE
+
+        await investor_service.create_investor(investor_in)
+
+        assert cache.get("investors:byemail:old@test.com") is True
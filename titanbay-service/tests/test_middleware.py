@@ -1,21 +1,54 @@
 """
 Unit tests for middleware — RequestIDMiddleware and RequestTimingMiddleware.
 
-Uses httpx.AsyncClient against a lightweight FastAPI test app to exercise
-both middleware classes through their full dispatch cycle.
+The unit tests call a middleware's ``dispatch`` directly with a bare Starlette
+``Request`` and a stub ``call_next``, so no app, routing or HTTP client is
+involved.  One smoke test drives both classes through a lightweight FastAPI
+app with a module-shared httpx.AsyncClient to check they are wired together.
 """
 
+import asyncio
+import functools
+import logging
 import uuid
+from types import SimpleNamespace
+from typing import Iterator
 
 import pytest
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
+from starlette.requests import Request
+from starlette.responses import Response
 
 from app.middleware import REQUEST_ID_HEADER, RequestIDMiddleware, RequestTimingMiddleware
 
 
+def _request(headers: dict[str, str] | None = None) -> Request:
+    """A minimal ``GET /test`` request carrying *headers*."""
+    raw = [(k.lower().encode(), v.encode()) for k, v in (headers or {}).items()]
+    return Request({"type": "http", "method": "GET", "path": "/test", "headers": raw})
+
+
+def _freeze_perf_counter(monkeypatch: pytest.MonkeyPatch, *readings: float) -> None:
+    """
+    Make the middleware's ``time.perf_counter()`` return *readings* in order.
+
+    Only ``app.middleware``'s reference to ``time`` is swapped, so pytest and
+    the event loop keep the real clock.
+    """
+    monkeypatch.setattr(
+        "app.middleware.time", SimpleNamespace(perf_counter=iter(readings).__next__)
+    )
+
+
+async def _call_next(request: Request) -> Response:
+    """Stub downstream handler: a plain 200 response."""
+    return Response("ok")
+
+
+@functools.cache
 def _make_test_app() -> FastAPI:
-    """Create a minimal FastAPI app with both middleware classes."""
+    """Create (once) a minimal FastAPI app with both middleware classes."""
     app = FastAPI()
     app.add_middleware(RequestIDMiddleware)
     app.add_middleware(RequestTimingMiddleware)
@@ -27,11 +60,25 @@ def _make_test_app() -> FastAPI:
     return app
 
 
-@pytest.fixture()
-def test_app():
+@pytest.fixture(scope="session")
+def test_app() -> FastAPI:
+    """One test app per session — neither the app nor its middleware hold state."""
     return _make_test_app()
 
 
+@pytest.fixture(scope="module")
+def client(test_app: FastAPI) -> Iterator[AsyncClient]:
+    """
+    A module-scoped client, closed when the module finishes.
+
+    Synchronous (no module-scoped event loop needed); ``ASGITransport`` holds
+    no loop-bound connections, so closing on a fresh loop is safe.
+    """
+    client = AsyncClient(transport=ASGITransport(app=test_app), base_url="http://test")
+    yield client
+    asyncio.run(client.aclose())
+
+
 # ────────────────────────────────────────────────────────────────────────────
 # RequestIDMiddleware tests
 # ────────────────────────────────────────────────────────────────────────────
@@ -41,22 +88,22 @@ class TestRequestIDMiddleware:
     """Tests for X-Request-ID header injection."""
 
     @pytest.mark.asyncio
-    async def test_generates_request_id_when_absent(self, test_app):
-        transport = ASGITransport(app=test_app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.get("/test")
+    async def test_generates_request_id_when_absent(self):
+        request = _request()
+        resp = await RequestIDMiddleware(app=None).dispatch(request, _call_next)
 
         assert REQUEST_ID_HEADER in resp.headers
         # Should be a valid UUID4
         request_id = resp.headers[REQUEST_ID_HEADER]
         uuid.UUID(request_id)  # raises if invalid
+        assert request.state.request_id == request_id
 
     @pytest.mark.asyncio
-    async def test_honours_existing_request_id(self, test_app):
+    async def test_honours_existing_request_id(self):
         custom_id = "my-trace-id-12345"
-        transport = ASGITransport(app=test_app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.get("/test", headers={REQUEST_ID_HEADER: custom_id})
+        resp = await RequestIDMiddleware(app=None).dispatch(
+            _request({REQUEST_ID_HEADER: custom_id}), _call_next
+        )
 
         assert resp.headers[REQUEST_ID_HEADER] == custom_id
 
@@ -70,20 +117,43 @@ class TestRequestTimingMiddleware:
     """Tests for X-Process-Time header injection."""
 
     @pytest.mark.asyncio
-    async def test_adds_process_time_header(self, test_app):
-        transport = ASGITransport(app=test_app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.get("/test")
+    async def test_adds_process_time_header(self):
+        resp = await RequestTimingMiddleware(app=None).dispatch(_request(), _call_next)
 
         assert "X-Process-Time" in resp.headers
         # Should end with "ms"
         assert resp.headers["X-Process-Time"].endswith("ms")
 
     @pytest.mark.asyncio
-    async def test_process_time_is_positive(self, test_app):
-        transport = ASGITransport(app=test_app)
-        async with AsyncClient(transport=transport, base_url="http://test") as client:
-            resp = await client.get("/test")
+    async def test_process_time_is_elapsed_milliseconds(self, monkeypatch):
+        _freeze_perf_counter(monkeypatch, 100.0, 100.01234)
 
-        time_str = resp.headers["X-Process-Time"].replace("ms", "")
-        assert float(time_str) >= 0
+        resp = await RequestTimingMiddleware(app=None).dispatch(_request(), _call_next)
+
+        assert resp.headers["X-Process-Time"] == "12.34ms"
+
+    @pytest.mark.asyncio
+    async def test_slow_request_logs_warning(self, monkeypatch, caplog):
+        _freeze_perf_counter(monkeypatch, 100.0, 100.75)
+
+        with caplog.at_level(logging.WARNING, logger="app.middleware"):
+            await RequestTimingMiddleware(app=None).dispatch(_request(), _call_next)
+
+        assert "750.00ms (SLOW)" in caplog.text
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Full stack
+# ────────────────────────────────────────────────────────────────────────────
+
+
+class TestMiddlewareStack:
+    """Both middleware classes installed on a real app."""
+
+    @pytest.mark.asyncio
+    async def test_response_carries_both_headers(self, client):
+        resp = await client.get("/test")
+
+        assert resp.status_code == 200
+        uuid.UUID(resp.headers[REQUEST_ID_HEADER])
+        assert resp.headers["X-Process-Time"].endswith("ms")
@@ -0,0 +1,74 @@
+"""
+Unit tests for integer-cents money helpers and the model accessors built on them.
+
+Tests cover:
+- usd_to_cents: exact conversion, half-up rounding of sub-cent input
+- cents_to_usd: two-decimal-place Decimal output
+- Fund.target_size_usd / Investment.amount_usd property round-trips
+"""
+
+from decimal import Decimal
+
+import pytest
+
+from app.models.money import cents_to_usd, usd_to_cents
+
+from .conftest import make_fund, make_investment
+
+# ────────────────────────────────────────────────────────────────────────────
+# Conversion helpers
+# ────────────────────────────────────────────────────────────────────────────
+
+
+class TestMoneyConversion:
+    """Tests for usd_to_cents / cents_to_usd."""
+
+    @pytest.mark.parametrize(
+        "amount, cents",
+        [
+            (Decimal("250000000.00"), 25_000_000_000),
+            (Decimal("0.01"), 1),
+            (Decimal("1000"), 100_000),
+            (Decimal("0.005"), 1),  # half-up
+            (Decimal("0.004"), 0),
+        ],
+    )
+    def test_usd_to_cents(self, amount, cents):
+        assert usd_to_cents(amount) == cents
+
+    def test_cents_to_usd_has_two_decimal_places(self):
+        assert str(cents_to_usd(100_000)) == "1000.00"
+        assert cents_to_usd(1) == Decimal("0.01")
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Model accessors
+# ────────────────────────────────────────────────────────────────────────────
+
+
+class TestFundMoneyAccessor:
+    """Tests for Fund.target_size_usd backed by target_size_cents."""
+
+    def test_reads_cents_as_usd(self):
+        fund = make_fund(target_size_usd=Decimal("1234.56"))
+        assert fund.target_size_cents == 123_456
+        assert fund.target_size_usd == Decimal("1234.56")
+
+    def test_setter_stores_cents(self):
+        fund = make_fund()
+        fund.target_size_usd = Decimal("99.99")
+        assert fund.target_size_cents == 9_999
+
+
+class TestInvestmentMoneyAccessor:
+    """Tests for Investment.amount_usd backed by amount_cents."""
+
+    def test_reads_cents_as_usd(self):
+        investment = make_investment(amount_usd=Decimal("75000000.50"))
+        assert investment.amount_cents == 7_500_000_050
+        assert investment.amount_usd == Decimal("75000000.50")
+
+    def test_setter_stores_cents(self):
+        investment = make_investment()
+        investment.amount_usd = Decimal("0.01")
+        assert investment.amount_cents == 1
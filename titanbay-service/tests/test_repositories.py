@@ -0,0 +1,318 @@
+"""
+Unit tests for the repository layer.
+
+The AsyncSession is mocked (``mock_db`` fixture) except in ``TestRealEngine``,
+which runs on in-memory SQLite (``sqlite_db``).  Tests cover:
+- BaseRepository.get_many: batched IN lookup, empty input short-circuit
+- BaseRepository.exists: boolean EXISTS probe
+- InvestorRepository.create_if_not_exists: ON CONFLICT path, plain-insert fallback
+- FundRepository.get_fund_and_investor: single combined query
+- InvestmentRepository.create_if_valid: conditional INSERT ... SELECT
+- InvestmentRepository.create_many: single multi-row insert
+- The same prebuilt statements against a real in-memory SQLite engine
+"""
+
+from decimal import Decimal
+from unittest.mock import MagicMock
+from uuid import uuid4
+
+import pytest
+import pytest_asyncio
+from sqlalchemy.dialects import postgresql
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import StaticPool
+from sqlmodel import SQLModel
+
+from app.models.fund import Fund, FundStatus
+from app.models.investment import Investment
+from app.models.investor import Investor
+from app.repositories.fund_repo import FundRepository
+from app.repositories.investment_repo import InvestmentRepository
+from app.repositories.investor_repo import InvestorRepository
+
+from .conftest import (
+    FUND_ID,
+    FUND_ID_2,
+    INVESTMENT_ID,
+    INVESTOR_ID,
+    INVESTOR_ID_2,
+    make_fund,
+    make_investment,
+    make_investor,
+)
+
+# ────────────────────────────────────────────────────────────────────────────
+# BaseRepository.get_many
+# ────────────────────────────────────────────────────────────────────────────
+
+
+def _scalars_result(rows):
+    """Build a mock ``Result`` whose ``scalars().all()`` returns *rows*."""
+    result = MagicMock()
+    result.scalars.return_value.all.return_value = rows
+    return result
+
+
+class TestGetMany:
+    """Tests for BaseRepository.get_many."""
+
+    @pytest.mark.asyncio
+    async def test_returns_entities_keyed_by_id(self, mock_db):
+        fund_a, fund_b = make_fund(), make_fund(id=FUND_ID_2, name="Second Fund")
+        mock_db.execute.return_value = _scalars_result([fund_a, fund_b])
+        repo = FundRepository(Fund, mock_db)
+
+        result = await repo.get_many([FUND_ID, FUND_ID_2])
+
+        assert result == {FUND_ID: fund_a, FUND_ID_2: fund_b}
+        mock_db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_duplicate_ids_issue_single_query(self, mock_db):
+        mock_db.execute.return_value = _scalars_result([make_fund()])
+        repo = FundRepository(Fund, mock_db)
+
+        result = await repo.get_many([FUND_ID, FUND_ID, FUND_ID])
+
+        assert list(result) == [FUND_ID]
+        mock_db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_empty_ids_skip_database(self, mock_db):
+        repo = FundRepository(Fund, mock_db)
+
+        assert await repo.get_many([]) == {}
+        mock_db.execute.assert_not_awaited()
+
+
+class TestExists:
+    """Tests for BaseRepository.exists."""
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize("flag", [True, False])
+    async def test_returns_exists_flag(self, mock_db, flag):
+        mock_db.execute.return_value.scalar = MagicMock(return_value=flag)
+        repo = FundRepository(Fund, mock_db)
+
+        assert await repo.exists(FUND_ID) is flag
+        mock_db.get.assert_not_awaited()
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# InvestorRepository.create_if_not_exists
+# ────────────────────────────────────────────────────────────────────────────
+
+
+def _bind_dialect(mock_db, name):
+    """Make ``mock_db.get_bind().dialect.name`` report *name*."""
+    mock_db.get_bind = MagicMock()
+    mock_db.get_bind.return_value.dialect.name = name
+
+
+class TestCreateIfNotExists:
+    """Tests for InvestorRepository.create_if_not_exists."""
+
+    @pytest.mark.asyncio
+    async def test_inserts_with_on_conflict_do_nothing(self, mock_db):
+        _bind_dialect(mock_db, "postgresql")
+        investor = make_investor()
+        mock_db.execute.return_value.scalar_one_or_none = MagicMock(return_value=investor)
+        repo = InvestorRepository(Investor, mock_db)
+
+        result = await repo.create_if_not_exists(investor)
+
+        assert result is investor
+        stmt = mock_db.execute.await_args.args[0]
+        assert "ON CONFLICT (email) DO NOTHING" in str(stmt.compile(dialect=postgresql.dialect()))
+        mock_db.commit.assert_awaited_once()
+        mock_db.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_returns_none_on_conflict(self, mock_db):
+        _bind_dialect(mock_db, "sqlite")
+        mock_db.execute.return_value.scalar_one_or_none = MagicMock(return_value=None)
+        repo = InvestorRepository(Investor, mock_db)
+
+        assert await repo.create_if_not_exists(make_investor()) is None
+
+    @pytest.mark.parametrize("dialect, atomic", [("postgresql", True), ("mysql", False)])
+    def test_supports_atomic_create(self, mock_db, dialect, atomic):
+        _bind_dialect(mock_db, dialect)
+        assert InvestorRepository(Investor, mock_db).supports_atomic_create is atomic
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_plain_insert(self, mock_db):
+        _bind_dialect(mock_db, "mysql")
+        investor = make_investor()
+        repo = InvestorRepository(Investor, mock_db)
+
+        result = await repo.create_if_not_exists(investor)
+
+        assert result is investor
+        mock_db.add.assert_called_once_with(investor)
+        mock_db.execute.assert_not_awaited()
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# FundRepository.get_fund_and_investor
+# ────────────────────────────────────────────────────────────────────────────
+
+
+class TestGetFundAndInvestor:
+    """Tests for FundRepository.get_fund_and_investor."""
+
+    @pytest.mark.asyncio
+    async def test_returns_fund_and_investor_flag_in_one_query(self, mock_db):
+        fund = make_fund()
+        mock_db.execute.return_value.first = MagicMock(return_value=(fund, 1))
+        repo = FundRepository(Fund, mock_db)
+
+        assert await repo.get_fund_and_investor(FUND_ID, INVESTOR_ID) == (fund, True)
+        mock_db.execute.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_missing_fund_returns_none(self, mock_db):
+        mock_db.execute.return_value.first = MagicMock(return_value=None)
+        repo = FundRepository(Fund, mock_db)
+
+        assert await repo.get_fund_and_investor(FUND_ID, INVESTOR_ID) == (None, False)
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# InvestmentRepository.create_if_valid
+# ────────────────────────────────────────────────────────────────────────────
+
+
+class TestCreateIfValid:
+    """Tests for InvestmentRepository.create_if_valid."""
+
+    @pytest.mark.asyncio
+    async def test_preconditions_are_part_of_the_insert(self, mock_db):
+        investment = make_investment()
+        mock_db.execute.return_value.scalar_one_or_none = MagicMock(return_value=investment)
+        repo = InvestmentRepository(Investment, mock_db)
+
+        assert await repo.create_if_valid(investment) is investment
+
+        sql = str(mock_db.execute.await_args.args[0].compile(dialect=postgresql.dialect()))
+        assert sql.startswith("INSERT INTO investments")
+        assert "funds.status != " in sql
+        assert "FROM investors" in sql
+        assert "RETURNING" in sql
+        mock_db.commit.assert_awaited_once()
+        mock_db.add.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_returns_none_when_refused(self, mock_db):
+        mock_db.execute.return_value.scalar_one_or_none = MagicMock(return_value=None)
+        repo = InvestmentRepository(Investment, mock_db)
+
+        assert await repo.create_if_valid(make_investment()) is None
+
+    @pytest.mark.asyncio
+    async def test_reuses_prebuilt_statement(self, mock_db):
+        mock_db.execute.return_value.scalar_one_or_none = MagicMock(return_value=None)
+        repo = InvestmentRepository(Investment, mock_db)
+
+        await repo.create_if_valid(make_investment())
+        await repo.create_if_valid(make_investment(id=uuid4()))
+
+        first, second = (c.args for c in mock_db.execute.await_args_list)
+        assert first[0] is second[0]
+        assert first[1]["id"] != second[1]["id"]
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# InvestmentRepository.create_many
+# ────────────────────────────────────────────────────────────────────────────
+
+
+class TestCreateMany:
+    """Tests for InvestmentRepository.create_many."""
+
+    @pytest.mark.asyncio
+    async def test_single_execute_with_all_rows(self, mock_db):
+        investments = [make_investment(), make_investment(id=uuid4())]
+        mock_db.execute.return_value = _scalars_result(investments)
+        repo = InvestmentRepository(Investment, mock_db)
+
+        result = await repo.create_many(investments)
+
+        assert result == investments
+        stmt, rows = mock_db.execute.await_args.args
+        assert "RETURNING" in str(stmt.compile(dialect=postgresql.dialect()))
+        assert [row["id"] for row in rows] == [inv.id for inv in investments]
+        mock_db.commit.assert_awaited_once()
+
+
+# ────────────────────────────────────────────────────────────────────────────
+# Real engine: the prebuilt statements against in-memory SQLite
+# ────────────────────────────────────────────────────────────────────────────
+
+
+@pytest_asyncio.fixture()
+async def sqlite_db():
+    """A real AsyncSession on a fresh in-memory SQLite database with a fund and investor."""
+    engine = create_async_engine(
+        "sqlite+aiosqlite:///:memory:",
+        connect_args={"check_same_thread": False},
+        poolclass=StaticPool,
+    )
+    async with engine.begin() as conn:
+        await conn.run_sync(SQLModel.metadata.create_all)
+    session = AsyncSession(engine, expire_on_commit=False)
+    session.add_all([make_fund(), make_fund(id=FUND_ID_2, status=FundStatus.CLOSED)])
+    session.add(make_investor())
+    await session.commit()
+    yield session
+    await session.close()
+    await engine.dispose()
+
+
+class TestRealEngine:
+    """The prebuilt insert statements executed by SQLite rather than a mock."""
+
+    @pytest.mark.asyncio
+    async def test_create_if_valid_inserts_into_open_fund(self, sqlite_db):
+        repo = InvestmentRepository(Investment, sqlite_db)
+
+        created = await repo.create_if_valid(make_investment())
+
+        assert isinstance(created, Investment)
+        assert created.amount_usd == Decimal("50000000.00")
+        assert await repo.get(INVESTMENT_ID) is created
+
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "fund_id, investor_id",
+        [(FUND_ID_2, INVESTOR_ID), (uuid4(), INVESTOR_ID), (FUND_ID, INVESTOR_ID_2)],
+        ids=["closed-fund", "missing-fund", "missing-investor"],
+    )
+    async def test_create_if_valid_refuses(self, sqlite_db, fund_id, investor_id):
+        repo = InvestmentRepository(Investment, sqlite_db)
+
+        investment = make_investment(fund_id=fund_id, investor_id=investor_id)
+        assert await repo.create_if_valid(investment) is None
+        assert await repo.get(INVESTMENT_ID) is None
+
+    @pytest.mark.asyncio
+    async def test_create_many_returns_rows_in_order(self, sqlite_db):
+        repo = InvestmentRepository(Investment, sqlite_db)
+        investments = [make_investment(id=uuid4(), amount_usd=Decimal(n)) for n in (3, 1, 2)]
+
+        created = await repo.create_many(investments)
+
+        assert [inv.id for inv in created] == [inv.id for inv in investments]
+        assert [inv.amount_usd for inv in created] == [3, 1, 2]
+
+    @pytest.mark.asyncio
+    async def test_create_if_not_exists_on_conflict(self, sqlite_db):
+        repo = InvestorRepository(Investor, sqlite_db)
+
+        created = await repo.create_if_not_exists(
+            make_investor(id=INVESTOR_ID_2, email="new@x.com")
+        )
+        duplicate = await repo.create_if_not_exists(make_investor(id=uuid4()))
+
+        assert created.id == INVESTOR_ID_2
+        assert duplicate is None
@@ -8,11 +8,12 @@ Tests cover:
 - Success/failure recording
 - CircuitBreakerError attributes
 - get_status() health-check dict
-- retry_with_backoff: retries, exhaustion, non-retryable passthrough
+- retry_with_backoff: retries, exhaustion, non-retryable passthrough, delay cap, jitter bounds
 """
 
-import time
-from unittest.mock import AsyncMock, patch
+import contextlib
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
 
 import pytest
 
@@ -23,6 +24,48 @@ from app.core.resilience import (
     retry_with_backoff,
 )
 
+_BREAKER_DEFAULTS = dict(
+    name="test",
+    failure_threshold=2,
+    recovery_timeout=5.0,
+    expected_exceptions=(ValueError,),
+)
+
+
+def _make_breaker(**overrides) -> CircuitBreaker:
+    """A fresh ``CircuitBreaker`` built from ``_BREAKER_DEFAULTS``; keyword arguments override."""
+    return CircuitBreaker(**{**_BREAKER_DEFAULTS, **overrides})
+
+
+# Plain coroutines for calls no test counts; AsyncMock stays where a test
+# asserts on whether the breaker awaited the function.
+async def _ok():
+    return "ok"
+
+
+async def _fail():
+    raise ValueError("fail")
+
+
+async def _trip(cb: CircuitBreaker) -> None:
+    """Drive *cb* to OPEN with ``failure_threshold`` consecutive failures."""
+    for _ in range(cb.failure_threshold):
+        with pytest.raises(ValueError):
+            await cb.call(_fail)
+
+
+@pytest.fixture()
+def fake_clock() -> list[float]:
+    """A controllable time source: tests advance it with ``fake_clock[0] += seconds``."""
+    return [1000.0]
+
+
+@pytest.fixture()
+def cb(fake_clock) -> CircuitBreaker:
+    """A fresh breaker with the default settings (threshold 2, 5 s recovery) on ``fake_clock``."""
+    return _make_breaker(clock=lambda: fake_clock[0])
+
+
 # ────────────────────────────────────────────────────────────────────────────
 # CircuitBreakerError tests
 # ────────────────────────────────────────────────────────────────────────────
@@ -53,11 +96,8 @@ class TestCircuitBreakerClosed:
 
     @pytest.fixture()
     def cb(self):
-        return CircuitBreaker(
-            name="test",
-            failure_threshold=3,
-            recovery_timeout=1.0,
-            expected_exceptions=(ValueError, ConnectionError),
+        return _make_breaker(
+            failure_threshold=3, expected_exceptions=(ValueError, ConnectionError)
         )
 
     @pytest.mark.asyncio
@@ -73,17 +113,15 @@ class TestCircuitBreakerClosed:
 
     @pytest.mark.asyncio
     async def test_success_increments_counter(self, cb):
-        func = AsyncMock(return_value="ok")
-        await cb.call(func)
+        await cb.call(_ok)
         assert cb._success_count == 1
         assert cb._failure_count == 0
 
     @pytest.mark.asyncio
     async def test_failure_below_threshold_stays_closed(self, cb):
-        func = AsyncMock(side_effect=ValueError("boom"))
         for _ in range(2):  # threshold is 3
             with pytest.raises(ValueError):
-                await cb.call(func)
+                await cb.call(_fail)
         assert cb.state == CircuitState.CLOSED
         assert cb._failure_count == 2
 
@@ -91,41 +129,24 @@ class TestCircuitBreakerClosed:
 class TestCircuitBreakerOpen:
     """Tests for OPEN state behaviour."""
 
-    @pytest.fixture()
-    def cb(self):
-        return CircuitBreaker(
-            name="test",
-            failure_threshold=2,
-            recovery_timeout=5.0,
-            expected_exceptions=(ValueError,),
-        )
-
     @pytest.mark.asyncio
     async def test_opens_after_threshold(self, cb):
-        func = AsyncMock(side_effect=ValueError("fail"))
-        for _ in range(2):
-            with pytest.raises(ValueError):
-                await cb.call(func)
+        await _trip(cb)
         assert cb.state == CircuitState.OPEN
 
     @pytest.mark.asyncio
-    async def test_open_circuit_raises_circuit_breaker_error(self, cb):
-        func = AsyncMock(side_effect=ValueError("fail"))
-        for _ in range(2):
-            with pytest.raises(ValueError):
-                await cb.call(func)
+    async def test_open_circuit_raises_circuit_breaker_error(self, cb, fake_clock):
+        await _trip(cb)
 
+        fake_clock[0] += 2.0
         with pytest.raises(CircuitBreakerError) as exc_info:
-            await cb.call(func)
+            await cb.call(_fail)
         assert exc_info.value.name == "test"
-        assert exc_info.value.retry_after >= 0
+        assert exc_info.value.retry_after == 3.0  # 5 s timeout, 2 s elapsed
 
     @pytest.mark.asyncio
     async def test_open_circuit_does_not_call_function(self, cb):
-        fail_func = AsyncMock(side_effect=ValueError("fail"))
-        for _ in range(2):
-            with pytest.raises(ValueError):
-                await cb.call(fail_func)
+        await _trip(cb)
 
         success_func = AsyncMock(return_value="ok")
         with pytest.raises(CircuitBreakerError):
@@ -136,70 +157,43 @@ class TestCircuitBreakerOpen:
 class TestCircuitBreakerHalfOpen:
     """Tests for HALF_OPEN state and recovery."""
 
-    @pytest.fixture()
-    def cb(self):
-        return CircuitBreaker(
-            name="test",
-            failure_threshold=2,
-            recovery_timeout=0.01,  # very short for testing
-            expected_exceptions=(ValueError,),
-        )
-
     @pytest.mark.asyncio
-    async def test_transitions_to_half_open_after_timeout(self, cb):
-        func = AsyncMock(side_effect=ValueError("fail"))
-        for _ in range(2):
-            with pytest.raises(ValueError):
-                await cb.call(func)
+    async def test_transitions_to_half_open_after_timeout(self, cb, fake_clock):
+        await _trip(cb)
         assert cb._state == CircuitState.OPEN
 
-        # Simulate recovery timeout by backdating the last failure time
-        cb._last_failure_time = time.monotonic() - 1.0
-        assert cb.state == CircuitState.HALF_OPEN
-
-    @pytest.mark.asyncio
-    async def test_successful_probe_closes_circuit(self, cb):
-        fail_func = AsyncMock(side_effect=ValueError("fail"))
-        for _ in range(2):
-            with pytest.raises(ValueError):
-                await cb.call(fail_func)
-
-        cb._last_failure_time = time.monotonic() - 1.0  # trigger half-open
+        fake_clock[0] += 4.9  # still inside the 5 s recovery timeout
+        assert cb.state == CircuitState.OPEN
 
-        success_func = AsyncMock(return_value="recovered")
-        result = await cb.call(success_func)
-        assert result == "recovered"
-        assert cb.state == CircuitState.CLOSED
-        assert cb._failure_count == 0
+        fake_clock[0] += 0.2
+        assert cb.state == CircuitState.HALF_OPEN
 
     @pytest.mark.asyncio
-    async def test_failed_probe_reopens_circuit(self, cb):
-        fail_func = AsyncMock(side_effect=ValueError("fail"))
-        for _ in range(2):
-            with pytest.raises(ValueError):
-                await cb.call(fail_func)
+    @pytest.mark.parametrize(
+        "probe, expected_state, expected_failures",
+        [(_ok, CircuitState.CLOSED, 0), (_fail, CircuitState.OPEN, 3)],
+        ids=["success-closes", "failure-reopens"],
+    )
+    async def test_probe_outcome(self, cb, fake_clock, probe, expected_state, expected_failures):
+        await _trip(cb)
+        fake_clock[0] += 10.0  # trigger half-open
 
-        cb._last_failure_time = time.monotonic() - 1.0  # trigger half-open
-
-        with pytest.raises(ValueError):
-            await cb.call(fail_func)
-        assert cb.state == CircuitState.OPEN
+        with contextlib.suppress(ValueError):
+            await cb.call(probe)
+        assert cb.state == expected_state
+        assert cb._failure_count == expected_failures
 
 
 class TestCircuitBreakerNonExpected:
     """Tests for exceptions NOT in expected_exceptions."""
 
     @pytest.mark.asyncio
-    async def test_unexpected_exception_passes_through(self):
-        cb = CircuitBreaker(
-            name="test",
-            failure_threshold=2,
-            recovery_timeout=5.0,
-            expected_exceptions=(ValueError,),
-        )
-        func = AsyncMock(side_effect=TypeError("not expected"))
+    async def test_unexpected_exception_passes_through(self, cb):
+        async def unexpected():
+            raise TypeError("not expected")
+
         with pytest.raises(TypeError):
-            await cb.call(func)
+            await cb.call(unexpected)
         # Should not affect failure count
         assert cb._failure_count == 0
         assert cb.state == CircuitState.CLOSED
@@ -209,7 +203,7 @@ class TestCircuitBreakerGetStatus:
     """Tests for get_status()."""
 
     def test_status_dict_keys(self):
-        cb = CircuitBreaker(name="db", failure_threshold=5, recovery_timeout=30.0)
+        cb = _make_breaker(name="db", failure_threshold=5, recovery_timeout=30.0)
         status = cb.get_status()
         assert status["name"] == "db"
         assert status["state"] == "closed"
@@ -224,19 +218,42 @@ class TestCircuitBreakerGetStatus:
 # ────────────────────────────────────────────────────────────────────────────
 
 
+# Decorators for the control-flow tests, built once: a configured decorator is
+# stateless, so each test applies it to its own counting coroutine.
+_RETRY_0, _RETRY_2, _RETRY_3 = (
+    retry_with_backoff(
+        max_retries=n, base_delay=0.001, jitter=False, retryable_exceptions=(ConnectionError,)
+    )
+    for n in (0, 2, 3)
+)
+
+
 class TestRetryWithBackoff:
     """Tests for the retry decorator."""
 
+    @pytest.fixture(autouse=True)
+    def sleeps(self, monkeypatch) -> list[float]:
+        """
+        Replace the decorator's ``asyncio.sleep`` with a recorder; return the delays.
+
+        Only ``app.core.resilience``'s reference to ``asyncio`` is swapped, so
+        the event loop and every other module keep the real ``asyncio.sleep``.
+        Backoff timing is orthogonal to the retry control flow under test, so
+        no test waits on the event loop between attempts.
+        """
+        delays: list[float] = []
+
+        async def _record(delay: float) -> None:
+            delays.append(delay)
+
+        monkeypatch.setattr("app.core.resilience.asyncio", SimpleNamespace(sleep=_record))
+        return delays
+
     @pytest.mark.asyncio
     async def test_succeeds_on_first_try(self):
         call_count = 0
 
-        @retry_with_backoff(
-            max_retries=3,
-            base_delay=0.001,
-            jitter=False,
-            retryable_exceptions=(ConnectionError,),
-        )
+        @_RETRY_3
         async def succeed():
             nonlocal call_count
             call_count += 1
@@ -250,12 +267,7 @@ class TestRetryWithBackoff:
     async def test_retries_on_retryable_exception(self):
         call_count = 0
 
-        @retry_with_backoff(
-            max_retries=3,
-            base_delay=0.001,
-            jitter=False,
-            retryable_exceptions=(ConnectionError,),
-        )
+        @_RETRY_3
         async def fail_twice():
             nonlocal call_count
             call_count += 1
@@ -271,12 +283,7 @@ class TestRetryWithBackoff:
     async def test_exhausts_retries_then_raises(self):
         call_count = 0
 
-        @retry_with_backoff(
-            max_retries=2,
-            base_delay=0.001,
-            jitter=False,
-            retryable_exceptions=(ConnectionError,),
-        )
+        @_RETRY_2
         async def always_fail():
             nonlocal call_count
             call_count += 1
@@ -290,12 +297,7 @@ class TestRetryWithBackoff:
     async def test_non_retryable_exception_not_retried(self):
         call_count = 0
 
-        @retry_with_backoff(
-            max_retries=3,
-            base_delay=0.001,
-            jitter=False,
-            retryable_exceptions=(ConnectionError,),
-        )
+        @_RETRY_3
         async def raise_value_error():
             nonlocal call_count
             call_count += 1
@@ -309,12 +311,7 @@ class TestRetryWithBackoff:
     async def test_zero_retries_means_single_attempt(self):
         call_count = 0
 
-        @retry_with_backoff(
-            max_retries=0,
-            base_delay=0.001,
-            jitter=False,
-            retryable_exceptions=(ConnectionError,),
-        )
+        @_RETRY_0
         async def fail():
             nonlocal call_count
             call_count += 1
@@ -325,7 +322,7 @@ class TestRetryWithBackoff:
         assert call_count == 1
 
     @pytest.mark.asyncio
-    async def test_delay_respects_max_delay(self):
+    async def test_delay_respects_max_delay(self, sleeps):
         """Verify the delay doesn't exceed max_delay."""
         call_count = 0
 
@@ -341,11 +338,26 @@ class TestRetryWithBackoff:
             call_count += 1
             raise ConnectionError("fail")
 
-        # Patch asyncio.sleep to capture delays without actually sleeping
-        with patch("app.core.resilience.asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-            with pytest.raises(ConnectionError):
-                await fail()
-            # All delays should be <= max_delay (2.0)
-            for call in mock_sleep.call_args_list:
-                delay = call[0][0]
-                assert delay <= 2.0
+        with pytest.raises(ConnectionError):
+            await fail()
+        # 1, 2, then capped at max_delay (2.0) for the remaining retries
+        assert sleeps == [1.0, 2.0, 2.0, 2.0, 2.0]
+
+    @pytest.mark.asyncio
+    async def test_jitter_adds_up_to_half_of_each_delay(self, sleeps):
+        """Jittered delays stay within [delay, 1.5 × delay] of the capped schedule."""
+
+        @retry_with_backoff(
+            max_retries=5,
+            base_delay=1.0,
+            max_delay=2.0,
+            jitter=True,
+            retryable_exceptions=(ConnectionError,),
+        )
+        async def fail():
+            raise ConnectionError("fail")
+
+        with pytest.raises(ConnectionError):
+            await fail()
+        for delay, capped in zip(sleeps, [1.0, 2.0, 2.0, 2.0, 2.0], strict=True):
+            assert capped <= delay <= capped * 1.5
@@ -6,19 +6,40 @@ Tests cover:
 - InvestorBase / InvestorCreate / InvestorResponse validators
 - InvestmentBase / InvestmentCreate / InvestmentResponse validators
 - Decimal → float serialization
-- Edge cases: blank names, extreme years, far-future dates
+- Edge cases: blank names, extreme years, far-future dates, BIGINT-cents amount limit
 """
 
-from datetime import date, datetime, timedelta, timezone
+from contextlib import contextmanager
+from datetime import date, timedelta
 from decimal import Decimal
-from uuid import uuid4
+from typing import Iterator
 
 import pytest
 from pydantic import ValidationError
 
 from app.models.fund import FundStatus
 from app.models.investor import InvestorType
-from app.schemas.fund import FundCreate, FundResponse, FundUpdate
+from app.models.money import MAX_USD, usd_to_cents
+from app.schemas.fund import (
+    _CURRENT_YEAR,
+    FUND_LIST_ADAPTER,
+    FundCreate,
+    FundResponse,
+    FundUpdate,
+)
+from app.schemas.investment import InvestmentCreate, InvestmentResponse
+from app.schemas.investor import InvestorCreate, InvestorResponse
+
+from .conftest import FIXED_NOW, FUND_ID, INVESTMENT_ID, INVESTOR_ID, make_fund
+
+
+@contextmanager
+def _rejects(field: str) -> Iterator[None]:
+    """Expect the block to raise a ``ValidationError`` reported against *field* alone."""
+    with pytest.raises(ValidationError) as exc_info:
+        yield
+    assert [error["loc"] for error in exc_info.value.errors()] == [(field,)]
+
 
 # ────────────────────────────────────────────────────────────────────────────
 # Fund schema tests
@@ -40,6 +61,15 @@ class TestFundCreate:
         assert fund.target_size_usd == Decimal("250000000.00")
         assert fund.status == FundStatus.FUNDRAISING
 
+    def test_target_size_at_bigint_cents_limit_accepted(self):
+        fund = FundCreate(name="Fund", vintage_year=2024, target_size_usd=MAX_USD)
+        assert usd_to_cents(fund.target_size_usd) == 2**63 - 1
+
+    @pytest.mark.parametrize("amount", [MAX_USD + Decimal("0.01"), Decimal("1E+27")])
+    def test_target_size_beyond_bigint_cents_rejected(self, amount):
+        with _rejects("target_size_usd"):
+            FundCreate(name="Fund", vintage_year=2024, target_size_usd=amount)
+
     def test_default_status_is_fundraising(self):
         fund = FundCreate(name="Fund", vintage_year=2024, target_size_usd=Decimal("1000"))
         assert fund.status == FundStatus.FUNDRAISING
@@ -53,71 +83,66 @@ class TestFundCreate:
         assert fund.name == "Fund ABC"
 
     def test_blank_name_rejected(self):
-        with pytest.raises(ValidationError, match="name"):
+        with _rejects("name"):
             FundCreate(name="   ", vintage_year=2024, target_size_usd=Decimal("1000"))
 
     def test_empty_name_rejected(self):
-        with pytest.raises(ValidationError, match="name"):
+        with _rejects("name"):
             FundCreate(name="", vintage_year=2024, target_size_usd=Decimal("1000"))
 
-    def test_vintage_year_too_low(self):
-        with pytest.raises(ValidationError, match="vintage_year"):
-            FundCreate(name="Fund", vintage_year=1899, target_size_usd=Decimal("1000"))
-
-    def test_vintage_year_too_high(self):
-        far_future = datetime.now().year + 6
-        with pytest.raises(ValidationError, match="vintage_year"):
-            FundCreate(name="Fund", vintage_year=far_future, target_size_usd=Decimal("1000"))
-
-    def test_vintage_year_boundary_low(self):
-        fund = FundCreate(name="Fund", vintage_year=1900, target_size_usd=Decimal("1000"))
-        assert fund.vintage_year == 1900
-
-    def test_vintage_year_boundary_high(self):
-        max_year = datetime.now().year + 5
-        fund = FundCreate(name="Fund", vintage_year=max_year, target_size_usd=Decimal("1000"))
-        assert fund.vintage_year == max_year
-
-    def test_target_size_must_be_positive(self):
-        with pytest.raises(ValidationError, match="target_size_usd"):
-            FundCreate(name="Fund", vintage_year=2024, target_size_usd=Decimal("0"))
-
-    def test_target_size_negative_rejected(self):
-        with pytest.raises(ValidationError, match="target_size_usd"):
-            FundCreate(name="Fund", vintage_year=2024, target_size_usd=Decimal("-100"))
-
-    def test_target_size_small_positive(self):
-        fund = FundCreate(name="Fund", vintage_year=2024, target_size_usd=Decimal("0.01"))
-        assert fund.target_size_usd == Decimal("0.01")
-
-    def test_all_statuses(self):
-        for status in FundStatus:
-            fund = FundCreate(
-                name="Fund",
-                vintage_year=2024,
-                target_size_usd=Decimal("1000"),
-                status=status,
-            )
-            assert fund.status == status
+    @pytest.mark.parametrize(
+        "year, valid",
+        [(1899, False), (1900, True), (_CURRENT_YEAR + 5, True), (_CURRENT_YEAR + 6, False)],
+        ids=["below-min", "min", "max", "above-max"],
+    )
+    def test_vintage_year_bounds(self, year, valid):
+        if valid:
+            fund = FundCreate(name="Fund", vintage_year=year, target_size_usd=Decimal("1000"))
+            assert fund.vintage_year == year
+        else:
+            with _rejects("vintage_year"):
+                FundCreate(name="Fund", vintage_year=year, target_size_usd=Decimal("1000"))
+
+    @pytest.mark.parametrize(
+        "amount, valid",
+        [(Decimal("0"), False), (Decimal("-100"), False), (Decimal("0.01"), True)],
+        ids=["zero", "negative", "one-cent"],
+    )
+    def test_target_size_bounds(self, amount, valid):
+        if valid:
+            fund = FundCreate(name="Fund", vintage_year=2024, target_size_usd=amount)
+            assert fund.target_size_usd == amount
+        else:
+            with _rejects("target_size_usd"):
+                FundCreate(name="Fund", vintage_year=2024, target_size_usd=amount)
+
+    @pytest.mark.parametrize("status", list(FundStatus))
+    def test_all_statuses(self, status):
+        fund = FundCreate(
+            name="Fund",
+            vintage_year=2024,
+            target_size_usd=Decimal("1000"),
+            status=status,
+        )
+        assert fund.status == status
 
 
 class TestFundUpdate:
     """Validation tests for FundUpdate (includes id field)."""
 
     def test_valid_fund_update(self):
-        uid = uuid4()
         fund = FundUpdate(
-            id=uid,
+            id=FUND_ID,
             name="Updated Fund",
             vintage_year=2024,
             target_size_usd=Decimal("500000000"),
             status=FundStatus.INVESTING,
         )
-        assert fund.id == uid
+        assert fund.id == FUND_ID
         assert fund.status == FundStatus.INVESTING
 
     def test_missing_id_rejected(self):
-        with pytest.raises(ValidationError, match="id"):
+        with _rejects("id"):
             FundUpdate(  # type: ignore[call-arg]
                 name="Fund",
                 vintage_year=2024,
@@ -130,14 +155,14 @@ class TestFundResponse:
     """Serialization tests for FundResponse."""
 
     def test_decimal_serialized_as_float(self):
-        uid = uuid4()
-        resp = FundResponse(
-            id=uid,
+        # Only the serializer is under test; model_construct skips validation
+        resp = FundResponse.model_construct(
+            id=FUND_ID,
             name="Fund",
             vintage_year=2024,
             target_size_usd=Decimal("250000000.00"),
             status=FundStatus.FUNDRAISING,
-            created_at=datetime.now(timezone.utc),
+            created_at=FIXED_NOW,
         )
         dumped = resp.model_dump()
         assert isinstance(dumped["target_size_usd"], float)
@@ -145,18 +170,31 @@ class TestFundResponse:
 
     def test_from_attributes_mode(self):
         """FundResponse should work with ORM-style attribute access."""
-        uid = uuid4()
         resp = FundResponse.model_validate(
             {
-                "id": uid,
+                "id": FUND_ID,
                 "name": "Fund",
                 "vintage_year": 2024,
                 "target_size_usd": Decimal("1000"),
                 "status": FundStatus.FUNDRAISING,
-                "created_at": datetime.now(timezone.utc),
+                "created_at": FIXED_NOW,
             }
         )
-        assert resp.id == uid
+        assert resp.id == FUND_ID
+
+    def test_response_is_frozen(self):
+        """Read models are immutable once built from the ORM row."""
+        resp = FundResponse.model_validate(make_fund())
+        with pytest.raises(ValidationError):
+            resp.name = "Renamed"
+
+    def test_list_adapter_dumps_json_numbers(self):
+        """The precompiled list adapter emits the same JSON as FundResponse."""
+        funds = FUND_LIST_ADAPTER.validate_python([make_fund()], from_attributes=True)
+        body = FUND_LIST_ADAPTER.dump_json(funds)
+
+        assert b'"target_size_usd":100000000.0' in body
+        assert b'"status":"Fundraising"' in body
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -168,8 +206,6 @@ class TestInvestorCreate:
     """Validation tests for InvestorCreate schema."""
 
     def test_valid_investor_create(self):
-        from app.schemas.investor import InvestorCreate
-
         inv = InvestorCreate(
             name="Goldman Sachs",
             investor_type=InvestorType.INSTITUTION,
@@ -180,9 +216,7 @@ class TestInvestorCreate:
         assert str(inv.email) == "invest@gs.com"
 
     def test_blank_name_rejected(self):
-        from app.schemas.investor import InvestorCreate
-
-        with pytest.raises(ValidationError, match="name"):
+        with _rejects("name"):
             InvestorCreate(
                 name="   ",
                 investor_type=InvestorType.INDIVIDUAL,
@@ -190,8 +224,6 @@ class TestInvestorCreate:
             )
 
     def test_name_stripped(self):
-        from app.schemas.investor import InvestorCreate
-
         inv = InvestorCreate(
             name="  CalPERS  ",
             investor_type=InvestorType.INSTITUTION,
@@ -200,39 +232,32 @@ class TestInvestorCreate:
         assert inv.name == "CalPERS"
 
     def test_invalid_email_rejected(self):
-        from app.schemas.investor import InvestorCreate
-
-        with pytest.raises(ValidationError, match="email"):
+        with _rejects("email"):
             InvestorCreate(
                 name="Test",
                 investor_type=InvestorType.INDIVIDUAL,
                 email="not-an-email",
             )
 
-    def test_all_investor_types(self):
-        from app.schemas.investor import InvestorCreate
-
-        for itype in InvestorType:
-            inv = InvestorCreate(name="Test", investor_type=itype, email="test@test.com")
-            assert inv.investor_type == itype
+    @pytest.mark.parametrize("itype", list(InvestorType))
+    def test_all_investor_types(self, itype):
+        inv = InvestorCreate(name="Test", investor_type=itype, email="test@test.com")
+        assert inv.investor_type == itype
 
 
 class TestInvestorResponse:
     """Serialization tests for InvestorResponse."""
 
     def test_response_includes_id_and_created_at(self):
-        from app.schemas.investor import InvestorResponse
-
-        uid = uuid4()
         resp = InvestorResponse(
-            id=uid,
+            id=INVESTOR_ID,
             name="Test",
             investor_type=InvestorType.INDIVIDUAL,
             email="test@test.com",
-            created_at=datetime.now(timezone.utc),
+            created_at=FIXED_NOW,
         )
-        assert resp.id == uid
-        assert resp.created_at is not None
+        assert resp.id == INVESTOR_ID
+        assert resp.created_at == FIXED_NOW
 
 
 # ────────────────────────────────────────────────────────────────────────────
@@ -244,64 +269,61 @@ class TestInvestmentCreate:
     """Validation tests for InvestmentCreate schema."""
 
     def test_valid_investment_create(self):
-        from app.schemas.investment import InvestmentCreate
-
         inv = InvestmentCreate(
-            investor_id=uuid4(),
+            investor_id=INVESTOR_ID,
             amount_usd=Decimal("50000000"),
             investment_date=date.today(),
         )
         assert inv.amount_usd == Decimal("50000000")
 
     def test_zero_amount_rejected(self):
-        from app.schemas.investment import InvestmentCreate
-
-        with pytest.raises(ValidationError, match="amount_usd"):
+        with _rejects("amount_usd"):
             InvestmentCreate(
-                investor_id=uuid4(),
+                investor_id=INVESTOR_ID,
                 amount_usd=Decimal("0"),
                 investment_date=date.today(),
             )
 
-    def test_negative_amount_rejected(self):
-        from app.schemas.investment import InvestmentCreate
+    def test_amount_beyond_bigint_cents_rejected(self):
+        InvestmentCreate(investor_id=INVESTOR_ID, amount_usd=MAX_USD, investment_date=date.today())
+        with _rejects("amount_usd"):
+            InvestmentCreate(
+                investor_id=INVESTOR_ID,
+                amount_usd=MAX_USD + Decimal("0.01"),
+                investment_date=date.today(),
+            )
 
-        with pytest.raises(ValidationError, match="amount_usd"):
+    def test_negative_amount_rejected(self):
+        with _rejects("amount_usd"):
             InvestmentCreate(
-                investor_id=uuid4(),
+                investor_id=INVESTOR_ID,
                 amount_usd=Decimal("-10000"),
                 investment_date=date.today(),
             )
 
     def test_far_future_date_rejected(self):
         """Dates more than 1 year in the future are rejected."""
-        from app.schemas.investment import InvestmentCreate
-
         far_future = date.today() + timedelta(days=366)
-        with pytest.raises(ValidationError, match="investment_date"):
+        with _rejects("investment_date"):
             InvestmentCreate(
-                investor_id=uuid4(),
+                investor_id=INVESTOR_ID,
                 amount_usd=Decimal("1000"),
                 investment_date=far_future,
             )
 
     def test_date_within_one_year_accepted(self):
-        from app.schemas.investment import InvestmentCreate
-
         near_future = date.today() + timedelta(days=364)
         inv = InvestmentCreate(
-            investor_id=uuid4(),
+            investor_id=INVESTOR_ID,
             amount_usd=Decimal("1000"),
             investment_date=near_future,
         )
         assert inv.investment_date == near_future
 
     def test_past_date_accepted(self):
-        from app.schemas.investment import InvestmentCreate
-
         past = date(2020, 1, 1)
         inv = InvestmentCreate(
-            investor_id=uuid4(),
+            investor_id=INVESTOR_ID,
             amount_usd=Decimal("1000"),
             investment_date=past,
         )
@@ -312,12 +334,11 @@ class TestInvestmentResponse:
     """Serialization tests for InvestmentResponse."""
 
     def test_decimal_serialized_as_float(self):
-        from app.schemas.investment import InvestmentResponse
-
-        resp = InvestmentResponse(
-            id=uuid4(),
-            fund_id=uuid4(),
-            investor_id=uuid4(),
+        # Only the serializer is under test; model_construct skips validation
+        resp = InvestmentResponse.model_construct(
+            id=INVESTMENT_ID,
+            fund_id=FUND_ID,
+            investor_id=INVESTOR_ID,
             amount_usd=Decimal("75000000.50"),
             investment_date=date.today(),
         )